@@ -0,0 +1,77 @@
+"""
+Import-time regression check for the backend: `import main` must stay cheap and side-effect free.
+
+    cd backend && python -m benchmarks.import_time --budget-ms 1500
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter (best of --repeat runs),
+prints the slowest modules, and exits non-zero when the cumulative time of `main` exceeds the
+budget or when a module that belongs to the warm-up phase is imported eagerly.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# Loaded by warm_up() or the first request, never by importing main
+DEFERRED_MODULES = (
+    "numpy",
+    "uvicorn",
+    "algorithm_engine",
+    "services.sorting_service",
+    "services.graph_service",
+    "services.large_sorting_service",
+    "services.grid_service",
+    "services.dp_service",
+)
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure():
+    """One fresh `import main`: {module: (self_us, cumulative_us)} for every module it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND, capture_output=True, text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import main failed:\n{result.stderr[-2000:]}")
+    modules = {}
+    for match in LINE.finditer(result.stderr):
+        modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_MS", 1500)))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda modules: modules["main"][1])
+    total_ms = best["main"][1] / 1000
+
+    print(f"import main: {total_ms:.1f} ms cumulative (budget {args.budget_ms:.0f} ms, best of {len(runs)})")
+    print(f"{'self ms':>10}  module")
+    for name, (self_us, _) in sorted(best.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"{self_us / 1000:>10.1f}  {name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import main took {total_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+    eager = [name for name in DEFERRED_MODULES if name in best]
+    if eager:
+        failures.append(f"imported at import time instead of during warm-up: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Speedup of the engine's task-parallel merge and quick sort per thread count.
+
+    cd backend && python -m benchmarks.parallel_sorting --sizes 1000000 10000000 --repeat 3
+
+Thread counts default to powers of two up to PARALLEL_SORT_MAX_THREADS (the CPU count);
+speedup and efficiency are relative to the single-thread run of the same engine sort.
+"""
+import argparse
+import asyncio
+
+from services.large_sorting_service import DEFAULT_PARALLEL_CUTOFF, LargeSortingService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--algorithms", nargs="+", default=["merge", "quick"])
+    parser.add_argument("--threads", type=int, nargs="+", default=None)
+    parser.add_argument("--cutoff", type=int, default=DEFAULT_PARALLEL_CUTOFF)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--distribution", default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = LargeSortingService()
+    for n in args.sizes:
+        array = service.generate(n, args.distribution, args.seed)
+        for algorithm in args.algorithms:
+            result = asyncio.run(service.execute_parallel(
+                algorithm, array, args.threads, args.cutoff, args.repeat, events=0))
+            print(f"\n{algorithm} sort, n={n:,} ({args.distribution}), cutoff {result['cutoff']}, "
+                  f"{result['cpu_count']} CPUs, best of {result['repeat']}")
+            print(f"{'threads':>8}{'used':>6}{'ms':>10}{'speedup':>9}{'efficiency':>12}{'sorted':>8}")
+            for row in result["scaling"]:
+                print(f"{row['threads']:>8}{row['threads_used']:>6}{row['elapsed_ms']:>10.1f}"
+                      f"{row['speedup']:>9.2f}{row['efficiency']:>12.2f}{str(row['sorted']):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Per-edge cost of turning a /api/graph request body into what the graph service runs on.
+
+    cd backend && python -m benchmarks.request_adaptation --edges 10000 100000 --repeat 5
+
+"before" is the old path: BaseModel per node and edge, three classes defined inside the
+handler, a copy of every node and edge into them, and a JSON dump of the whole request as
+the cache key. "after" validates into the shared slotted dataclasses and keys the cache
+on a digest of the edge columns.
+"""
+import argparse
+import json
+import time
+from typing import List, Optional
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from models.api_models import GraphRequest
+from utils.shared_store import cache_key
+
+
+class LegacyNode(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    id: int
+    label: Optional[str] = ""
+    x: Optional[float] = 0.0
+    y: Optional[float] = 0.0
+
+
+class LegacyEdge(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    from_node: int
+    to: int
+    weight: Optional[float] = 1.0
+    directed: Optional[bool] = False
+
+
+class LegacyRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    nodes: List[LegacyNode]
+    edges: List[LegacyEdge]
+    start_node: Optional[int] = 0
+    end_node: Optional[int] = None
+    targets: Optional[List[int]] = None
+
+
+def legacy_adapt(body):
+    request = LegacyRequest.model_validate(body)
+
+    class SimpleNode:
+        def __init__(self, id, label="", x=0.0, y=0.0):
+            self.id = id
+            self.label = label
+            self.x = x
+            self.y = y
+
+    class SimpleEdge:
+        def __init__(self, from_node, to, weight=1.0, directed=False):
+            self.from_node = from_node
+            self.to = to
+            self.weight = weight
+            self.directed = directed
+
+    class SimpleRequest:
+        def __init__(self, nodes, edges, start_node=None, end_node=None, targets=None):
+            self.nodes = nodes
+            self.edges = edges
+            self.start_node = start_node
+            self.end_node = end_node
+            self.targets = targets
+
+    nodes = [SimpleNode(n.id, n.label or "", n.x or 0.0, n.y or 0.0) for n in request.nodes]
+    edges = [SimpleEdge(e.from_node, e.to, e.weight or 1.0, e.directed or False) for e in request.edges]
+    adapted = SimpleRequest(nodes, edges, request.start_node, request.end_node, request.targets)
+    return adapted, cache_key("graph:bench", request.model_dump())
+
+
+def adapt(body):
+    request = GraphRequest.model_validate(body)
+    return request, cache_key("graph:bench", request.cache_payload())
+
+
+def random_body(num_edges: int, seed: int):
+    rng = np.random.default_rng(seed)
+    num_nodes = max(2, num_edges // 4)
+    src = rng.integers(0, num_nodes, num_edges).tolist()
+    dst = rng.integers(0, num_nodes, num_edges).tolist()
+    weight = rng.integers(1, 10, num_edges).tolist()
+    # Round-trip through JSON so the bodies hold exactly what FastAPI hands to validation
+    return json.loads(json.dumps({
+        "nodes": [{"id": i, "label": str(i), "x": float(i % 100), "y": float(i // 100)} for i in range(num_nodes)],
+        "edges": [{"from_node": u, "to": v, "weight": w, "directed": False} for u, v, w in zip(src, dst, weight)],
+        "start_node": 0,
+    }))
+
+
+def best_of(fn, body, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn(body)
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--edges", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'edges':>10}{'before ms':>12}{'after ms':>12}{'before µs/edge':>16}{'after µs/edge':>15}{'speedup':>9}")
+    for num_edges in args.edges:
+        body = random_body(num_edges, args.seed)
+        before = best_of(legacy_adapt, body, args.repeat)
+        after = best_of(adapt, body, args.repeat)
+        print(f"{num_edges:>10}{before * 1e3:>12.1f}{after * 1e3:>12.1f}"
+              f"{before * 1e6 / num_edges:>16.2f}{after * 1e6 / num_edges:>15.2f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare how many nodes each shortest-path search visits on a weighted grid.
+
+    cd backend && python -m benchmarks.shortest_path --side 300 --queries 20
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+
+from services.graph_service import GraphService
+from utils.csr import CSRGraph
+
+
+def grid_graph(side: int, seed: int):
+    """4-connected grid with weights >= the unit edge length, so coordinates give an admissible heuristic."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(side * side).reshape(side, side)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    weight = 1.0 + rng.random(src.size)
+    return src, dst, weight
+
+
+def last_step(steps):
+    # Drain the generator keeping only the final step, like a client that skips to the end
+    with contextlib.redirect_stdout(io.StringIO()):
+        return deque(steps, maxlen=1)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--side", type=int, default=200, help="grid is side x side nodes")
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--traced-side", type=int, default=40, help="grid size for the step-traced searches (A*)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = GraphService()
+    rng = np.random.default_rng(args.seed)
+
+    src, dst, weight = grid_graph(args.side, args.seed)
+    graph = CSRGraph.from_edges(src, dst, weight, num_nodes=args.side * args.side)
+    totals = {}
+    for _ in range(args.queries):
+        start, end = (int(x) for x in rng.integers(0, graph.num_nodes, 2))
+        for algorithm in ("dijkstra", "bidirectional_dijkstra", "bfs", "bidirectional_bfs"):
+            began = time.perf_counter()
+            result = asyncio.run(service.execute_csr(algorithm, graph, start, end))
+            entry = totals.setdefault(algorithm, [0, 0.0])
+            entry[0] += result["visitedCount"]
+            entry[1] += time.perf_counter() - began
+
+    print(f"CSR grid {args.side}x{args.side}, {args.queries} random queries")
+    print(f"{'algorithm':<26}{'avg visited':>14}{'avg ms':>10}")
+    for algorithm, (visited, seconds) in totals.items():
+        print(f"{algorithm:<26}{visited / args.queries:>14.0f}{seconds * 1000 / args.queries:>10.2f}")
+
+    side = args.traced_side
+    src, dst, weight = grid_graph(side, args.seed)
+    request = SimpleNamespace(
+        nodes=[SimpleNamespace(id=i, label="", x=float(i % side), y=float(i // side)) for i in range(side * side)],
+        edges=[SimpleNamespace(from_node=int(u), to=int(v), weight=float(w), directed=False) for u, v, w in zip(src, dst, weight)],
+        start_node=0, end_node=None, targets=None,
+    )
+    totals = {}
+    for _ in range(args.queries):
+        request.start_node, request.end_node = (int(x) for x in rng.integers(0, side * side, 2))
+        for algorithm in ("dijkstra", "bidirectional_dijkstra", "astar"):
+            final = last_step(service.iter_steps(algorithm, request))
+            totals[algorithm] = totals.get(algorithm, 0) + final.get("visitedCount", 0)
+
+    print(f"\nTraced grid {side}x{side}, {args.queries} random queries")
+    print(f"{'algorithm':<26}{'avg visited':>14}")
+    for algorithm, visited in totals.items():
+        print(f"{algorithm:<26}{visited / args.queries:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare how many text characters each string search examines across alphabets and pattern lengths.
+
+    cd backend && python -m benchmarks.string_search --length 200000 --patterns 4 16 64
+
+Patterns are cut from the text, so every search has at least one match. The examined/n column is
+characters compared per text character: about 1 for KMP, well below 1 for Boyer-Moore and Horspool
+once the alphabet and the pattern are large enough to allow long skips. str.find is timed for
+reference; it does not report a character count.
+"""
+import argparse
+import random
+import time
+
+from services.string_service import StringService, find_all
+
+ALPHABETS = {
+    'binary': 'ab',
+    'dna': 'ACGT',
+    'english': 'abcdefghijklmnopqrstuvwxyz',
+    'ascii': ''.join(chr(c) for c in range(32, 127)),
+}
+ALGORITHMS = ('naive', 'kmp', 'horspool', 'boyer_moore')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--length", type=int, default=100_000, help="text length in characters")
+    parser.add_argument("--patterns", type=int, nargs="+", default=[4, 16, 64, 256], help="pattern lengths")
+    parser.add_argument("--alphabets", nargs="+", default=list(ALPHABETS), choices=list(ALPHABETS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = StringService()
+    rng = random.Random(args.seed)
+    print(f"{'alphabet':<9} {'m':>5} {'algorithm':<12} {'examined':>10} {'examined/n':>10} {'ms':>9}")
+    for name in args.alphabets:
+        text = ''.join(rng.choices(ALPHABETS[name], k=args.length))
+        for m in args.patterns:
+            if m > len(text):
+                continue
+            start = rng.randrange(len(text) - m + 1)
+            pattern = text[start:start + m]
+            expected = None
+            for algorithm in ALGORITHMS:
+                began = time.perf_counter()
+                matches, examined = service.characters_examined(algorithm, text, pattern)
+                elapsed = (time.perf_counter() - began) * 1000
+                if expected is not None and matches != expected:
+                    raise SystemExit(f"{algorithm} disagrees with naive search on {name}, m={m}")
+                expected = matches
+                print(f"{name:<9} {m:>5} {algorithm:<12} {examined:>10} {examined / len(text):>10.3f} {elapsed:>9.1f}")
+            began = time.perf_counter()
+            count, _ = find_all(text, pattern)
+            elapsed = (time.perf_counter() - began) * 1000
+            if count != len(expected):
+                raise SystemExit(f"str.find disagrees with naive search on {name}, m={m}")
+            print(f"{name:<9} {m:>5} {'str.find':<12} {'-':>10} {'-':>10} {elapsed:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# Multi-worker production server: gunicorn -c gunicorn.conf.py main:app (run from backend/)
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 8)))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+# Recycle workers periodically so fragmentation from large traces does not accumulate
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = 200
+accesslog = "-"
+
+# Import the app in the master so the engine and services are loaded once and shared copy-on-write
+preload_app = True
+
+
+def on_starting(server):
+    # preload_app has already imported main; warm everything workers would otherwise repeat
+    import asyncio
+    import main
+
+    startup = asyncio.run(main.warm_up())
+    report = main.get_report()
+    server.log.info(
+        "Engine %s; warm-up took %.0f ms before fork (%d workers)",
+        "loaded" if report["available"] else "unavailable, using Python fallbacks",
+        startup["totalMs"],
+        workers,
+    )
@@ -1,14 +1,28 @@
 import os
-from pathlib import Path
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import json
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, ConfigDict
-from typing import List, Optional, Dict, Any
-from services.tutorial_service import TutorialService
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
+from typing import Any, Callable, Dict, List, Optional, Union
+from services.tutorial_service import get_tutorial_store, PrerequisiteCycleError, TUTORIAL_CACHE_MAX_AGE
 from models.tutorial_models import Tutorial
-import uvicorn
+from models.api_models import (
+    ComplexityRequest, DPRequest, GraphEditRequest, GraphRaceRequest, GraphRequest, GridRequest, LargeSortingRequest,
+    ParallelSortingRequest, SortingRaceRequest, SortingRequest, StringRequest, TRACE_MAX_ELEMENTS,
+)
+from utils.engine_health import (
+    run_self_test, get_report, render_metrics, is_strict_mode, strict_mode_error, reset_fallbacks,
+)
+from utils.shared_store import cached_result, describe_store
+from utils.http_cache import conditional_response
+from utils.static_assets import find_frontend_build, get_asset_manifest, serve_asset
+from utils.admission import (
+    ADMISSION_ENABLED, AdmissionRejected, admission, client_id, dp_dimensions, estimate_cost, get_admission_controller,
+)
 
 app = FastAPI(
     title="Algorithm Visualizer API",
@@ -16,35 +30,82 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Tutorial routes
+# Tutorial routes: served from the pre-serialised, indexed catalogue with HTTP validators
 @app.get("/api/tutorials", response_model=List[Tutorial])
 async def get_tutorials(
+    request: Request,
     difficulty: Optional[str] = Query(None, description="Filter tutorials by difficulty level"),
-    category: Optional[str] = Query(None, description="Filter tutorials by category")
+    category: Optional[str] = Query(None, description="Filter tutorials by category"),
+    prerequisite: Optional[str] = Query(None, description="Only tutorials that list this prerequisite"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+):
+    """
+    Get tutorials matching every given filter, optionally paginated. The total number
+    of matches is returned in the X-Total-Count header.
+    """
+    store = get_tutorial_store()
+    body, etag, total = store.render(difficulty, category, prerequisite, offset, limit)
+    return conditional_response(request, body, etag, store.last_modified, TUTORIAL_CACHE_MAX_AGE,
+                                headers={"X-Total-Count": str(total)})
+
+# Declared before /api/tutorials/{tutorial_id} so "search" is not taken for an id
+@app.get("/api/tutorials/search")
+async def search_tutorials(
+    q: str = Query(..., min_length=1, description="Words that must all appear in the tutorial"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
 ):
     """
-    Get all tutorials with optional filtering by difficulty or category.
+    Full-text search over tutorial titles, descriptions, step content and code examples.
+    """
+    return get_tutorial_store().search(q, limit=limit, offset=offset)
+
+@app.get("/api/tutorials/{tutorial_id}/path")
+async def get_learning_path(tutorial_id: str, request: Request):
+    """
+    Ordered learning path to a tutorial: all of its prerequisites (transitively), each listed
+    after the tutorials it depends on, then the tutorial itself.
     """
-    if difficulty:
-        return TutorialService.get_tutorials_by_difficulty(difficulty)
-    elif category:
-        return TutorialService.get_tutorials_by_category(category)
-    return TutorialService.get_all_tutorials()
+    store = get_tutorial_store()
+    try:
+        body, etag = store.render_learning_path(tutorial_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Tutorial not found")
+    except PrerequisiteCycleError as e:
+        raise HTTPException(status_code=409, detail={"error": str(e), "cycle": e.cycle})
+    return conditional_response(request, body, etag, store.last_modified, TUTORIAL_CACHE_MAX_AGE)
 
 @app.get("/api/tutorials/{tutorial_id}", response_model=Tutorial)
-async def get_tutorial(tutorial_id: str):
+async def get_tutorial(tutorial_id: str, request: Request):
     """
     Get a specific tutorial by ID.
     """
-    tutorial = TutorialService.get_tutorial_by_id(tutorial_id)
-    if not tutorial:
+    store = get_tutorial_store()
+    found = store.get_body(tutorial_id)
+    if not found:
         raise HTTPException(status_code=404, detail="Tutorial not found")
-    return tutorial
+    body, etag = found
+    return conditional_response(request, body, etag, store.last_modified, TUTORIAL_CACHE_MAX_AGE)
 
 # Environment detection
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 IS_PRODUCTION = ENVIRONMENT == "production"
 
+# Binary uploads (raw buffers, .npy, Arrow IPC) skip per-element JSON validation
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", 256 * 1024 * 1024))
+# Text files for chunked search are streamed to disk rather than held in memory, so they may be larger
+MAX_TEXT_UPLOAD_BYTES = int(os.getenv("MAX_TEXT_UPLOAD_BYTES", 8 * 1024 * 1024 * 1024))
+
+async def read_binary_body(request: Request) -> bytes:
+    declared = request.headers.get("content-length")
+    if declared and int(declared) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {MAX_UPLOAD_BYTES} bytes")
+    body = await request.body()
+    if len(body) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {MAX_UPLOAD_BYTES} bytes")
+    return body
+
 # Configure CORS
 origins = ["*"] if not IS_PRODUCTION else [
     "https://yourdomain.com",
@@ -57,11 +118,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Total-Count"],
 )
 
 # Lazy import services to avoid import issues
 _sorting_service = None
 _graph_service = None
+_large_sorting_service = None
+_dp_service = None
+_session_manager = None
+_graph_registry = None
+_grid_service = None
+_sssp_trees = None
+_trace_store = None
+_race_service = None
+_complexity_service = None
+_string_service = None
 
 def get_sorting_service():
     global _sorting_service
@@ -91,166 +163,931 @@ def get_graph_service():
                 raise HTTPException(status_code=500, detail=f"Cannot import GraphService: {e}")
     return _graph_service
 
-# Request models with Pydantic v2 config
-class SortingRequest(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
-    array: List[int]
-
-class GraphNodeModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
-    id: int
-    label: Optional[str] = ""
-    x: Optional[float] = 0.0
-    y: Optional[float] = 0.0
-
-class GraphEdgeModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
-    from_node: int
-    to: int
-    weight: Optional[float] = 1.0
-    directed: Optional[bool] = False
-
-class GraphRequest(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
-    nodes: List[GraphNodeModel]
-    edges: List[GraphEdgeModel]
-    start_node: Optional[int] = 0
-    end_node: Optional[int] = None
+def get_large_sorting_service():
+    global _large_sorting_service
+    if _large_sorting_service is None:
+        try:
+            from services.large_sorting_service import LargeSortingService
+            _large_sorting_service = LargeSortingService()
+        except ImportError as e:
+            raise HTTPException(status_code=500, detail=f"Cannot import LargeSortingService: {e}")
+    return _large_sorting_service
+
+def get_dp_service():
+    global _dp_service
+    if _dp_service is None:
+        try:
+            from services.dp_service import DPService
+            _dp_service = DPService()
+        except ImportError as e:
+            raise HTTPException(status_code=500, detail=f"Cannot import DPService: {e}")
+    return _dp_service
+
+def get_grid_service():
+    global _grid_service
+    if _grid_service is None:
+        try:
+            from services.grid_service import GridService
+            _grid_service = GridService()
+        except ImportError as e:
+            raise HTTPException(status_code=500, detail=f"Cannot import GridService: {e}")
+    return _grid_service
+
+def get_race_service():
+    global _race_service
+    if _race_service is None:
+        from services.race_service import RaceService
+        _race_service = RaceService(get_sorting_service(), get_graph_service())
+    return _race_service
+
+def get_complexity_service():
+    global _complexity_service
+    if _complexity_service is None:
+        from services.complexity_service import ComplexityService
+        from services.sorting_service import OperationCounter
+        _complexity_service = ComplexityService(OperationCounter(), get_graph_service(), get_large_sorting_service())
+    return _complexity_service
+
+def get_string_service():
+    global _string_service
+    if _string_service is None:
+        from services.string_service import StringService
+        _string_service = StringService()
+    return _string_service
+
+def get_graph_registry():
+    global _graph_registry
+    if _graph_registry is None:
+        from services.graph_registry import GraphRegistry
+        _graph_registry = GraphRegistry()
+    return _graph_registry
+
+def get_sssp_trees():
+    global _sssp_trees
+    if _sssp_trees is None:
+        from services.dynamic_sssp import SSSPTreeCache
+        _sssp_trees = SSSPTreeCache()
+    return _sssp_trees
+
+def get_trace_store():
+    global _trace_store
+    if _trace_store is None:
+        from services.trace_store import TraceStore
+        _trace_store = TraceStore()
+    return _trace_store
+
+def get_session_manager():
+    global _session_manager
+    if _session_manager is None:
+        from services.session_service import SessionManager
+        _session_manager = SessionManager()
+    return _session_manager
+
+# Warm-up: everything the first request would otherwise pay for, done once before the worker
+# accepts traffic. Under gunicorn with preload_app the master runs it before forking
+# (see gunicorn.conf.py), so workers inherit a warm process and skip it.
+_startup: Dict[str, Any] = {}
+
+async def warm_up() -> Dict[str, Any]:
+    if _startup:
+        return _startup
+    began = time.perf_counter()
+    phases: Dict[str, float] = {}
+
+    def phase(name: str, since: float) -> float:
+        now = time.perf_counter()
+        phases[name] = round((now - since) * 1000, 3)
+        return now
+
+    # Load the C++ engine once and verify it against the Python reference
+    report = run_self_test()
+    t = phase("engine", began)
+    if is_strict_mode():
+        error = strict_mode_error(report)
+        if error:
+            raise RuntimeError(f"ENGINE_STRICT is set: {error}")
+
+    sorting, graph = get_sorting_service(), get_graph_service()
+    large, dp, grid = get_large_sorting_service(), get_dp_service(), get_grid_service()
+    get_session_manager()
+    get_admission_controller()
+    t = phase("services", t)
+
+    # One tiny call down each request path, so module-level caches, NumPy kernels and
+    # the engine bindings are initialised here rather than inside someone's request
+    await sorting.execute_algorithm("merge", [3, 1, 2])
+    await large.execute("merge", large.generate(64, seed=0), frames=2, bins=4)
+    sample = GraphRequest(nodes=[{"id": 0}, {"id": 1}], edges=[{"from_node": 0, "to": 1}])
+    sample.cache_payload()
+    await graph.execute_algorithm("dijkstra", sample)
+    await dp.execute_algorithm("lcs", DPRequest(problem_type="lcs", params={"text1": "ab", "text2": "b"}))
+    from services.grid_service import GridMap
+    import numpy as np
+    await grid.execute("astar", GridMap(2, 2, np.ones(4, dtype=np.uint8)), (0, 0), (1, 1))
+    # Warm-up calls are not traffic; keep them out of /metrics
+    reset_fallbacks()
+    t = phase("first_requests", t)
+
+    # Read and index the tutorial content, and in production the frontend build
+    get_tutorial_store()
+    if IS_PRODUCTION:
+        get_asset_manifest()
+    phase("content", t)
+
+    _startup.update({"warm": True, "pid": os.getpid(), "totalMs": round((time.perf_counter() - began) * 1000, 3),
+                     "phases": phases})
+    return _startup
+
+@app.on_event("startup")
+async def warm_up_worker():
+    startup = await warm_up()
+    report = get_report()
+    if report["available"]:
+        status = "passed" if report["healthy"] else "FAILED"
+        print(f"{'✅' if report['healthy'] else '❌'} C++ engine self-test {status} ({report['path']})")
+    else:
+        print(f"⚠️  C++ engine not available, using Python fallbacks: {report['load_error']}")
+    print(f"🔥 Warm-up done in {startup['totalMs']:.0f} ms (pid {startup['pid']})")
 
 # Health check
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "message": "Algorithm Visualizer API is running"}
+    report = get_report()
+    return {
+        "status": "healthy" if report["healthy"] or not is_strict_mode() else "degraded",
+        "message": "Algorithm Visualizer API is running",
+        "engine": {
+            "available": report["available"],
+            "healthy": report["healthy"],
+            "strict": is_strict_mode(),
+            "path": report["path"],
+            "load_error": report["load_error"],
+            "checks": report["checks"],
+            "fallbacks": report["fallbacks"],
+        },
+        "worker": {"pid": os.getpid()},
+        "shared_store": describe_store(),
+        "admission": get_admission_controller().describe(),
+        "startup": _startup,
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return render_metrics()
+
+def encode_steps(run: Callable[..., List[Dict[str, Any]]], *args) -> str:
+    """
+    Build a trace and encode it as {"steps": [...]}. Both take as long as the trace is big, so
+    handlers run this through asyncio.to_thread inside their admission block.
+    """
+    return json.dumps({"steps": run(*args)}, separators=(",", ":"), allow_nan=False)
+
+def json_body(encoded: Union[str, bytes]) -> Response:
+    return Response(content=encoded, media_type="application/json")
 
 # Sorting endpoints
 @app.post("/api/sorting/{algorithm}")
-async def run_sorting_algorithm(algorithm: str, request: SortingRequest):
+async def run_sorting_algorithm(algorithm: str, request: SortingRequest, http_request: Request):
     try:
         sorting_service = get_sorting_service()
-        result = await sorting_service.execute_algorithm(algorithm, request.array)
-        return result
+
+        # Admission is only paid on a cache miss; cached traces cost nothing to serve
+        async def compute():
+            async with admission(http_request, "sorting", algorithm, n=len(request.array)):
+                return await asyncio.to_thread(encode_steps, sorting_service.run_algorithm, algorithm, request.array)
+
+        return json_body(await cached_result(f"sorting:{algorithm}", request.array, compute))
+    except HTTPException:
+        raise
     except Exception as e:
         return {"error": str(e), "steps": []}
 
+@app.post("/api/sorting/{algorithm}/large")
+async def run_large_sorting_algorithm(algorithm: str, request: LargeSortingRequest, http_request: Request):
+    """
+    Sort 10^5-10^7 elements and return sampled frames (downsampled array
+    profile + inversion count) instead of a full step trace.
+    """
+    try:
+        import numpy as np
+        service = get_large_sorting_service()
+        if request.array is None and request.size is None:
+            raise ValueError("Provide either 'array' or 'size'")
+        n = len(request.array) if request.array is not None else request.size
+        async with admission(http_request, "sorting", algorithm, mode="native", n=n):
+            if request.array is not None:
+                array = np.asarray(request.array, dtype=np.int64)
+            else:
+                array = service.generate(request.size, request.distribution, request.seed)
+            return await service.execute(algorithm, array, request.frames, request.bins, request.seed)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "frames": []}
+
+@app.post("/api/sorting/{algorithm}/parallel")
+async def run_parallel_sorting_algorithm(algorithm: str, request: ParallelSortingRequest, http_request: Request):
+    """
+    Sort with the C++ engine's task-parallel merge or quick sort once per thread count and
+    report the speedup of each, plus the merged per-thread task trace of the widest run.
+    """
+    try:
+        import numpy as np
+        service = get_large_sorting_service()
+        if request.array is None and request.size is None:
+            raise ValueError("Provide either 'array' or 'size'")
+        n = len(request.array) if request.array is not None else request.size
+        runs = len(service.thread_counts(request.threads)) * request.repeat
+        async with admission(http_request, "sorting", algorithm, mode="native", n=n * runs):
+            if request.array is not None:
+                array = np.asarray(request.array, dtype=np.int64)
+            else:
+                array = service.generate(request.size, request.distribution, request.seed)
+            return await service.execute_parallel(algorithm, array, request.threads, request.cutoff,
+                                                  request.repeat, request.events)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "scaling": []}
+
+@app.post("/api/sorting/{algorithm}/binary")
+async def run_binary_sorting_algorithm(
+    algorithm: str,
+    request: Request,
+    dtype: str = Query("int32", description="Element type of a raw body: int32, int64 or float64"),
+    mode: str = Query("large", description="'large' for sampled frames, 'trace' for the full step trace"),
+    frames: int = Query(60),
+    bins: int = Query(256),
+):
+    """
+    Sort a binary array: a raw little-endian buffer or a .npy file, parsed without copying.
+    """
+    try:
+        from utils.binary_io import parse_array
+        array = parse_array(await read_binary_body(request), request.headers.get("content-type", ""), dtype)
+        if mode == "trace" and len(array) > TRACE_MAX_ELEMENTS:
+            raise HTTPException(status_code=413, detail=f"Trace mode takes at most {TRACE_MAX_ELEMENTS} elements; use mode=large")
+        async with admission(request, "sorting", algorithm, mode="trace" if mode == "trace" else "native", n=len(array)):
+            if mode == "trace":
+                return json_body(await asyncio.to_thread(
+                    encode_steps, get_sorting_service().run_algorithm, algorithm, array.tolist()))
+            return await get_large_sorting_service().execute(algorithm, array, frames, bins)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "steps": []}
+
+@app.post("/api/graph/{algorithm}/binary")
+async def run_binary_graph_algorithm(
+    algorithm: str,
+    request: Request,
+    num_nodes: Optional[int] = Query(None, description="Defaults to the largest node id + 1"),
+    directed: bool = Query(False),
+    start_node: int = Query(0),
+    end_node: Optional[int] = Query(None),
+    targets: Optional[List[int]] = Query(None, description="Distances to these nodes only (bfs, dijkstra)"),
+):
+    """
+    Run a graph algorithm on a binary edge list (packed int32/int32/float64 records,
+    .npy or Arrow IPC with from/to/weight columns). Returns distances, parents and
+    visit order as arrays instead of a step trace.
+    """
+    try:
+        from utils.binary_io import parse_edges
+        from utils.csr import CSRGraph
+        src, dst, weight = parse_edges(await read_binary_body(request), request.headers.get("content-type", ""))
+        graph = CSRGraph.from_edges(src, dst, weight, num_nodes=num_nodes, directed=directed)
+        async with admission(request, "graph", algorithm, mode="python", v=graph.num_nodes, e=graph.num_edges):
+            return await get_graph_service().execute_csr(algorithm, graph, start_node, end_node, targets)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e)}
+
 # Graph endpoints
 @app.post("/api/graph/{algorithm}")
-async def run_graph_algorithm(algorithm: str, request: GraphRequest):
+async def run_graph_algorithm(algorithm: str, request: GraphRequest, http_request: Request):
     try:
         graph_service = get_graph_service()
-        
-        # Convert Pydantic models to simple objects
-        class SimpleNode:
-            def __init__(self, id, label="", x=0.0, y=0.0):
-                self.id = id
-                self.label = label
-                self.x = x
-                self.y = y
-        
-        class SimpleEdge:
-            def __init__(self, from_node, to, weight=1.0, directed=False):
-                self.from_node = from_node
-                self.to = to
-                self.weight = weight
-                self.directed = directed
-        
-        class SimpleRequest:
-            def __init__(self, nodes, edges, start_node=None, end_node=None):
-                self.nodes = nodes
-                self.edges = edges
-                self.start_node = start_node
-                self.end_node = end_node
-        
-        # Convert nodes and edges
-        converted_nodes = [
-            SimpleNode(node.id, node.label or "", node.x or 0.0, node.y or 0.0)
-            for node in request.nodes
-        ]
-        
-        converted_edges = [
-            SimpleEdge(edge.from_node, edge.to, edge.weight or 1.0, edge.directed or False)
-            for edge in request.edges
-        ]
-        
-        simple_request = SimpleRequest(
-            nodes=converted_nodes,
-            edges=converted_edges,
-            start_node=request.start_node,
-            end_node=request.end_node
-        )
-        
-        steps = await graph_service.execute_algorithm(algorithm, simple_request)
-        return {"steps": steps}
+
+        # The validated request is passed through as is; its nodes and edges are already slotted dataclasses
+        async def compute():
+            async with admission(http_request, "graph", algorithm, v=len(request.nodes), e=len(request.edges)):
+                return await asyncio.to_thread(encode_steps, graph_service.run_algorithm, algorithm, request)
+
+        return json_body(await cached_result(f"graph:{algorithm}", request.cache_payload(), compute))
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "steps": []}
+
+# Race mode: several algorithms on the same input, merged into frames on a shared operation clock
+@app.post("/api/race/sorting")
+async def race_sorting_algorithms(request: SortingRaceRequest, http_request: Request):
+    try:
+        service = get_race_service()
+        service.validate("sorting", request.algorithms)
+        async with admission(http_request, "sorting", request.algorithms, n=len(request.array)):
+            return await service.race("sorting", request.algorithms, request.array, request.fps, request.duration)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "frames": []}
+
+@app.post("/api/race/graph")
+async def race_graph_algorithms(request: GraphRaceRequest, http_request: Request):
+    try:
+        service = get_race_service()
+        service.validate("graph", request.algorithms)
+        async with admission(http_request, "graph", request.algorithms, v=len(request.nodes), e=len(request.edges)):
+            return await service.race("graph", request.algorithms, request, request.fps, request.duration)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "frames": []}
+
+# Empirical complexity: fit measured operation counts and wall times over a series of input sizes
+@app.post("/api/complexity/{kind}/{algorithm}")
+async def analyze_complexity(kind: str, algorithm: str, request: ComplexityRequest, http_request: Request):
+    try:
+        service = get_complexity_service()
+        service.validate(kind, algorithm, request.shapes or [])
+        claimed = get_sorting_service().claimed_complexity(algorithm) if kind == "sorting" else None
+        async with admission(http_request, kind, algorithm, mode="python", cost_cap=service.cost_cap(),
+                             **service.dimensions(kind, request.max_size)):
+            return await service.analyze(kind, algorithm, request.shapes, request.min_size, request.max_size,
+                                         request.factor, request.repeat, request.seed, claimed)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "shapes": {}}
+
+# Registered graphs: upload once, then run algorithms by id from any worker
+@app.post("/api/graphs")
+async def register_graph(request: GraphRequest):
+    return get_graph_registry().register(request.model_dump(include={"nodes", "edges"}))
+
+@app.get("/api/graphs/{graph_id}")
+async def get_registered_graph(graph_id: str):
+    graph = get_graph_registry().get(graph_id)
+    if graph is None:
+        raise HTTPException(status_code=404, detail="Graph not found")
+    return {"id": graph_id, **graph}
+
+@app.delete("/api/graphs/{graph_id}")
+async def delete_registered_graph(graph_id: str):
+    from services.graph_registry import GraphBusyError
+    registry, trees = get_graph_registry(), get_sssp_trees()
+
+    def delete():
+        with registry.lock(graph_id), trees.lock:
+            trees.discard(graph_id)
+            return registry.delete(graph_id)
+
+    try:
+        deleted = await asyncio.to_thread(delete)
+    except GraphBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Graph not found")
+    return {"id": graph_id, "deleted": True}
+
+@app.patch("/api/graphs/{graph_id}")
+async def edit_registered_graph(graph_id: str, request: GraphEditRequest):
+    """
+    Add/remove edges or change weights, and update the shortest-path tree from start_node
+    incrementally: only nodes whose distance or parent can change are re-traced.
+    """
+    from services.dynamic_sssp import DynamicSSSP
+    from services.graph_registry import GraphBusyError
+    registry, trees = get_graph_registry(), get_sssp_trees()
+    edits = [edit.model_dump() for edit in request.edits]
+
+    def apply():
+        # The store lock keeps other workers' edits out of this read-modify-write; trees.lock this worker's
+        with registry.lock(graph_id), trees.lock:
+            version = registry.version(graph_id)
+            tree = trees.get(graph_id, request.start_node, version)
+            rebuilt = tree is None
+            if rebuilt:
+                graph = registry.get(graph_id)
+                if graph is None:
+                    trees.discard(graph_id)
+                    return None
+                tree = DynamicSSSP(graph, request.start_node)
+            try:
+                result = tree.apply_edits(edits)
+            except Exception:
+                trees.discard(graph_id, request.start_node)
+                raise
+            version = registry.save(graph_id, tree.graph())
+            trees.discard(graph_id)
+            trees.put(graph_id, request.start_node, version, tree)
+        result.update({"id": graph_id, "version": version, "rebuilt": rebuilt})
+        if request.include_tree:
+            result["tree"] = tree.tree()
+        return result
+
+    try:
+        result = await asyncio.to_thread(apply)
+    except GraphBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         return {"error": str(e), "steps": []}
+    if result is None:
+        raise HTTPException(status_code=404, detail="Graph not found")
+    return result
+
+@app.post("/api/graphs/{graph_id}/{algorithm}")
+async def run_registered_graph(
+    graph_id: str,
+    algorithm: str,
+    http_request: Request,
+    start_node: Optional[int] = Query(0),
+    end_node: Optional[int] = Query(None),
+    targets: Optional[List[int]] = Query(None),
+):
+    graph = get_graph_registry().get(graph_id)
+    if graph is None:
+        raise HTTPException(status_code=404, detail="Graph not found")
+    try:
+        graph_request = GraphRequest(**graph, start_node=start_node, end_node=end_node, targets=targets)
+
+        async def compute():
+            async with admission(http_request, "graph", algorithm, v=len(graph_request.nodes), e=len(graph_request.edges)):
+                return await asyncio.to_thread(encode_steps, get_graph_service().run_algorithm, algorithm, graph_request)
+
+        # The version changes on every edit, so results for an older copy of the graph are never reused
+        payload = {"graph": graph_id, "version": get_graph_registry().version(graph_id),
+                   "start": start_node, "end": end_node, "targets": targets}
+        return json_body(await cached_result(f"graph:{algorithm}", payload, compute))
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "steps": []}
+
+# Grid pathfinding on an implicit grid graph (no node/edge lists)
+async def run_grid(algorithm: str, costs, width: int, height: int, start, end, diagonal: bool, pack: bool):
+    from services.grid_service import GridMap
+    from utils.grid_codec import pack_indices
+    grid = GridMap(width, height, costs, diagonal=diagonal)
+    result = await get_grid_service().execute(algorithm, grid, tuple(start), tuple(end))
+    if pack:
+        result["visitedB64"] = pack_indices(result.pop("visited"))
+        result["pathB64"] = pack_indices(result.pop("path"))
+    return result
+
+@app.post("/api/grid/{algorithm}")
+async def run_grid_algorithm(algorithm: str, request: GridRequest, http_request: Request):
+    """
+    Pathfinding on a width x height grid. Walls come as RLE text ("12.3#40.") or a base64
+    packed bitmap, weights as base64 bytes (one per cell, 0 = wall). Cells are flat indices
+    y * width + x; with pack=true visited/path are returned as base64 int32 arrays.
+    """
+    try:
+        from utils.grid_codec import build_costs
+        if len(request.start) != 2 or len(request.end) != 2:
+            raise ValueError("start and end must be [x, y]")
+        costs = build_costs(request.width, request.height, request.walls, request.encoding, request.weights)
+        async with admission(http_request, "grid", algorithm, mode="python", cells=costs.size):
+            return await run_grid(algorithm, costs, request.width, request.height,
+                                  request.start, request.end, request.diagonal, request.pack)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e)}
+
+@app.post("/api/grid/{algorithm}/binary")
+async def run_binary_grid_algorithm(
+    algorithm: str,
+    request: Request,
+    width: int = Query(...),
+    height: int = Query(...),
+    start_x: int = Query(0),
+    start_y: int = Query(0),
+    end_x: int = Query(...),
+    end_y: int = Query(...),
+    diagonal: bool = Query(False),
+    pack: bool = Query(True),
+):
+    """Grid pathfinding on a raw cost map: width * height bytes, 0 = wall, 1-255 = cell cost."""
+    try:
+        from utils.grid_codec import MAX_GRID_CELLS, decode_costs
+        if width < 1 or height < 1 or width * height > MAX_GRID_CELLS:
+            raise ValueError(f"Grid must have between 1 and {MAX_GRID_CELLS} cells")
+        costs = decode_costs(await read_binary_body(request), width * height)
+        async with admission(request, "grid", algorithm, mode="python", cells=costs.size):
+            return await run_grid(algorithm, costs, width, height, (start_x, start_y), (end_x, end_y), diagonal, pack)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e)}
 
-# String algorithms placeholder
 @app.post("/api/string/{algorithm}")
-async def run_string_algorithm(algorithm: str, request: dict):
-    return {"steps": [], "message": "String algorithms coming soon"}
+async def run_string_algorithm(
+    algorithm: str,
+    http_request: Request,
+    request: StringRequest,
+    mode: str = Query("trace", description="'trace' for the step trace, 'result' for match positions only"),
+):
+    """
+    Pattern search. Result mode skips the trace and scans with str.find, so it suits large texts;
+    the named algorithm only matters for traces.
+    """
+    try:
+        service = get_string_service()
+        if algorithm not in service.algorithms:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if mode not in ("trace", "result"):
+            raise ValueError("mode must be 'trace' or 'result'")
+        dims = {"n": len(request.text), "m": len(request.pattern)}
+        async with admission(http_request, "string", algorithm, mode="native" if mode == "result" else "trace", **dims):
+            if mode == "result":
+                return await asyncio.to_thread(service.search, request.text, request.pattern)
+            return json_body(await asyncio.to_thread(encode_steps, service.run_algorithm, algorithm, request))
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "steps": []}
+
+def remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+async def stream_file_search(http_request: Request, path: str, pattern: str, chunk_size: Optional[int],
+                             cleanup=None) -> StreamingResponse:
+    """NDJSON, one line per scanned chunk and a summary line; the admission slot is held until the stream ends."""
+    service = get_string_service()
+    stack = AsyncExitStack()
+    try:
+        await stack.enter_async_context(admission(http_request, "string", "kmp", mode="native",
+                                                  n=os.path.getsize(path), m=len(pattern)))
+        events = service.scan_file(path, pattern, *([chunk_size] if chunk_size else []))
+    except BaseException:
+        await stack.aclose()
+        if cleanup:
+            cleanup()
+        raise
+
+    async def lines():
+        try:
+            while True:
+                event = await asyncio.to_thread(next, events, None)
+                if event is None:
+                    break
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            yield json.dumps({"error": str(e)}) + "\n"
+        finally:
+            events.close()
+            await stack.aclose()
+            if cleanup:
+                cleanup()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
-# DP algorithms placeholder
+@app.post("/api/string/file/search")
+async def search_uploaded_text(
+    request: Request,
+    pattern: str = Query(..., min_length=1),
+    chunk_size: Optional[int] = Query(None, description="Bytes scanned per chunk"),
+):
+    """
+    Search a raw text body without loading it: the upload is streamed to a temporary file, which is
+    scanned through mmap in chunks and removed afterwards. Offsets are byte offsets.
+    """
+    fd, path = tempfile.mkstemp(prefix="text-search-", suffix=".tmp")
+    try:
+        written = 0
+        with os.fdopen(fd, "wb") as f:
+            async for chunk in request.stream():
+                written += len(chunk)
+                if written > MAX_TEXT_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail=f"Body exceeds {MAX_TEXT_UPLOAD_BYTES} bytes")
+                f.write(chunk)
+        return await stream_file_search(request, path, pattern, chunk_size, cleanup=lambda: remove_quietly(path))
+    except HTTPException:
+        remove_quietly(path)
+        raise
+    except Exception as e:
+        remove_quietly(path)
+        return {"error": str(e)}
+
+@app.get("/api/string/file/search")
+async def search_server_text(
+    request: Request,
+    name: str = Query(..., description="File name relative to STRING_FILE_DIR"),
+    pattern: str = Query(..., min_length=1),
+    chunk_size: Optional[int] = Query(None, description="Bytes scanned per chunk"),
+):
+    """Search a text file that already lives on the server, under STRING_FILE_DIR."""
+    try:
+        path = get_string_service().resolve_file(name)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    try:
+        return await stream_file_search(request, path, pattern, chunk_size)
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e)}
+
+# DP endpoints
 @app.post("/api/dp/{algorithm}")
-async def run_dp_algorithm(algorithm: str, request: dict):
-    return {"steps": [], "message": "DP algorithms coming soon"}
-
-# Function to check if frontend is built
-def check_frontend_availability():
-    possible_paths = [
-        Path("../frontend/build"),  # Development
-        Path("./frontend/build"),   # Docker/Production
-        Path("frontend/build"),     # Alternative
-        Path("build"),              # If moved to root
-    ]
-    
-    for path in possible_paths:
-        index_path = path / "index.html"
-        if index_path.exists():
-            print(f"✅ Frontend found at: {path}")
-            return path, True
-    
-    print("❌ Frontend build not found. Available paths checked:")
-    for path in possible_paths:
-        print(f"   - {path.absolute()} (exists: {path.exists()})")
-    return None, False
-
-# Check frontend and setup static serving
-frontend_path, frontend_available = check_frontend_availability()
-
-if IS_PRODUCTION and frontend_available:
-    static_path = frontend_path / "static"
-    if static_path.exists():
-        app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
-        print(f"✅ Static files mounted from: {static_path}")
-    
+async def run_dp_algorithm(algorithm: str, params: Dict[str, Any], http_request: Request):
+    """
+    The body is the problem's params (text1/text2, weights/values/capacity, coins/amount, ...), the same
+    input as the "dp" kind of /ws/run and /api/traces. params.mode selects memo, banded or linear runs.
+    """
+    try:
+        service = get_dp_service()
+        request = DPRequest(problem_type=algorithm, params=params)
+        async with admission(http_request, "dp", algorithm, **dp_dimensions(algorithm, params)):
+            return json_body(await asyncio.to_thread(encode_steps, service.run_algorithm, algorithm, request))
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"error": str(e), "steps": []}
+
+# Interactive step sessions: the client pulls steps from a suspended generator
+def build_step_factory(kind: str, algorithm: str, payload: Dict[str, Any]):
+    """Validate the input once and return a zero-argument factory for a fresh step generator."""
+    if kind == "sorting":
+        array = SortingRequest(**payload).array
+        service = get_sorting_service()
+        service.iter_steps(algorithm, [])  # reject unknown algorithms before opening a session
+        return lambda: service.iter_steps(algorithm, list(array))
+    if kind == "graph":
+        graph_request = GraphRequest(**payload)
+        service = get_graph_service()
+        if algorithm not in service.algorithms:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        return lambda: service.iter_steps(algorithm, graph_request)
+    if kind == "dp":
+        dp_request = DPRequest(problem_type=algorithm, params=payload)
+        service = get_dp_service()
+        return lambda: service.iter_steps(algorithm, dp_request)
+    raise ValueError(f"Unknown kind: {kind} (expected sorting, graph or dp)")
+
+def input_dimensions(kind: str, algorithm: str, payload: Dict[str, Any]) -> Dict[str, float]:
+    if kind == "sorting":
+        return {"n": len(payload.get("array") or [])}
+    if kind == "graph":
+        return {"v": len(payload.get("nodes") or []), "e": len(payload.get("edges") or [])}
+    return dp_dimensions(algorithm, payload)
+
+def estimate_session_cost(kind: str, algorithm: str, payload: Dict[str, Any]) -> float:
+    return estimate_cost(kind, algorithm, **input_dimensions(kind, algorithm, payload))
+
+async def send_steps(websocket: WebSocket, session, count: int):
+    start = session.cursor
+    steps = await asyncio.to_thread(session.next, count)
+    await websocket.send_json({"type": "steps", "start": start, "steps": steps, **session.state})
+    return steps
+
+async def play_steps(websocket: WebSocket, session, interval_ms: int, batch: int):
+    # Pausing clears `playing` instead of cancelling, so an in-flight batch is still delivered
+    session.playing = True
+    while session.playing:
+        steps = await send_steps(websocket, session, batch)
+        if not steps or session.state["done"]:
+            break
+        await asyncio.sleep(max(interval_ms, 10) / 1000)
+    session.playing = False
+
+@app.websocket("/ws/run")
+async def run_session(websocket: WebSocket):
+    """
+    Messages: {"type": "start", "kind", "algorithm", "input"}, {"type": "next", "count"},
+    {"type": "seek", "step"}, {"type": "play", "interval_ms", "batch"}, {"type": "pause"}, {"type": "close"}.
+    """
+    from services.session_service import WS_IDLE_TIMEOUT, SessionLimitError
+    manager = get_session_manager()
+    await websocket.accept()
+    if manager.full:
+        await websocket.close(code=1013, reason="Too many sessions, try again later")
+        return
+    session = None
+    player = None
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(websocket.receive_json(), timeout=WS_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                if player is not None and not player.done():
+                    continue
+                await websocket.close(code=1001, reason="Idle timeout")
+                break
+            kind = message.get("type")
+            try:
+                if kind == "start":
+                    if player is not None:
+                        player.cancel()
+                    await asyncio.to_thread(manager.release, session)
+                    session = None
+                    factory = build_step_factory(message.get("kind", ""), message.get("algorithm", ""), message.get("input") or {})
+                    if ADMISSION_ENABLED:
+                        # Steps are pulled lazily, so a session is charged to the budget but holds no slot
+                        get_admission_controller().charge(client_id(websocket), estimate_session_cost(
+                            message.get("kind", ""), message.get("algorithm", ""), message.get("input") or {}))
+                    session = manager.open(factory)
+                    await websocket.send_json({"type": "started", "kind": message.get("kind"), "algorithm": message.get("algorithm")})
+                elif kind == "close":
+                    await websocket.close(code=1000)
+                    break
+                elif session is None:
+                    raise ValueError("No active run; send a 'start' message first")
+                elif kind == "next":
+                    await send_steps(websocket, session, message.get("count", 1))
+                elif kind == "seek":
+                    cursor = await asyncio.to_thread(session.seek, int(message.get("step", 0)))
+                    await websocket.send_json({"type": "seeked", "step": cursor, **session.state})
+                elif kind == "play":
+                    if player is None or player.done():
+                        player = asyncio.create_task(play_steps(
+                            websocket, session, int(message.get("interval_ms", 100)), int(message.get("batch", 1))
+                        ))
+                elif kind == "pause":
+                    session.playing = False
+                    await websocket.send_json({"type": "paused", **session.state})
+                else:
+                    raise ValueError(f"Unknown message type: {kind}")
+            except SessionLimitError as e:
+                await websocket.close(code=1013, reason=str(e))
+                break
+            except AdmissionRejected as e:
+                await websocket.send_json({"type": "error", "error": e.detail, "retryAfter": e.retry_after})
+            except (ValueError, TypeError) as e:
+                await websocket.send_json({"type": "error", "error": str(e)})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # Closing the generator stops all further work for an abandoned session
+        if player is not None:
+            player.cancel()
+        await asyncio.to_thread(manager.release, session)
+
+# Recorded traces: binary trace files (utils/trace_file.py) served from disk through mmap
+def record_trace(kind: str, algorithm: str, payload: Dict[str, Any], path: str) -> Dict[str, Any]:
+    if kind == "sorting":
+        return get_sorting_service().record_trace(algorithm, SortingRequest(**payload).array, path)
+    if kind == "graph":
+        return get_graph_service().record_trace(algorithm, GraphRequest(**payload), path)
+    return get_dp_service().record_trace(algorithm, DPRequest(problem_type=algorithm, params=payload), path)
+
+def open_trace(trace_id: str):
+    try:
+        reader = get_trace_store().open(trace_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if reader is None:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return reader
+
+def parse_range(header: str, size: int):
+    """Single 'bytes=a-b' / 'bytes=a-' / 'bytes=-n' range as a half-open [begin, end), or None if unsatisfiable."""
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            begin, end = max(0, size - int(last)), size
+        else:
+            begin, end = int(first), min(size, int(last) + 1) if last else size
+    except ValueError:
+        return None
+    return (begin, end) if 0 <= begin < end else None
+
+@app.post("/api/traces/upload")
+async def upload_trace(request: Request):
+    """Store a trace file recorded elsewhere; it is fully decoded once before it is accepted."""
+    from utils.trace_file import TraceFormatError, TraceReader
+    body = await read_binary_body(request)
+    store = get_trace_store()
+    trace_id = store.new_id()
+    staging = store.staging_path(trace_id)
+
+    def save():
+        with open(staging, "wb") as f:
+            f.write(body)
+        with TraceReader(staging) as reader:
+            reader.validate()
+            summary = reader.describe()
+        store.commit(trace_id, staging)
+        return summary
+
+    try:
+        summary = await asyncio.to_thread(save)
+    except TraceFormatError as e:
+        store.discard(staging)
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception:
+        store.discard(staging)
+        raise
+    summary.pop("input", None)
+    return {"id": trace_id, **summary}
+
+@app.post("/api/traces/{kind}/{algorithm}")
+async def record_trace_file(kind: str, algorithm: str, payload: Dict[str, Any], http_request: Request):
+    """Run an algorithm and stream its steps into a trace file instead of a JSON response."""
+    if kind not in ("sorting", "graph", "dp"):
+        return {"error": f"Unknown kind: {kind} (expected sorting, graph or dp)"}
+    store = get_trace_store()
+    trace_id = store.new_id()
+    staging = store.staging_path(trace_id)
+    try:
+        async with admission(http_request, kind, algorithm, **input_dimensions(kind, algorithm, payload)):
+            summary = await asyncio.to_thread(record_trace, kind, algorithm, payload, staging)
+        store.commit(trace_id, staging)
+        return {"id": trace_id, "kind": kind, "algorithm": algorithm, **summary}
+    except HTTPException:
+        store.discard(staging)
+        raise
+    except Exception as e:
+        store.discard(staging)
+        return {"error": str(e)}
+
+@app.get("/api/traces")
+async def list_traces():
+    return {"traces": await asyncio.to_thread(get_trace_store().list)}
+
+@app.get("/api/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    with open_trace(trace_id) as reader:
+        return {"id": trace_id, **reader.describe()}
+
+@app.get("/api/traces/{trace_id}/steps")
+async def get_trace_steps(trace_id: str, start: int = Query(0, ge=0), count: int = Query(100, ge=1, le=1000)):
+    """Decode a window of steps; only the records from the nearest keyframe onwards are touched."""
+    with open_trace(trace_id) as reader:
+        if start > reader.steps:
+            raise HTTPException(status_code=416, detail=f"Trace has {reader.steps} steps")
+        steps = await asyncio.to_thread(lambda: list(reader.iter_steps(start, count)))
+        return {"id": trace_id, "start": start, "total": reader.steps, "steps": steps}
+
+@app.get("/api/traces/{trace_id}/download")
+async def download_trace(trace_id: str, request: Request):
+    """The raw trace file; a Range header is answered with 206 and a slice of the mapped file."""
+    with open_trace(trace_id) as reader:
+        size = reader.size
+        range_header = request.headers.get("range")
+        if range_header:
+            byte_range = parse_range(range_header, size)
+            if byte_range is None:
+                return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+            begin, end = byte_range
+            return Response(reader.read_bytes(begin, end), status_code=206, media_type="application/octet-stream",
+                            headers={"Content-Range": f"bytes {begin}-{end - 1}/{size}", "Accept-Ranges": "bytes"})
+        path = reader.path
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{trace_id}.avtrace",
+                        headers={"Accept-Ranges": "bytes"})
+
+@app.delete("/api/traces/{trace_id}")
+async def delete_trace(trace_id: str):
+    if not get_trace_store().delete(trace_id):
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return {"id": trace_id, "deleted": True}
+
+# Frontend: in production the React build is served from an in-memory asset manifest
+# (see utils/static_assets.py), built during warm-up rather than on import
+if IS_PRODUCTION:
     @app.get("/{full_path:path}")
-    async def serve_react_app(full_path: str):
+    async def serve_react_app(full_path: str, request: Request):
         # Skip API routes
-        if full_path.startswith(("api/", "docs", "openapi", "health")):
+        if full_path.startswith(("api/", "docs", "openapi", "health", "metrics")):
             raise HTTPException(status_code=404, detail="Not found")
-        
-        # Try to serve specific file
-        file_path = frontend_path / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(str(file_path))
-        
+
+        manifest = get_asset_manifest()
+        asset = manifest.lookup(full_path)
+        if asset is not None:
+            return serve_asset(request, asset)
+        # Hashed bundles that are gone must not turn into index.html
+        if full_path.startswith("static/"):
+            raise HTTPException(status_code=404, detail="Not found")
+
         # Fall back to index.html for client-side routing
-        index_path = frontend_path / "index.html"
-        if index_path.exists():
-            return FileResponse(str(index_path))
-        
+        if manifest.index is not None:
+            return serve_asset(request, manifest.index)
+
         raise HTTPException(status_code=404, detail="Frontend not built")
 
 @app.get("/")
 async def root():
+    frontend_path = get_asset_manifest().root if IS_PRODUCTION else find_frontend_build()
     return {
         "message": "Algorithm Visualizer API",
         "version": "1.0.0",
         "environment": ENVIRONMENT,
-        "frontend_available": frontend_available,
+        "frontend_available": frontend_path is not None,
         "frontend_path": str(frontend_path) if frontend_path else "Not found"
     }
 
 if __name__ == "__main__":
+    import uvicorn
+
     port = int(os.environ.get("PORT", 8000))
     host = "0.0.0.0" if IS_PRODUCTION else "127.0.0.1"
     
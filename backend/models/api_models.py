@@ -1,63 +1,152 @@
-from pydantic import BaseModel, validator
-from typing import List, Optional, Dict, Any, Union
+import hashlib
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Tuple
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
+
+# Full step traces hold a copy of the array per step, so traced inputs stay small;
+# larger arrays go through the sampled-frame modes (/large, /binary?mode=large)
+TRACE_MAX_ELEMENTS = 1000
 
 class SortingRequest(BaseModel):
-    array: List[int]
-    
-    @validator('array')
-    def validate_array(cls, v):
-        if not v:
-            raise ValueError('Array cannot be empty')
-        if len(v) > 1000:
-            raise ValueError('Array too large (max 1000 elements)')
-        return v
+    model_config = ConfigDict(populate_by_name=True)
+    array: List[int] = Field(min_length=1, max_length=TRACE_MAX_ELEMENTS)
+
+class LargeSortingRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    # Either an explicit array or a server-side generated input of `size` elements
+    array: Optional[List[int]] = None
+    size: Optional[int] = None
+    distribution: str = "random"
+    seed: Optional[int] = None
+    frames: int = 60
+    bins: int = 256
+
+class ParallelSortingRequest(BaseModel):
+    # Same input options as LargeSortingRequest; the array is sorted once per thread count
+    array: Optional[List[int]] = None
+    size: Optional[int] = None
+    distribution: str = "random"
+    seed: Optional[int] = None
+    threads: Optional[List[int]] = None
+    cutoff: int = Field(4096, ge=16)
+    repeat: int = Field(1, ge=1)
+    events: int = Field(2048, ge=0)
+
+class RaceOptions(BaseModel):
+    # Played back at `fps` frames per second over `duration` seconds, whatever the trace lengths
+    algorithms: List[str] = Field(min_length=2)
+    fps: int = Field(30, ge=1, le=120)
+    duration: float = Field(4.0, gt=0, le=60)
 
-class GraphNode(BaseModel):
+class SortingRaceRequest(RaceOptions):
+    array: List[int] = Field(min_length=1, max_length=TRACE_MAX_ELEMENTS)
+
+class ComplexityRequest(BaseModel):
+    # Sizes run min_size, min_size*factor, ... up to max_size (n for sorting, V for graphs)
+    shapes: Optional[List[str]] = None
+    min_size: int = Field(64, ge=4)
+    max_size: int = Field(65536, ge=4)
+    factor: float = Field(2.0, gt=1)
+    repeat: int = Field(1, ge=1, le=5)
+    seed: int = 0
+
+# Nodes and edges are validated straight into slotted dataclasses, which the graph service
+# reads as they are: no per-edge BaseModel instance, no copy into an intermediate object
+@dataclass(slots=True)
+class GraphNode:
     id: int
     label: Optional[str] = ""
-    x: Optional[float] = 0
-    y: Optional[float] = 0
+    x: float = 0.0
+    y: float = 0.0
 
-class GraphEdge(BaseModel):
-    from_node: int = None  # Using from_node instead of 'from' (Python keyword)
-    to: int
-    weight: Optional[float] = 1.0
-    directed: Optional[bool] = False
-    
-    class Config:
-        # Allow using 'from' in JSON input
-        alias_generator = lambda field_name: 'from' if field_name == 'from_node' else field_name
-        allow_population_by_field_name = True
+@dataclass(slots=True)
+class GraphEdge:
+    # 'from' is a Python keyword, so the field is from_node; JSON may use either name
+    from_node: int = Field(validation_alias=AliasChoices('from_node', 'from'))
+    to: int = Field()
+    weight: float = 1.0
+    directed: bool = False
+
+_EDGE_FROM, _EDGE_TO, _EDGE_WEIGHT, _EDGE_DIRECTED = (
+    attrgetter('from_node'), attrgetter('to'), attrgetter('weight'), attrgetter('directed'))
+_NODE_ID, _NODE_X, _NODE_Y = attrgetter('id'), attrgetter('x'), attrgetter('y')
 
 class GraphRequest(BaseModel):
-    nodes: List[GraphNode]
+    model_config = ConfigDict(populate_by_name=True)
+    nodes: List[GraphNode] = Field(min_length=1)
     edges: List[GraphEdge]
-    start_node: Optional[int] = None
+    start_node: Optional[int] = 0
     end_node: Optional[int] = None
-    
-    @validator('nodes')
-    def validate_nodes(cls, v):
-        if not v:
-            raise ValueError('Graph must have at least one node')
-        return v
+    # One-to-many mode for dijkstra/bfs: stop once every target is settled
+    targets: Optional[List[int]] = None
+
+    def edge_columns(self) -> Tuple[Any, Any, Any, Any]:
+        """Edges as (src, dst, weight, directed) NumPy columns, each filled in one C-level pass."""
+        import numpy as np
+        count = len(self.edges)
+        return (np.fromiter(map(_EDGE_FROM, self.edges), np.int64, count),
+                np.fromiter(map(_EDGE_TO, self.edges), np.int64, count),
+                np.fromiter(map(_EDGE_WEIGHT, self.edges), np.float64, count),
+                np.fromiter(map(_EDGE_DIRECTED, self.edges), np.bool_, count))
+
+    def node_columns(self) -> Tuple[Any, Any, Any]:
+        import numpy as np
+        count = len(self.nodes)
+        return (np.fromiter(map(_NODE_ID, self.nodes), np.int64, count),
+                np.fromiter(map(_NODE_X, self.nodes), np.float64, count),
+                np.fromiter(map(_NODE_Y, self.nodes), np.float64, count))
+
+    def cache_payload(self) -> Dict[str, Any]:
+        """Result-cache key material: a digest of the column arrays instead of a JSON dump of every edge."""
+        digest = hashlib.sha256()
+        for column in (*self.node_columns(), *self.edge_columns()):
+            digest.update(column.tobytes())
+        return {"graph": digest.hexdigest(), "nodes": len(self.nodes), "edges": len(self.edges),
+                "start": self.start_node, "end": self.end_node, "targets": self.targets}
+
+class GraphRaceRequest(GraphRequest, RaceOptions):
+    pass
+
+class GraphEditModel(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    op: str  # add_edge | remove_edge | set_weight
+    from_node: int
+    to: int
+    weight: Optional[float] = None
+    directed: Optional[bool] = False
+
+class GraphEditRequest(BaseModel):
+    edits: List[GraphEditModel]
+    start_node: int = 0
+    # Also return the full distance/parent tree (e.g. when the client has none yet)
+    include_tree: bool = False
+
+# Grid pathfinding on an implicit grid graph (no node/edge lists)
+class GridRequest(BaseModel):
+    width: int
+    height: int
+    walls: Optional[str] = None
+    encoding: str = "rle"
+    weights: Optional[str] = None
+    start: List[int]
+    end: List[int]
+    diagonal: bool = False
+    pack: bool = False
 
 class StringRequest(BaseModel):
-    text: str
-    pattern: str
-    
-    @validator('text', 'pattern')
-    def validate_strings(cls, v):
-        if not v:
-            raise ValueError('Text and pattern cannot be empty')
-        return v
+    text: str = Field(min_length=1)
+    pattern: str = Field(min_length=1)
 
 class DPRequest(BaseModel):
     problem_type: str
     params: Dict[str, Any]
-    
-    @validator('problem_type')
+
+    @field_validator('problem_type')
+    @classmethod
     def validate_problem_type(cls, v):
-        allowed_types = ['lcs', 'knapsack', 'coin_change']
+        allowed_types = ['lcs', 'knapsack', 'coin_change', 'edit_distance', 'needleman_wunsch', 'smith_waterman']
         if v not in allowed_types:
             raise ValueError(f'Problem type must be one of {allowed_types}')
         return v
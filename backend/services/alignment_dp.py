@@ -0,0 +1,283 @@
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+# Edit distance and sequence alignment. Every algorithm maximises a score (edit distance is the
+# negated score under match 0 / mismatch -1 / gap -1) and runs in one of three modes:
+#   full    the whole (m+1) x (n+1) table, one step per cell like the other DP traces
+#   banded  Ukkonen's band: only cells within a few diagonals of the corner-to-corner path, widened
+#           until no path leaving the band could beat the best path inside it; O(k*n) cells
+#   linear  Hirschberg's divide and conquer: the alignment is recovered from score rows only,
+#           O(n) memory at about twice the work of the full table
+GAP = '-'
+NEG = float('-inf')
+DEFAULT_BAND = 1
+
+
+class Scoring(NamedTuple):
+    match: int
+    mismatch: int
+    gap: int
+    local: bool
+    # Edit distance is shown as a cost: table values and the result are negated scores
+    minimize: bool
+
+    def pair(self, x: str, y: str) -> int:
+        return self.match if x == y else self.mismatch
+
+
+def build_scoring(algorithm: str, params: Dict[str, Any]) -> Scoring:
+    if algorithm == 'edit_distance':
+        return Scoring(0, -1, -1, local=False, minimize=True)
+    match, mismatch, gap = (int(params.get(key, default)) for key, default in
+                            (('match', 1), ('mismatch', -1), ('gap', -2)))
+    if gap >= 0 or mismatch > match:
+        raise ValueError("Scores need gap < 0 and mismatch <= match")
+    if algorithm == 'needleman_wunsch':
+        return Scoring(match, mismatch, gap, local=False, minimize=False)
+    if algorithm == 'smith_waterman':
+        if match <= 0:
+            raise ValueError("Local alignment needs match > 0")
+        return Scoring(match, mismatch, gap, local=True, minimize=False)
+    raise ValueError(f"Unknown alignment algorithm: {algorithm}")
+
+
+def _edge(s: Scoring, k: int) -> int:
+    # First row/column: k leading gaps, free for local alignment
+    return 0 if s.local else k * s.gap
+
+
+def _cell(s: Scoring, diag: float, up: float, left: float, x: str, y: str) -> float:
+    best = max(diag + s.pair(x, y), up + s.gap, left + s.gap)
+    return max(best, 0) if s.local else best
+
+
+def _traceback(get: Callable[[int, int], float], a: str, b: str, s: Scoring,
+               i: int, j: int) -> Tuple[str, str, List[List[int]], List[int]]:
+    """Walk back from (i, j); returns the aligned rows, the cell path (end first) and the start cell."""
+    top: List[str] = []
+    bottom: List[str] = []
+    path = [[i, j]]
+    while i > 0 or j > 0:
+        v = get(i, j)
+        if s.local and v == 0:
+            break
+        if i > 0 and j > 0 and v == get(i - 1, j - 1) + s.pair(a[i - 1], b[j - 1]):
+            top.append(a[i - 1])
+            bottom.append(b[j - 1])
+            i, j = i - 1, j - 1
+        elif i > 0 and v == get(i - 1, j) + s.gap:
+            top.append(a[i - 1])
+            bottom.append(GAP)
+            i -= 1
+        else:
+            top.append(GAP)
+            bottom.append(b[j - 1])
+            j -= 1
+        path.append([i, j])
+    return ''.join(reversed(top)), ''.join(reversed(bottom)), path, [i, j]
+
+
+def _result(s: Scoring, score: float, top: str, bottom: str, start: List[int], end: List[int]) -> Dict[str, Any]:
+    value = int(score)
+    result: Dict[str, Any] = {'distance': -value} if s.minimize else {'score': value}
+    result['alignment'] = {'top': top, 'bottom': bottom, 'start': start, 'end': end}
+    return result
+
+
+def _shown(s: Scoring, values) -> List[int]:
+    return [-int(v) for v in values] if s.minimize else [int(v) for v in values]
+
+
+# -------- Full table --------
+def full_steps(a: str, b: str, s: Scoring) -> Iterator[Dict[str, Any]]:
+    m, n = len(a), len(b)
+    dp = [[_edge(s, j) if i == 0 else _edge(s, i) if j == 0 else 0 for j in range(n + 1)] for i in range(m + 1)]
+
+    def base(**extra) -> Dict[str, Any]:
+        return {'text1': a, 'text2': b, 'mode': 'full', 'table': [_shown(s, row) for row in dp], **extra}
+
+    yield base(currentCell=[-1, -1], operation=f'Initialized ({m + 1} x {n + 1}) table for "{a}" and "{b}"')
+    best, end = 0, [0, 0]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            dp[i][j] = _cell(s, dp[i - 1][j - 1], dp[i - 1][j], dp[i][j - 1], a[i - 1], b[j - 1])
+            if s.local and dp[i][j] > best:
+                best, end = dp[i][j], [i, j]
+            relation = '=' if a[i - 1] == b[j - 1] else '≠'
+            yield base(currentCell=[i, j], operation=f'{a[i - 1]} {relation} {b[j - 1]}: '
+                                                     f'dp[{i}][{j}] = {_shown(s, [dp[i][j]])[0]}')
+
+    if not s.local:
+        best, end = dp[m][n], [m, n]
+    top, bottom, path, start = _traceback(lambda i, j: dp[i][j], a, b, s, *end)
+    yield base(currentCell=end, backtrackPath=path, cellsComputed=m * n, tableSize=(m + 1) * (n + 1),
+               **_result(s, best, top, bottom, start, end),
+               operation=f'Alignment found: {top} / {bottom}')
+
+
+# -------- Ukkonen band --------
+def banded_steps(a: str, b: str, s: Scoring, band: int) -> Iterator[Dict[str, Any]]:
+    """
+    Cells (i, j) with lo <= j - i <= hi, where the band spans the corner-to-corner diagonals plus
+    `band` on either side. A path leaving it uses at least |m - n| + 2(band + 1) gaps, which bounds
+    its score; once the banded score reaches that bound the result is exact, otherwise the band doubles.
+    """
+    if s.local:
+        raise ValueError("Banded mode needs a global alignment (edit_distance or needleman_wunsch)")
+    m, n = len(a), len(b)
+    k = max(0, band)
+    computed = 0
+    # The inputs go out once, with the first pass; later steps carry only the band rows
+    texts = {'text1': a, 'text2': b}
+    while True:
+        lo, hi = -k - max(0, m - n), k + max(0, n - m)
+        covers = lo <= -m and hi >= n
+        rows: List[Tuple[int, List[int]]] = []
+
+        def get(i: int, j: int) -> float:
+            jlo, row = rows[i]
+            return row[j - jlo] if 0 <= j - jlo < len(row) else NEG
+
+        yield {**texts, 'mode': 'banded', 'event': 'pass', 'band': k, 'diagonals': [lo, hi],
+               'operation': f'Band pass: diagonals {lo}..{hi} (band {k})'}
+        texts = {}
+        for i in range(m + 1):
+            jlo, jhi = max(0, i + lo), min(n, i + hi)
+            row: List[int] = []
+            rows.append((jlo, row))
+            for j in range(jlo, jhi + 1):
+                if i == 0 or j == 0:
+                    row.append(_edge(s, i + j))
+                    continue
+                left = row[-1] if row else NEG
+                row.append(_cell(s, get(i - 1, j - 1), get(i - 1, j), left, a[i - 1], b[j - 1]))
+            computed += len(row)
+            yield {'mode': 'banded', 'event': 'row', 'band': k, 'row': i,
+                   'columns': [jlo, jhi], 'cells': _shown(s, row), 'cellsComputed': computed,
+                   'operation': f'Row {i}: columns {jlo}..{jhi}'}
+
+        score = get(m, n)
+        gaps = abs(m - n) + 2 * (k + 1)
+        bound = s.match * (m + n - gaps) / 2 + s.gap * gaps
+        if covers or score >= bound:
+            break
+        yield {'mode': 'banded', 'event': 'widen', 'band': k,
+               'bandScore': _shown(s, [score])[0], 'cellsComputed': computed,
+               'operation': f'Band {k} not converged: a path outside it could still score {bound:g}; widening'}
+        k = max(1, 2 * k)
+
+    top, bottom, path, start = _traceback(get, a, b, s, m, n)
+    yield {'mode': 'banded', 'event': 'done', 'band': k, 'diagonals': [lo, hi],
+           'backtrackPath': path, 'cellsComputed': computed, 'tableSize': (m + 1) * (n + 1),
+           **_result(s, score, top, bottom, start, [m, n]),
+           'operation': f'Converged at band {k} after {computed} of {(m + 1) * (n + 1)} cells: {top} / {bottom}'}
+
+
+# -------- Hirschberg, linear space --------
+def _last_row(a: str, b: str, s: Scoring) -> List[float]:
+    """Global scores of a against every prefix of b, keeping one row."""
+    prev = [j * s.gap for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [i * s.gap]
+        for j in range(1, len(b) + 1):
+            cur.append(max(prev[j - 1] + s.pair(a[i - 1], b[j - 1]), prev[j] + s.gap, cur[j - 1] + s.gap))
+        prev = cur
+    return prev
+
+
+def _hirschberg(a: str, b: str, s: Scoring, i0: int, j0: int, depth: int,
+                counter: List[int]) -> Iterator[Dict[str, Any]]:
+    """Yields one step per split; the generator's return value is the aligned (top, bottom)."""
+    if not a or not b:
+        return a + GAP * len(b), GAP * len(a) + b
+    if len(a) == 1:
+        # One row: the full table is O(n) here
+        row = [[j * s.gap for j in range(len(b) + 1)], [0] * (len(b) + 1)]
+        row[1][0] = s.gap
+        for j in range(1, len(b) + 1):
+            row[1][j] = max(row[0][j - 1] + s.pair(a[0], b[j - 1]), row[0][j] + s.gap, row[1][j - 1] + s.gap)
+        counter[0] += len(b)
+        top, bottom, _, _ = _traceback(lambda i, j: row[i][j], a, b, s, 1, len(b))
+        return top, bottom
+    mid = len(a) // 2
+    left = _last_row(a[:mid], b, s)
+    right = _last_row(a[mid:][::-1], b[::-1], s)
+    counter[0] += len(a) * len(b)
+    split = max(range(len(b) + 1), key=lambda j: left[j] + right[len(b) - j])
+    yield {'mode': 'linear', 'event': 'split', 'depth': depth,
+           'rows': [i0, i0 + len(a)], 'columns': [j0, j0 + len(b)], 'split': [i0 + mid, j0 + split],
+           'cellsComputed': counter[0],
+           'operation': f'Rows {i0}..{i0 + len(a)} x columns {j0}..{j0 + len(b)}: '
+                        f'optimal path crosses row {i0 + mid} at column {j0 + split}'}
+    top1, bottom1 = yield from _hirschberg(a[:mid], b[:split], s, i0, j0, depth + 1, counter)
+    top2, bottom2 = yield from _hirschberg(a[mid:], b[split:], s, i0 + mid, j0 + split, depth + 1, counter)
+    return top1 + top2, bottom1 + bottom2
+
+
+def _local_span(a: str, b: str, s: Scoring, counter: List[int]) -> Tuple[int, List[int], List[int]]:
+    """Best local score with its start and end cells, from a forward and a reverse pass of score rows."""
+    best, end = 0, [0, 0]
+    prev = [0] * (len(b) + 1)
+    for i in range(1, len(a) + 1):
+        cur = [0]
+        for j in range(1, len(b) + 1):
+            cur.append(_cell(s, prev[j - 1], prev[j], cur[j - 1], a[i - 1], b[j - 1]))
+            if cur[j] > best:
+                best, end = cur[j], [i, j]
+        prev = cur
+    counter[0] += len(a) * len(b)
+    if best == 0:
+        return 0, end, end
+    # Anchored at the end cell, walk the reversed prefixes until the score is reached again
+    ra, rb = a[:end[0]][::-1], b[:end[1]][::-1]
+    prev = [j * s.gap for j in range(len(rb) + 1)]
+    for i in range(1, len(ra) + 1):
+        cur = [i * s.gap]
+        for j in range(1, len(rb) + 1):
+            cur.append(max(prev[j - 1] + s.pair(ra[i - 1], rb[j - 1]), prev[j] + s.gap, cur[j - 1] + s.gap))
+            if cur[j] == best:
+                counter[0] += i * len(rb)
+                return best, [end[0] - i, end[1] - j], end
+        prev = cur
+    raise AssertionError("reverse pass did not reach the forward score")
+
+
+def linear_steps(a: str, b: str, s: Scoring) -> Iterator[Dict[str, Any]]:
+    counter = [0]
+    start, end = [0, 0], [len(a), len(b)]
+    # The inputs go out once, with the first step; splits carry only their sub-problem
+    texts = {'text1': a, 'text2': b}
+    if s.local:
+        best, start, end = _local_span(a, b, s, counter)
+        yield {**texts, 'mode': 'linear', 'event': 'span', 'start': start, 'end': end,
+               'cellsComputed': counter[0],
+               'operation': f'Best local score {best} spans {start} to {end}; aligning that region globally'}
+        texts = {}
+    sub_a, sub_b = a[start[0]:end[0]], b[start[1]:end[1]]
+    # The (local) span itself is aligned end to end
+    steps = _hirschberg(sub_a, sub_b, s._replace(local=False), start[0], start[1], 0, counter)
+    while True:
+        try:
+            step = next(steps)
+        except StopIteration as done:
+            top, bottom = done.value
+            break
+        yield {**texts, **step}
+        texts = {}
+    score = sum(s.gap if GAP in (x, y) else s.pair(x, y) for x, y in zip(top, bottom))
+    yield {**texts, 'mode': 'linear', 'event': 'done', 'cellsComputed': counter[0],
+           'tableSize': (len(a) + 1) * (len(b) + 1), **_result(s, score, top, bottom, start, end),
+           'operation': f'Alignment found with O(n) score rows: {top} / {bottom}'}
+
+
+def alignment_steps(algorithm: str, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """params: text1, text2, mode ('full', 'banded' or 'linear'), band, and match/mismatch/gap scores."""
+    a, b = str(params.get('text1', '')), str(params.get('text2', ''))
+    s = build_scoring(algorithm, params)
+    mode = params.get('mode') or 'full'
+    if mode == 'full':
+        return full_steps(a, b, s)
+    if mode == 'banded':
+        return banded_steps(a, b, s, int(params.get('band', DEFAULT_BAND)))
+    if mode == 'linear':
+        return linear_steps(a, b, s)
+    raise ValueError(f"Unknown mode: {mode} (expected full, banded, linear or memo)")
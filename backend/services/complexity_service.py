@@ -0,0 +1,219 @@
+import asyncio
+import math
+import os
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from backend.utils.csr import CSRGraph  # type: ignore
+except Exception:
+    from utils.csr import CSRGraph  # type: ignore
+
+# Empirical complexity: run an algorithm on a geometric series of input sizes with recording
+# switched off, then fit operation counts and wall times to candidate growth curves.
+COMPLEXITY_MAX_SIZE = int(os.getenv("COMPLEXITY_MAX_SIZE", 1 << 20))
+# Wall-clock budget for one analysis; the series stops before a size that would overrun it
+COMPLEXITY_TIME_BUDGET = float(os.getenv("COMPLEXITY_TIME_BUDGET", 5.0))
+MIN_POINTS = 3
+
+SORTING_SHAPES = ('random', 'sorted', 'reversed', 'few_unique', 'nearly_sorted')
+GRAPH_SHAPES = ('sparse', 'dense')
+# Edges per node for sparse graphs; dense graphs get about a quarter of all possible edges
+SPARSE_DEGREE = 4
+
+# Candidate growth curves: name -> (f(n), polynomial degree used to compare with claims)
+CURVES: Dict[str, Tuple[Callable[[np.ndarray], np.ndarray], float]] = {
+    '1': (lambda n: np.ones_like(n), 0.0),
+    'log n': (lambda n: np.log2(n), 0.0),
+    'n': (lambda n: n, 1.0),
+    'n log n': (lambda n: n * np.log2(n), 1.0),
+    'n^1.5': (lambda n: n ** 1.5, 1.5),
+    'n²': (lambda n: n ** 2, 2.0),
+    'n² log n': (lambda n: n ** 2 * np.log2(n), 2.0),
+    'n³': (lambda n: n ** 3, 3.0),
+}
+
+
+def fit_growth(sizes: List[int], values: List[float]) -> Dict[str, Any]:
+    """
+    Fit y ≈ c·f(n) for every candidate curve. Residuals are taken in log space so the small sizes
+    weigh as much as the large ones; the exponent is the slope of log y against log n.
+    """
+    n = np.asarray(sizes, dtype=np.float64)
+    y = np.maximum(np.asarray(values, dtype=np.float64), 1e-12)
+    log_y = np.log(y)
+    curves = []
+    for name, (f, degree) in CURVES.items():
+        log_ratio = log_y - np.log(np.maximum(f(n), 1e-12))
+        scale = float(np.exp(log_ratio.mean()))
+        curves.append({'curve': name, 'scale': float(f'{scale:.4g}'), 'degree': degree,
+                       'error': round(float(np.sqrt(np.mean((log_ratio - log_ratio.mean()) ** 2))), 4)})
+    curves.sort(key=lambda c: c['error'])
+    slope, _ = np.polyfit(np.log(n), log_y, 1)
+    return {'exponent': round(float(slope), 3), 'best': curves[0]['curve'], 'curves': curves}
+
+
+def claimed_degree(claim: Optional[str]) -> Optional[float]:
+    """Polynomial degree of a hard-coded complexity string: "O(n²)" -> 2, "O(n log n)" -> 1, "O(n^(4/3))" -> 1.33."""
+    if not claim:
+        return None
+    body = claim.strip()
+    if body.startswith('O(') and body.endswith(')'):
+        body = body[2:-1]
+    body = body.replace('²', '^2').replace('³', '^3').replace(' ', '')
+    # Additive terms such as "n + k" grow like their largest term in n
+    degrees = []
+    for term in body.split('+'):
+        match = re.search(r'n\^\(?(\d+)(?:/(\d+))?\)?', term)
+        if match:
+            degrees.append(int(match.group(1)) / int(match.group(2) or 1))
+        elif 'n' in term:
+            degrees.append(1.0)
+        else:
+            degrees.append(0.0)
+    return max(degrees) if degrees else None
+
+
+def random_graph(nodes: int, shape: str, rng: np.random.Generator) -> CSRGraph:
+    """Connected random graph: a random spanning path plus uniformly random extra edges."""
+    if shape == 'dense':
+        edges = min(nodes * (nodes - 1) // 2, nodes * nodes // 4)
+    else:
+        edges = SPARSE_DEGREE * nodes
+    path = rng.permutation(nodes)
+    extra = max(0, edges - (nodes - 1))
+    src = np.concatenate([path[:-1], rng.integers(0, nodes, extra)])
+    dst = np.concatenate([path[1:], rng.integers(0, nodes, extra)])
+    weight = rng.integers(1, 10, src.size).astype(np.float64)
+    return CSRGraph.from_edges(src, dst, weight, num_nodes=nodes)
+
+
+class ComplexityService:
+    def __init__(self, counter, graph_service, large_sorting_service):
+        # counter: sorting_service.OperationCounter, the Python sorts with recording off
+        self.counter = counter
+        self.graph_service = graph_service
+        self.large_sorting_service = large_sorting_service
+        self.graph_kernels = {
+            'bfs': graph_service._csr_bfs,
+            'dfs': graph_service._csr_dfs,
+            'dijkstra': graph_service._csr_dijkstra,
+        }
+
+    def shapes(self, kind: str) -> Tuple[str, ...]:
+        return SORTING_SHAPES if kind == 'sorting' else GRAPH_SHAPES
+
+    def validate(self, kind: str, algorithm: str, shapes: List[str]) -> None:
+        if kind == 'sorting':
+            known = self.counter.algorithms
+        elif kind == 'graph':
+            known = self.graph_kernels
+        else:
+            raise ValueError(f"Unknown kind: {kind} (expected sorting or graph)")
+        if algorithm not in known:
+            raise ValueError(f"Algorithm '{algorithm}' cannot be analyzed (supported: {', '.join(known)})")
+        unknown = [s for s in shapes if s not in self.shapes(kind)]
+        if unknown:
+            raise ValueError(f"Unknown shape(s): {', '.join(unknown)} (expected {', '.join(self.shapes(kind))})")
+
+    @staticmethod
+    def dimensions(kind: str, max_size: int) -> Dict[str, int]:
+        """Admission dimensions: a geometric series costs about as much as one run at twice its largest size."""
+        size = 2 * min(max_size, COMPLEXITY_MAX_SIZE)
+        return {'n': size} if kind == 'sorting' else {'v': size, 'e': SPARSE_DEGREE * size}
+
+    @staticmethod
+    def cost_cap() -> float:
+        """The series stops on COMPLEXITY_TIME_BUDGET, so it never costs more than that (admission units are ~µs)."""
+        return COMPLEXITY_TIME_BUDGET * 1e6
+
+    async def analyze(self, kind: str, algorithm: str, shapes: Optional[List[str]] = None, min_size: int = 64,
+                      max_size: int = 65536, factor: float = 2.0, repeat: int = 1, seed: int = 0,
+                      claimed: Optional[str] = None) -> Dict[str, Any]:
+        shapes = list(shapes or (('random', 'sorted', 'reversed', 'few_unique') if kind == 'sorting' else GRAPH_SHAPES))
+        self.validate(kind, algorithm, shapes)
+        max_size = min(max_size, COMPLEXITY_MAX_SIZE)
+        if factor <= 1 or min_size < 4 or max_size < min_size:
+            raise ValueError("Need 4 <= min_size <= max_size and factor > 1")
+        sizes = sorted({int(round(min_size * factor ** k))
+                        for k in range(int(math.log(max_size / min_size, factor) + 1e-9) + 1)})
+        return await asyncio.to_thread(self._analyze, kind, algorithm, shapes, sizes, repeat, seed, claimed)
+
+    def _analyze(self, kind: str, algorithm: str, shapes: List[str], sizes: List[int], repeat: int,
+                 seed: int, claimed: Optional[str]) -> Dict[str, Any]:
+        # Each shape gets an equal share of the time budget
+        deadline_share = COMPLEXITY_TIME_BUDGET / len(shapes)
+        results = {}
+        for shape in shapes:
+            points = self._series(kind, algorithm, shape, sizes, repeat, seed, deadline_share)
+            entry: Dict[str, Any] = {'points': points}
+            if len(points) >= MIN_POINTS:
+                measured = [p['n'] for p in points]
+                entry['operations'] = fit_growth(measured, [max(p['operations'], 1) for p in points])
+                entry['time'] = fit_growth(measured, [p['elapsed_ms'] for p in points])
+            else:
+                entry['error'] = f"Only {len(points)} size(s) fit in the time budget; need {MIN_POINTS}"
+            results[shape] = entry
+
+        degree = claimed_degree(claimed)
+        fitted = [r['operations']['exponent'] for r in results.values() if 'operations' in r]
+        worst = max(fitted) if fitted else None
+        return {
+            'kind': kind,
+            'algorithm': algorithm,
+            'size_measure': 'n' if kind == 'sorting' else 'V + E',
+            'operations_measure': 'comparisons' if kind == 'sorting' else 'queue/stack/heap operations + edges scanned',
+            'claimed': claimed,
+            'claimed_degree': degree,
+            'worst_exponent': worst,
+            # A log factor adds about 0.1-0.2 to the fitted exponent over these size ranges
+            'matches_claim': None if degree is None or worst is None else bool(worst <= degree + 0.3),
+            'shapes': results,
+        }
+
+    def _series(self, kind: str, algorithm: str, shape: str, sizes: List[int], repeat: int, seed: int,
+                budget: float) -> List[Dict[str, Any]]:
+        points: List[Dict[str, Any]] = []
+        spent = 0.0
+        for size in sizes:
+            if points:
+                # Predict the next run from the growth seen so far (at least linear, assume quadratic
+                # until two points exist) and stop before overrunning the budget
+                last = points[-1]
+                growth = 2.0
+                if len(points) >= 2:
+                    prev = points[-2]
+                    growth = max(1.0, math.log(max(last['elapsed_ms'], 1e-3) / max(prev['elapsed_ms'], 1e-3))
+                                 / math.log(last['n'] / prev['n']))
+                predicted = last['elapsed_ms'] / 1000 * (size / last['size']) ** growth * repeat
+                if spent + predicted > budget:
+                    break
+            began = time.perf_counter()
+            point = self._measure(kind, algorithm, shape, size, repeat, seed)
+            spent += time.perf_counter() - began
+            points.append(point)
+        return points
+
+    def _measure(self, kind: str, algorithm: str, shape: str, size: int, repeat: int, seed: int) -> Dict[str, Any]:
+        best = float('inf')
+        if kind == 'sorting':
+            array = self.large_sorting_service.generate(size, shape, seed).tolist()
+            n = size
+            for _ in range(max(1, repeat)):
+                began = time.perf_counter()
+                operations = self.counter.count(algorithm, array)
+                best = min(best, time.perf_counter() - began)
+        else:
+            graph = random_graph(size, shape, np.random.default_rng(seed))
+            n = graph.num_nodes + graph.num_edges
+            kernel = self.graph_kernels[algorithm]
+            for _ in range(max(1, repeat)):
+                began = time.perf_counter()
+                result = kernel(graph, 0, None)
+                best = min(best, time.perf_counter() - began)
+            # Counted inside the kernel, so extra work (stale pops, rescans) shows up in the fit
+            operations = result['operations']
+        return {'size': size, 'n': n, 'operations': operations, 'elapsed_ms': round(best * 1000, 4)}
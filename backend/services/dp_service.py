@@ -1,60 +1,85 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from models.api_models import DPRequest
+from services.memo_dp import memo_steps
+from services.alignment_dp import alignment_steps
+
+try:
+    from backend.utils.trace_file import write_trace  # type: ignore
+except Exception:
+    from utils.trace_file import write_trace  # type: ignore
 
 class DPService:
     def __init__(self):
         self.algorithms = {
             'lcs': self._longest_common_subsequence,
             'knapsack': self._knapsack,
-            'coin_change': self._coin_change
+            'coin_change': self._coin_change,
+            # Full, banded and linear-space modes are in services/alignment_dp.py
+            'edit_distance': lambda request: alignment_steps('edit_distance', request.params),
+            'needleman_wunsch': lambda request: alignment_steps('needleman_wunsch', request.params),
+            'smith_waterman': lambda request: alignment_steps('smith_waterman', request.params),
         }
 
     async def execute_algorithm(self, algorithm: str, request: DPRequest) -> List[Dict[str, Any]]:
+        return self.run_algorithm(algorithm, request)
+
+    def run_algorithm(self, algorithm: str, request: DPRequest) -> List[Dict[str, Any]]:
+        """The whole trace, built synchronously; request handlers call this through asyncio.to_thread."""
+        return list(self.iter_steps(algorithm, request))
+
+    def iter_steps(self, algorithm: str, request: DPRequest) -> Iterator[Dict[str, Any]]:
+        """Yield table snapshots one at a time instead of materialising the whole trace."""
         if algorithm not in self.algorithms:
             raise ValueError(f"Unknown algorithm: {algorithm}")
-        
-        return await self.algorithms[algorithm](request)
+        # params.mode = "memo" evaluates the same recurrence top-down (see services/memo_dp.py)
+        if request.params.get('mode') == 'memo':
+            return memo_steps(algorithm, request.params)
+        return self.algorithms[algorithm](request)
+
+    def record_trace(self, algorithm: str, request: DPRequest, path: str) -> Dict[str, Any]:
+        """Stream the table snapshots into a binary trace file; the 2-D table is stored as cell patches."""
+        steps = self.iter_steps(algorithm, request)
+        return write_trace(path, steps, {"kind": "dp", "algorithm": algorithm, "input": request.params})
 
-    async def _longest_common_subsequence(self, request: DPRequest) -> List[Dict[str, Any]]:
+    def _longest_common_subsequence(self, request: DPRequest) -> Iterator[Dict[str, Any]]:
         params = request.params
         text1 = params.get('text1', '')
         text2 = params.get('text2', '')
         
-        steps = []
         m, n = len(text1), len(text2)
         
         # Initialize DP table
         dp = [[0] * (n + 1) for _ in range(m + 1)]
         
-        steps.append({
+        yield {
             'text1': text1,
             'text2': text2,
             'table': [row[:] for row in dp],
             'currentCell': [-1, -1],
             'operation': f'Initialized DP table for LCS of "{text1}" and "{text2}"'
-        })
+        }
         
         # Fill DP table
         for i in range(1, m + 1):
             for j in range(1, n + 1):
                 if text1[i-1] == text2[j-1]:
                     dp[i][j] = dp[i-1][j-1] + 1
-                    steps.append({
+                    yield {
                         'text1': text1,
                         'text2': text2,
                         'table': [row[:] for row in dp],
                         'currentCell': [i, j],
                         'operation': f'Characters match: {text1[i-1]} = {text2[j-1]}, dp[{i}][{j}] = {dp[i][j]}'
-                    })
+                    }
                 else:
                     dp[i][j] = max(dp[i-1][j], dp[i][j-1])
-                    steps.append({
+                    yield {
                         'text1': text1,
                         'text2': text2,
                         'table': [row[:] for row in dp],
                         'currentCell': [i, j],
                         'operation': f'Characters differ: {text1[i-1]} ≠ {text2[j-1]}, take max({dp[i-1][j]}, {dp[i][j-1]}) = {dp[i][j]}'
-                    })
+                    }
         
         # Backtrack to find LCS
         lcs = []
@@ -74,7 +99,7 @@ class DPService:
         
         lcs.reverse()
         
-        steps.append({
+        yield {
             'text1': text1,
             'text2': text2,
             'table': [row[:] for row in dp],
@@ -82,40 +107,36 @@ class DPService:
             'lcs': ''.join(lcs),
             'backtrackPath': backtrack_steps,
             'operation': f'LCS found: "{"".join(lcs)}" (length: {dp[m][n]})'
-        })
-        
-        return steps
+        }
 
-    async def _knapsack(self, request: DPRequest) -> List[Dict[str, Any]]:
+    def _knapsack(self, request: DPRequest) -> Iterator[Dict[str, Any]]:
         params = request.params
         weights = params.get('weights', [])
         values = params.get('values', [])
         capacity = params.get('capacity', 0)
         knapsack_type = params.get('type', '0/1')  # '0/1' or 'unbounded'
         
-        steps = []
         n = len(weights)
         
         if knapsack_type == '0/1':
-            return await self._knapsack_01(weights, values, capacity)
+            return self._knapsack_01(weights, values, capacity)
         else:
-            return await self._knapsack_unbounded(weights, values, capacity)
+            return self._knapsack_unbounded(weights, values, capacity)
 
-    async def _knapsack_01(self, weights: List[int], values: List[int], capacity: int) -> List[Dict[str, Any]]:
-        steps = []
+    def _knapsack_01(self, weights: List[int], values: List[int], capacity: int) -> Iterator[Dict[str, Any]]:
         n = len(weights)
         
         # Initialize DP table
         dp = [[0] * (capacity + 1) for _ in range(n + 1)]
         
-        steps.append({
+        yield {
             'weights': weights,
             'values': values,
             'capacity': capacity,
             'table': [row[:] for row in dp],
             'currentCell': [-1, -1],
             'operation': f'Initialized 0/1 Knapsack DP table (capacity: {capacity})'
-        })
+        }
         
         # Fill DP table
         for i in range(1, n + 1):
@@ -126,34 +147,34 @@ class DPService:
                     
                     if include > exclude:
                         dp[i][w] = include
-                        steps.append({
+                        yield {
                             'weights': weights,
                             'values': values,
                             'capacity': capacity,
                             'table': [row[:] for row in dp],
                             'currentCell': [i, w],
                             'operation': f'Item {i} (w={weights[i-1]}, v={values[i-1]}): Include (value={include})'
-                        })
+                        }
                     else:
                         dp[i][w] = exclude
-                        steps.append({
+                        yield {
                             'weights': weights,
                             'values': values,
                             'capacity': capacity,
                             'table': [row[:] for row in dp],
                             'currentCell': [i, w],
                             'operation': f'Item {i} (w={weights[i-1]}, v={values[i-1]}): Exclude (value={exclude})'
-                        })
+                        }
                 else:
                     dp[i][w] = dp[i-1][w]
-                    steps.append({
+                    yield {
                         'weights': weights,
                         'values': values,
                         'capacity': capacity,
                         'table': [row[:] for row in dp],
                         'currentCell': [i, w],
                         'operation': f'Item {i} too heavy (w={weights[i-1]} > {w}): Skip'
-                    })
+                    }
         
         # Backtrack to find selected items
         selected_items = []
@@ -165,7 +186,7 @@ class DPService:
         
         selected_items.reverse()
         
-        steps.append({
+        yield {
             'weights': weights,
             'values': values,
             'capacity': capacity,
@@ -173,25 +194,22 @@ class DPService:
             'selectedItems': selected_items,
             'maxValue': dp[n][capacity],
             'operation': f'Optimal solution: items {selected_items}, max value: {dp[n][capacity]}'
-        })
-        
-        return steps
+        }
 
-    async def _knapsack_unbounded(self, weights: List[int], values: List[int], capacity: int) -> List[Dict[str, Any]]:
-        steps = []
+    def _knapsack_unbounded(self, weights: List[int], values: List[int], capacity: int) -> Iterator[Dict[str, Any]]:
         n = len(weights)
         
         # Initialize DP array
         dp = [0] * (capacity + 1)
         
-        steps.append({
+        yield {
             'weights': weights,
             'values': values,
             'capacity': capacity,
             'array': dp[:],
             'currentIndex': -1,
             'operation': f'Initialized Unbounded Knapsack DP array (capacity: {capacity})'
-        })
+        }
         
         # Fill DP array
         for w in range(1, capacity + 1):
@@ -200,53 +218,49 @@ class DPService:
                     new_value = values[i] + dp[w - weights[i]]
                     if new_value > dp[w]:
                         dp[w] = new_value
-                        steps.append({
+                        yield {
                             'weights': weights,
                             'values': values,
                             'capacity': capacity,
                             'array': dp[:],
                             'currentIndex': w,
                             'operation': f'Capacity {w}: Use item {i} (w={weights[i]}, v={values[i]}), new max: {dp[w]}'
-                        })
+                        }
         
-        steps.append({
+        yield {
             'weights': weights,
             'values': values,
             'capacity': capacity,
             'array': dp[:],
             'maxValue': dp[capacity],
             'operation': f'Unbounded Knapsack complete: max value = {dp[capacity]}'
-        })
-        
-        return steps
+        }
 
-    async def _coin_change(self, request: DPRequest) -> List[Dict[str, Any]]:
+    def _coin_change(self, request: DPRequest) -> Iterator[Dict[str, Any]]:
         params = request.params
         coins = params.get('coins', [])
         amount = params.get('amount', 0)
         problem_type = params.get('problem_type', 'min_coins')  # 'min_coins' or 'ways'
         
-        steps = []
         
         if problem_type == 'min_coins':
-            return await self._coin_change_min(coins, amount)
+            return self._coin_change_min(coins, amount)
         else:
-            return await self._coin_change_ways(coins, amount)
+            return self._coin_change_ways(coins, amount)
 
-    async def _coin_change_min(self, coins: List[int], amount: int) -> List[Dict[str, Any]]:
-        steps = []
+    def _coin_change_min(self, coins: List[int], amount: int) -> Iterator[Dict[str, Any]]:
         
         # Initialize DP array
         dp = [float('inf')] * (amount + 1)
         dp[0] = 0
         
-        steps.append({
+        yield {
             'coins': coins,
             'amount': amount,
             'array': [x if x != float('inf') else -1 for x in dp],
             'currentIndex': -1,
             'operation': f'Initialized Coin Change DP array (amount: {amount})'
-        })
+        }
         
         # Fill DP array
         for i in range(1, amount + 1):
@@ -254,67 +268,62 @@ class DPService:
                 if coin <= i and dp[i - coin] != float('inf'):
                     if dp[i - coin] + 1 < dp[i]:
                         dp[i] = dp[i - coin] + 1
-                        steps.append({
+                        yield {
                             'coins': coins,
                             'amount': amount,
                             'array': [x if x != float('inf') else -1 for x in dp],
                             'currentIndex': i,
                             'operation': f'Amount {i}: Use coin {coin}, min coins: {dp[i]}'
-                        })
+                        }
         
         result = dp[amount] if dp[amount] != float('inf') else -1
-        steps.append({
+        yield {
             'coins': coins,
             'amount': amount,
             'array': [x if x != float('inf') else -1 for x in dp],
             'minCoins': result,
             'operation': f'Minimum coins needed: {result if result != -1 else "impossible"}'
-        })
-        
-        return steps
+        }
 
-    async def _coin_change_ways(self, coins: List[int], amount: int) -> List[Dict[str, Any]]:
-        steps = []
+    def _coin_change_ways(self, coins: List[int], amount: int) -> Iterator[Dict[str, Any]]:
         
         # Initialize DP array
         dp = [0] * (amount + 1)
         dp[0] = 1
         
-        steps.append({
+        yield {
             'coins': coins,
             'amount': amount,
             'array': dp[:],
             'currentCoin': -1,
             'operation': f'Initialized Coin Change Ways DP array (amount: {amount})'
-        })
+        }
         
         # Fill DP array for each coin
         for coin in coins:
-            steps.append({
+            yield {
                 'coins': coins,
                 'amount': amount,
                 'array': dp[:],
                 'currentCoin': coin,
                 'operation': f'Processing coin: {coin}'
-            })
+            }
             
             for i in range(coin, amount + 1):
                 dp[i] += dp[i - coin]
-                steps.append({
+                yield {
                     'coins': coins,
                     'amount': amount,
                     'array': dp[:],
                     'currentCoin': coin,
                     'currentIndex': i,
                     'operation': f'Amount {i}: Add ways using coin {coin}, total ways: {dp[i]}'
-                })
+                }
         
-        steps.append({
+        yield {
             'coins': coins,
             'amount': amount,
             'array': dp[:],
             'totalWays': dp[amount],
             'operation': f'Total ways to make amount {amount}: {dp[amount]}'
-        })
-        
-        return steps
+        }
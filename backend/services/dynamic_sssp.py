@@ -0,0 +1,310 @@
+import heapq
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Incremental single-source shortest paths for registered graphs (Ramalingam–Reps style):
+# an edit only re-traces the nodes whose distance or tree parent can actually change.
+SSSP_CACHE_SIZE = int(os.getenv("SSSP_CACHE_SIZE", 32))
+# Steps beyond this are dropped (the returned distances/parents are still complete)
+SSSP_MAX_TRACE_STEPS = int(os.getenv("SSSP_MAX_TRACE_STEPS", 5000))
+
+EDIT_OPS = ("add_edge", "remove_edge", "set_weight")
+
+INF = float("inf")
+
+
+class DynamicSSSP:
+    """Distance/parent tree from one source, kept up to date as edges are added, removed or reweighted."""
+
+    def __init__(self, graph: Dict[str, Any], source: int):
+        self.nodes = list(graph.get("nodes", []))
+        self.node_ids = {node["id"] for node in self.nodes}
+        if source not in self.node_ids:
+            raise ValueError(f"Start node {source} is not in the graph")
+        self.source = source
+        # Edges grouped by their (from, to) as written; an arc u -> v draws on group (u, v)
+        # and on the undirected edges of group (v, u)
+        self.groups: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        self.out: Dict[int, Dict[int, float]] = {node: {} for node in self.node_ids}
+        self.inc: Dict[int, Dict[int, float]] = {node: {} for node in self.node_ids}
+        for edge in graph.get("edges", []):
+            self._check_edge(edge["from_node"], edge["to"], edge.get("weight"))
+            edge = self._normalise(edge)
+            u, v, w = edge["from_node"], edge["to"], edge["weight"]
+            self.groups.setdefault((u, v), []).append(edge)
+            for a, b in ((u, v),) if edge["directed"] else ((u, v), (v, u)):
+                if w < self.out[a].get(b, INF):
+                    self.out[a][b] = self.inc[b][a] = w
+        self.dist: Dict[int, float] = {}
+        self.parent: Dict[int, Optional[int]] = {}
+        self.children: Dict[int, Set[int]] = {node: set() for node in self.node_ids}
+        self._full_dijkstra()
+
+    # -------- Graph edits --------
+    def apply_edits(self, edits: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply edits in order and return only what changed, with a trace of the affected region."""
+        before: Dict[int, Tuple[float, Optional[int]]] = {}
+        steps: List[Dict[str, Any]] = []
+        affected: Set[int] = set()
+        for edit in edits:
+            for u, v, old, new in self._edit(edit):
+                if new < old:
+                    affected |= self._decrease(u, v, before, steps)
+                elif new > old:
+                    affected |= self._increase(u, v, before, steps)
+        changed = [n for n, (d, p) in before.items() if (d, p) != (self.dist[n], self.parent[n])]
+        return {
+            "startNode": self.source,
+            "affectedNodes": sorted(affected),
+            "distances": {n: self._finite(self.dist[n]) for n in sorted(changed)},
+            "parents": {n: self.parent[n] for n in sorted(changed)},
+            "steps": steps,
+            "traceTruncated": len(steps) >= SSSP_MAX_TRACE_STEPS,
+        }
+
+    def graph(self) -> Dict[str, Any]:
+        return {"nodes": self.nodes, "edges": [edge for group in self.groups.values() for edge in group]}
+
+    def tree(self) -> Dict[str, Any]:
+        return {
+            "distances": {n: d for n, d in self.dist.items() if d != INF},
+            "parents": {n: p for n, p in self.parent.items() if p is not None},
+        }
+
+    def _edit(self, edit: Dict[str, Any]) -> List[Tuple[int, int, float, float]]:
+        """Change the edge list and return the arcs whose effective (minimum) weight changed."""
+        op, u, v, weight = edit.get("op"), edit.get("from_node"), edit.get("to"), edit.get("weight")
+        if op not in EDIT_OPS:
+            raise ValueError(f"Unknown edit op '{op}' (expected one of: {', '.join(EDIT_OPS)})")
+        if op == "set_weight" and weight is None:
+            raise ValueError("set_weight needs a weight")
+        self._check_edge(u, v, weight if op != "remove_edge" else None)
+        arcs = [(u, v), (v, u)]
+        old = {arc: self.out[arc[0]].get(arc[1], INF) for arc in arcs}
+        if op == "add_edge":
+            edge = {"from_node": u, "to": v, "weight": weight, "directed": bool(edit.get("directed", False))}
+            self.groups.setdefault((u, v), []).append(self._normalise(edge))
+        else:
+            matching = self._matching(u, v)
+            if not matching:
+                raise ValueError(f"No edge between {u} and {v}")
+            for key, edge in matching:
+                if op == "remove_edge":
+                    self.groups[key].remove(edge)
+                    if not self.groups[key]:
+                        del self.groups[key]
+                else:
+                    edge["weight"] = float(weight)
+        changes = []
+        for a, b in dict.fromkeys(arcs):
+            self._refresh_arc(a, b)
+            new = self.out[a].get(b, INF)
+            if new != old[(a, b)]:
+                changes.append((a, b, old[(a, b)], new))
+        return changes
+
+    def _matching(self, u: int, v: int) -> List[Tuple[Tuple[int, int], Dict[str, Any]]]:
+        # Edges that give an arc u -> v: directed u -> v, or undirected in either orientation
+        found = [((u, v), edge) for edge in self.groups.get((u, v), [])]
+        if u != v:
+            found += [((v, u), edge) for edge in self.groups.get((v, u), []) if not edge["directed"]]
+        return found
+
+    def _refresh_arc(self, u: int, v: int) -> None:
+        weights = [edge["weight"] for _, edge in self._matching(u, v)]
+        if weights:
+            self.out[u][v] = self.inc[v][u] = min(weights)
+        else:
+            self.out[u].pop(v, None)
+            self.inc[v].pop(u, None)
+
+    def _check_edge(self, u, v, weight) -> None:
+        for node in (u, v):
+            if node not in self.node_ids:
+                raise ValueError(f"Node {node} is not in the graph")
+        if weight is not None and weight < 0:
+            raise ValueError("Incremental shortest paths need non-negative edge weights")
+
+    @staticmethod
+    def _normalise(edge: Dict[str, Any]) -> Dict[str, Any]:
+        weight = edge.get("weight")
+        return {
+            "from_node": edge["from_node"],
+            "to": edge["to"],
+            "weight": float(weight) if weight is not None else 1.0,
+            "directed": bool(edge.get("directed") or False),
+        }
+
+    # -------- Tree maintenance --------
+    def _full_dijkstra(self) -> None:
+        self.dist = {node: INF for node in self.node_ids}
+        self.parent = {node: None for node in self.node_ids}
+        self.dist[self.source] = 0.0
+        heap = [(0.0, self.source)]
+        done = set()
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u in done:
+                continue
+            done.add(u)
+            for v, w in self.out[u].items():
+                if d + w < self.dist[v]:
+                    self.dist[v] = d + w
+                    self._set_parent(v, u)
+                    heapq.heappush(heap, (d + w, v))
+
+    def _set_parent(self, node: int, parent: Optional[int]) -> None:
+        old = self.parent[node]
+        if old is not None:
+            self.children[old].discard(node)
+        self.parent[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def _remember(self, before: Dict, node: int) -> None:
+        before.setdefault(node, (self.dist[node], self.parent[node]))
+
+    def _decrease(self, u: int, v: int, before: Dict, steps: List) -> Set[int]:
+        """Arc u -> v got cheaper (or appeared): propagate the improvement outwards from v."""
+        candidate = self.dist[u] + self.out[u][v]
+        if candidate >= self.dist[v]:
+            return set()
+        self._remember(before, v)
+        self.dist[v] = candidate
+        self._set_parent(v, u)
+        heap = [(candidate, v)]
+        improved: Set[int] = set()
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d > self.dist[x] or x in improved:
+                continue
+            improved.add(x)
+            self._trace(steps, f"Distance of node {x} improves to {d}", x)
+            for z, w in self.out[x].items():
+                if d + w < self.dist[z]:
+                    self._remember(before, z)
+                    self.dist[z] = d + w
+                    self._set_parent(z, x)
+                    heapq.heappush(heap, (d + w, z))
+        return improved
+
+    def _increase(self, u: int, v: int, before: Dict, steps: List) -> Set[int]:
+        """Arc u -> v got dearer (or was removed): only v's subtree can lose its shortest path."""
+        if self.parent[v] != u:
+            return set()
+        # Phase 1: walk the subtree top-down; a node keeps its distance if some node outside the
+        # affected set still reaches it at the same cost, and then its own subtree is untouched
+        subtree = self._subtree(v)
+        affected: Set[int] = set()
+        confirmed: Set[int] = set()
+        queue = deque([v])
+        while queue:
+            x = queue.popleft()
+            alternative = next(
+                (y for y, w in self.inc[x].items()
+                 if y != x and (y not in subtree or y in confirmed) and self.dist[y] + w == self.dist[x]),
+                None,
+            )
+            if alternative is not None:
+                if alternative != self.parent[x]:
+                    self._remember(before, x)
+                    self._set_parent(x, alternative)
+                confirmed.add(x)
+                continue
+            affected.add(x)
+            queue.extend(self.children[x])
+        if not affected:
+            return set()
+        self._trace(steps, f"Edge {u} -> {v} no longer gives a shortest path: re-tracing {len(affected)} node(s)",
+                    None, invalidated=sorted(affected))
+
+        # Phase 2: seed each affected node from its unaffected in-neighbours, then run
+        # Dijkstra restricted to the affected set
+        heap = []
+        for x in affected:
+            self._remember(before, x)
+            best, best_parent = INF, None
+            for y, w in self.inc[x].items():
+                if y not in affected and self.dist[y] + w < best:
+                    best, best_parent = self.dist[y] + w, y
+            self.dist[x] = best
+            self._set_parent(x, best_parent)
+            if best < INF:
+                heapq.heappush(heap, (best, x))
+        settled: Set[int] = set()
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d > self.dist[x] or x in settled:
+                continue
+            settled.add(x)
+            self._trace(steps, f"Settled node {x} at distance {d}", x)
+            for z, w in self.out[x].items():
+                if z in affected and z not in settled and d + w < self.dist[z]:
+                    self.dist[z] = d + w
+                    self._set_parent(z, x)
+                    heapq.heappush(heap, (d + w, z))
+        unreachable = affected - settled
+        if unreachable:
+            self._trace(steps, f"{len(unreachable)} node(s) are no longer reachable from {self.source}",
+                        None, unreachable=sorted(unreachable))
+        return affected
+
+    def _subtree(self, root: int) -> Set[int]:
+        seen = {root}
+        stack = [root]
+        while stack:
+            for child in self.children[stack.pop()]:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return seen
+
+    def _trace(self, steps: List, operation: str, current: Optional[int], **extra) -> None:
+        # Same keys as GraphService traces, but each step only carries the node it changes, so the
+        # client patches its existing tree and the trace stays proportional to the affected region
+        if len(steps) >= SSSP_MAX_TRACE_STEPS:
+            return
+        changed = [current] if current is not None else []
+        parent = self.parent.get(current) if current is not None else None
+        steps.append({
+            "visitedNodes": changed,
+            "currentNodes": changed,
+            "visitedEdges": [],
+            "currentEdges": [(parent, current)] if parent is not None else [],
+            "distances": {n: self._finite(self.dist[n]) for n in changed},
+            "parents": {n: self.parent[n] for n in changed},
+            "operation": operation,
+            **extra,
+        })
+
+    @staticmethod
+    def _finite(value: float) -> Optional[float]:
+        return None if value == INF else value
+
+
+class SSSPTreeCache:
+    """Per-process LRU of maintained trees, keyed by (graph id, source) and tagged with the graph version."""
+
+    def __init__(self, size: int = SSSP_CACHE_SIZE):
+        self.size = size
+        self._trees: "OrderedDict[Tuple[str, int], Tuple[int, DynamicSSSP]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, graph_id: str, source: int, version: int) -> Optional[DynamicSSSP]:
+        entry = self._trees.get((graph_id, source))
+        if entry is None or entry[0] != version:
+            return None
+        self._trees.move_to_end((graph_id, source))
+        return entry[1]
+
+    def put(self, graph_id: str, source: int, version: int, tree: DynamicSSSP) -> None:
+        self._trees[(graph_id, source)] = (version, tree)
+        self._trees.move_to_end((graph_id, source))
+        while len(self._trees) > self.size:
+            self._trees.popitem(last=False)
+
+    def discard(self, graph_id: str, source: Optional[int] = None) -> None:
+        for key in [k for k in self._trees if k[0] == graph_id and (source is None or k[1] == source)]:
+            del self._trees[key]
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+try:
+    from backend.utils.shared_store import get_store  # type: ignore
+except Exception:
+    from utils.shared_store import get_store  # type: ignore
+
+# Registered graphs live in the shared store so every worker can run algorithms on them by id
+GRAPH_TTL = int(os.getenv("GRAPH_TTL", 7 * 24 * 3600))
+# Edits and deletes of one graph are serialised across workers by a lock key in the store;
+# it expires on its own if a worker dies while holding it
+GRAPH_LOCK_TTL = int(os.getenv("GRAPH_LOCK_TTL", 30))
+GRAPH_LOCK_TIMEOUT = float(os.getenv("GRAPH_LOCK_TIMEOUT", 5))
+
+
+class GraphBusyError(RuntimeError):
+    pass
+
+
+class GraphRegistry:
+    def __init__(self, store=None):
+        self._store = store
+
+    @property
+    def store(self):
+        return self._store if self._store is not None else get_store()
+
+    def register(self, graph: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a graph under a content-derived id; registering it again also discards any edits."""
+        encoded = json.dumps(graph, sort_keys=True, separators=(",", ":"))
+        graph_id = hashlib.sha256(encoded.encode()).hexdigest()[:16]
+        self.store.set(self._key(graph_id), encoded, ex=GRAPH_TTL)
+        return {**self._summary(graph_id, graph), "version": self._bump_version(graph_id)}
+
+    def save(self, graph_id: str, graph: Dict[str, Any]) -> int:
+        """Overwrite an edited graph in place (the id stays stable) and return its new version."""
+        self.store.set(self._key(graph_id), json.dumps(graph, separators=(",", ":")), ex=GRAPH_TTL)
+        return self._bump_version(graph_id)
+
+    def version(self, graph_id: str) -> int:
+        """Bumped on every write, so per-worker caches and cached results can tell stale copies apart."""
+        raw = self.store.get(self._version_key(graph_id))
+        return int(raw) if raw is not None else 0
+
+    def get(self, graph_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.store.get(self._key(graph_id))
+        return json.loads(raw) if raw is not None else None
+
+    def delete(self, graph_id: str) -> bool:
+        # The version is bumped, not removed: trees cached for the old version go stale everywhere,
+        # and a re-registered graph never reuses an old version
+        if self.store.delete(self._key(graph_id)) == 0:
+            return False
+        self._bump_version(graph_id)
+        return True
+
+    @contextmanager
+    def lock(self, graph_id: str, timeout: float = GRAPH_LOCK_TIMEOUT):
+        """Hold the graph's lock for a read-modify-write, in this worker and every other one."""
+        key, token = self._lock_key(graph_id), uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        while not self.store.set(key, token, ex=GRAPH_LOCK_TTL, nx=True):
+            if time.monotonic() >= deadline:
+                raise GraphBusyError(f"Graph {graph_id} is being edited; retry later")
+            time.sleep(0.01)
+        try:
+            yield
+        finally:
+            # Only release our own lock, not one taken over after ours expired
+            if self.store.get(key) == token.encode():
+                self.store.delete(key)
+
+    def _bump_version(self, graph_id: str) -> int:
+        # INCR is atomic in every store backend, so concurrent writers never get the same version
+        version = int(self.store.incr(self._version_key(graph_id)))
+        self.store.expire(self._version_key(graph_id), GRAPH_TTL)
+        return version
+
+    @staticmethod
+    def _key(graph_id: str) -> str:
+        return f"graph:{graph_id}"
+
+    @staticmethod
+    def _version_key(graph_id: str) -> str:
+        return f"graph-version:{graph_id}"
+
+    @staticmethod
+    def _lock_key(graph_id: str) -> str:
+        return f"graph-lock:{graph_id}"
+
+    @staticmethod
+    def _summary(graph_id: str, graph: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": graph_id,
+            "numNodes": len(graph.get("nodes", [])),
+            "numEdges": len(graph.get("edges", [])),
+            "ttl": GRAPH_TTL,
+        }
@@ -1,19 +1,46 @@
 import sys
-from typing import List, Dict, Any
+import asyncio
+import heapq
+import math
+import time
+from functools import partial
+from typing import List, Dict, Any, Iterator, Optional
+
+import numpy as np
 
 # Prefer absolute import when running from repo root (uvicorn backend.main:app)
 # Fallback to relative when running inside backend dir (uvicorn main:app)
 try:
     from backend.utils.engine_loader import get_engine  # type: ignore
+    from backend.utils.engine_health import record_fallback  # type: ignore
 except Exception:
     try:
         from utils.engine_loader import get_engine  # type: ignore
+        from utils.engine_health import record_fallback  # type: ignore
     except Exception:
         def get_engine():  # type: ignore
             return None
 
+        def record_fallback(algorithm: str) -> None:  # type: ignore
+            pass
+
+try:
+    from backend.utils.csr import CSRGraph  # type: ignore
+except Exception:
+    from utils.csr import CSRGraph  # type: ignore
+
+try:
+    from backend.utils.trace_file import write_trace  # type: ignore
+except Exception:
+    from utils.trace_file import write_trace  # type: ignore
+
 algorithm_engine = get_engine()
 
+# Floyd–Warshall keeps an n×n matrix and does n vectorised passes over it
+FLOYD_MAX_NODES = 1500
+# The full distance matrix is attached to the final Floyd–Warshall step only for small graphs
+FLOYD_MATRIX_MAX_NODES = 64
+
 class GraphService:
     def __init__(self):
         self.algorithms = {
@@ -22,17 +49,27 @@ class GraphService:
             'dijkstra': self._dijkstra,
             'astar': self._astar,
             'kruskal': self._kruskal,
-            'prim': self._prim
+            'prim': self._prim,
+            'bellman_ford': self._bellman_ford,
+            'floyd_warshall': self._floyd_warshall,
+            'topological_sort': self._topological_sort,
+            'scc': self._scc,
+            'bidirectional_dijkstra': self._fallback_bidirectional_dijkstra,
+            'bidirectional_bfs': self._fallback_bidirectional_bfs,
         }
 
     async def execute_algorithm(self, algorithm: str, request) -> List[Dict[str, Any]]:
+        return self.run_algorithm(algorithm, request)
+
+    def run_algorithm(self, algorithm: str, request) -> List[Dict[str, Any]]:
+        """The whole trace, built synchronously; request handlers call this through asyncio.to_thread."""
         try:
             if algorithm not in self.algorithms:
                 raise ValueError(f"Unknown algorithm: {algorithm}")
             
             print(f"Executing {algorithm} with {len(request.nodes)} nodes and {len(request.edges)} edges")
             
-            result = await self.algorithms[algorithm](request)
+            result = list(self.iter_steps(algorithm, request))
             print(f"Algorithm {algorithm} completed with {len(result)} steps")
             
             return result
@@ -49,43 +86,367 @@ class GraphService:
                 'operation': f'Error executing {algorithm}: {str(e)}'
             }]
 
-    async def _bfs(self, request) -> List[Dict[str, Any]]:
+    def iter_steps(self, algorithm: str, request) -> Iterator[Dict[str, Any]]:
+        """Lazily produce the trace; Python fallbacks only advance as far as the caller pulls."""
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        return self.algorithms[algorithm](request)
+
+    def record_trace(self, algorithm: str, request, path: str) -> Dict[str, Any]:
+        """Stream the trace into a binary trace file (utils/trace_file.py) instead of a JSON list."""
+        steps = self.iter_steps(algorithm, request)
+        meta = {"kind": "graph", "algorithm": algorithm, "input": request.model_dump(mode="json")}
+        return write_trace(path, steps, meta)
+
+    def _bfs(self, request) -> Iterator[Dict[str, Any]]:
         try:
             if algorithm_engine is None:
-                return await self._fallback_bfs(request)
+                record_fallback('graph.bfs')
+                return self._fallback_bfs(request)
             
             graph = self._build_cpp_graph(request)
             start = request.start_node if request.start_node is not None else 0
             steps = graph.bfs(start)
-            return [self._convert_graph_step(step) for step in steps]
+            return iter(self._convert_engine_trace(steps))
         except Exception as e:
             print(f"Error in BFS: {e}")
-            return await self._fallback_bfs(request)
+            record_fallback('graph.bfs')
+            return self._fallback_bfs(request)
 
-    async def _dfs(self, request) -> List[Dict[str, Any]]:
+    def _dfs(self, request) -> Iterator[Dict[str, Any]]:
         if algorithm_engine is None:
-            return await self._fallback_dfs(request)
+            record_fallback('graph.dfs')
+            return self._fallback_dfs(request)
         
         try:
             graph = self._build_cpp_graph(request)
             start = request.start_node if request.start_node is not None else 0
             steps = graph.dfs(start)
-            return [self._convert_graph_step(step) for step in steps]
+            return iter(self._convert_engine_trace(steps))
         except Exception as e:
-            return await self._fallback_dfs(request)
+            record_fallback('graph.dfs')
+            return self._fallback_dfs(request)
 
-    async def _dijkstra(self, request) -> List[Dict[str, Any]]:
+    def _dijkstra(self, request) -> Iterator[Dict[str, Any]]:
+        # The engine has no one-to-many mode, so target sets always use the Python search
+        if getattr(request, 'targets', None):
+            return self._fallback_dijkstra(request)
         if algorithm_engine is None:
-            return await self._fallback_dijkstra(request)
+            record_fallback('graph.dijkstra')
+            return self._fallback_dijkstra(request)
         
         try:
             graph = self._build_cpp_graph(request)
             start = request.start_node if request.start_node is not None else 0
             end = request.end_node if request.end_node is not None else -1
             steps = graph.dijkstra(start, end)
-            return [self._convert_graph_step(step) for step in steps]
+            return iter(self._convert_engine_trace(steps))
         except Exception as e:
-            return await self._fallback_dijkstra(request)
+            record_fallback('graph.dijkstra')
+            return self._fallback_dijkstra(request)
+
+    def _bellman_ford(self, request) -> Iterator[Dict[str, Any]]:
+        start = self._require_node(request, 'start', request.start_node if request.start_node is not None else 0)
+        return self._engine_or_fallback('bellman_ford', request, self._fallback_bellman_ford, start)
+
+    def _floyd_warshall(self, request) -> Iterator[Dict[str, Any]]:
+        start = self._require_node(request, 'start', request.start_node if request.start_node is not None else 0)
+        end = self._require_node(request, 'end', request.end_node) if request.end_node is not None else -1
+        return self._engine_or_fallback('floyd_warshall', request, self._fallback_floyd_warshall, start, end)
+
+    @staticmethod
+    def _require_node(request, label: str, node: int) -> int:
+        # The engine indexes its arrays by node id, so an unknown id must never reach it
+        if not any(n.id == node for n in request.nodes):
+            raise ValueError(f"{label} node {node} is not in the graph")
+        return node
+
+    @staticmethod
+    def _require_directed(request, algorithm: str) -> None:
+        # Undirected edges sit in both adjacency lists, which in-degree counting reads as 2-cycles
+        edge = next((e for e in request.edges if not e.directed), None)
+        if edge is not None:
+            raise ValueError(f"{algorithm} needs directed edges; edge {edge.from_node}-{edge.to} is undirected")
+
+    def _topological_sort(self, request) -> Iterator[Dict[str, Any]]:
+        self._require_directed(request, 'Topological sort')
+        return self._engine_or_fallback('topological_sort', request, self._fallback_topological_sort)
+
+    def _scc(self, request) -> Iterator[Dict[str, Any]]:
+        return self._engine_or_fallback('scc', request, self._fallback_scc)
+
+    def _engine_or_fallback(self, method: str, request, fallback, *args) -> Iterator[Dict[str, Any]]:
+        # Older engine builds lack the newer methods; treat that like a missing engine
+        if algorithm_engine is None or not hasattr(algorithm_engine.Graph, method):
+            record_fallback(f'graph.{method}')
+            return fallback(request)
+        try:
+            graph = self._build_cpp_graph(request)
+            steps = getattr(graph, method)(*args)
+            return iter(self._complete_engine_trace(method, steps))
+        except Exception:
+            record_fallback(f'graph.{method}')
+            return fallback(request)
+
+    def _complete_engine_trace(self, method: str, engine_steps) -> List[Dict[str, Any]]:
+        """Convert an engine trace and add the result keys the Python fallback puts on its last step."""
+        steps = self._convert_engine_trace(engine_steps)
+        if not steps:
+            return steps
+        final = steps[-1]
+        if method == 'bellman_ford' and final['operation'].startswith('Negative cycle'):
+            # The engine walks the cycle backwards along parent links
+            cycle = final['currentNodes'][::-1]
+            final['negativeCycle'] = cycle
+            final['currentEdges'] = list(zip(cycle, cycle[1:] + cycle[:1]))
+            final['operation'] = f'Negative cycle detected: {" -> ".join(map(str, cycle + cycle[:1]))}'
+        elif method == 'floyd_warshall' and engine_steps[-1].matrix:
+            final['matrix'] = [[d if math.isfinite(d) else None for d in row] for row in engine_steps[-1].matrix]
+        elif method == 'topological_sort':
+            final['order'] = list(final['visitedNodes'])
+        elif method == 'scc':
+            final['components'] = [s['currentNodes'] for s in steps if s['operation'].startswith('Component ')]
+        return steps
+
+    # -------- Result-only mode on CSR graphs (binary uploads, no per-step trace) --------
+    async def execute_csr(self, algorithm: str, graph: CSRGraph, start: int = 0, end: Optional[int] = None,
+                          targets: Optional[List[int]] = None) -> Dict[str, Any]:
+        kernels = {
+            'bfs': self._csr_bfs,
+            'dfs': self._csr_dfs,
+            'dijkstra': self._csr_dijkstra,
+            'bidirectional_bfs': self._csr_bidirectional_bfs,
+            'bidirectional_dijkstra': self._csr_bidirectional_dijkstra,
+        }
+        if algorithm not in kernels:
+            raise ValueError(f"Algorithm '{algorithm}' is not available for binary graphs (supported: {', '.join(kernels)})")
+        for label, node in (('start', start), ('end', end), *(('target', t) for t in targets or [])):
+            if node is not None and not 0 <= node < graph.num_nodes:
+                raise ValueError(f"{label} node {node} is out of range [0, {graph.num_nodes})")
+        if algorithm.startswith('bidirectional') and end is None:
+            raise ValueError("Bidirectional search needs an end_node")
+        if targets and algorithm not in ('bfs', 'dijkstra'):
+            raise ValueError("targets are supported by bfs and dijkstra only")
+        kernel = kernels[algorithm]
+        if targets:
+            kernel = partial(kernel, targets=targets)
+        began = time.perf_counter()
+        result = await asyncio.to_thread(kernel, graph, start, end)
+        result.update({
+            'algorithm': algorithm,
+            'numNodes': graph.num_nodes,
+            'numEdges': graph.num_edges,
+            'start': start,
+            'end': end,
+            'elapsedMs': round((time.perf_counter() - began) * 1000, 3),
+        })
+        if end is not None and 'path' not in result:
+            result['path'] = self._csr_path(result['parents'], start, end)
+        if targets:
+            dist = result['distances']
+            result['targetDistances'] = {t: (dist[t] if dist[t] >= 0 else None) for t in targets}
+        return result
+
+    def _csr_bfs(self, graph: CSRGraph, start: int, end: Optional[int],
+                 targets: Optional[List[int]] = None) -> Dict[str, Any]:
+        # Level-synchronous BFS; keeping first discoveries in adjacency order reproduces queue order
+        dist = np.full(graph.num_nodes, -1, dtype=np.int64)
+        parent = np.full(graph.num_nodes, -1, dtype=np.int64)
+        dist[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        order = [frontier]
+        level = 0
+        # Stop at the level where the end node, or every target, has been reached
+        goal = np.array(targets if targets else ([end] if end is not None else []), dtype=np.int64)
+        # Counted as the kernel runs: one per node dequeued and one per edge scanned
+        operations = 0
+        while frontier.size and not (goal.size and np.all(dist[goal] >= 0)):
+            src, nbrs, _ = graph.expand(frontier)
+            operations += int(frontier.size + nbrs.size)
+            fresh = dist[nbrs] < 0
+            src, nbrs = src[fresh], nbrs[fresh]
+            _, first = np.unique(nbrs, return_index=True)
+            first.sort()
+            frontier = nbrs[first]
+            level += 1
+            dist[frontier] = level
+            parent[frontier] = src[first]
+            order.append(frontier)
+        visit_order = np.concatenate(order)
+        return {
+            'order': visit_order.tolist(),
+            'distances': dist.tolist(),
+            'parents': parent.tolist(),
+            'visitedCount': int(visit_order.size),
+            'operations': operations,
+        }
+
+    def _csr_dfs(self, graph: CSRGraph, start: int, end: Optional[int]) -> Dict[str, Any]:
+        indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+        parent = [-1] * graph.num_nodes
+        seen = [False] * graph.num_nodes
+        order = []
+        stack = [(start, -1)]
+        # Every pop, including stale entries for already-seen nodes, and every edge scanned
+        operations = 0
+        while stack:
+            u, p = stack.pop()
+            operations += 1
+            if seen[u]:
+                continue
+            seen[u] = True
+            parent[u] = p
+            order.append(u)
+            if u == end:
+                break
+            # Reverse so the first neighbour is explored first, matching the traced DFS
+            operations += indptr[u + 1] - indptr[u]
+            for v in reversed(indices[indptr[u]:indptr[u + 1]]):
+                if not seen[v]:
+                    stack.append((v, u))
+        return {'order': order, 'parents': parent, 'visitedCount': len(order), 'operations': operations}
+
+    def _csr_dijkstra(self, graph: CSRGraph, start: int, end: Optional[int],
+                      targets: Optional[List[int]] = None) -> Dict[str, Any]:
+        indptr, indices, weights = graph.indptr.tolist(), graph.indices.tolist(), graph.weights.tolist()
+        if weights and min(weights) < 0:
+            raise ValueError("Dijkstra requires non-negative edge weights")
+        inf = float('inf')
+        dist = [inf] * graph.num_nodes
+        parent = [-1] * graph.num_nodes
+        done = [False] * graph.num_nodes
+        dist[start] = 0.0
+        pq = [(0.0, start)]
+        order = []
+        relaxations = 0
+        # Heap pops (stale ones included), edges scanned and heap pushes (one per relaxation)
+        operations = 0
+        pending = set(targets or [])
+        while pq:
+            d, u = heapq.heappop(pq)
+            operations += 1
+            if done[u]:
+                continue
+            done[u] = True
+            order.append(u)
+            if u == end:
+                break
+            pending.discard(u)
+            if targets and not pending:
+                break
+            operations += indptr[u + 1] - indptr[u]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    relaxations += 1
+                    heapq.heappush(pq, (nd, v))
+        return {
+            'order': order,
+            'distances': [x if x != inf else -1 for x in dist],
+            'parents': parent,
+            'visitedCount': len(order),
+            'relaxations': relaxations,
+            'operations': operations + relaxations,
+        }
+
+    def _csr_bidirectional_dijkstra(self, graph: CSRGraph, start: int, end: int) -> Dict[str, Any]:
+        sides = []
+        for g in (graph, graph.reversed()):
+            sides.append((g.indptr.tolist(), g.indices.tolist(), g.weights.tolist()))
+        if sides[0][2] and min(sides[0][2]) < 0:
+            raise ValueError("Dijkstra requires non-negative edge weights")
+        n = graph.num_nodes
+        inf = float('inf')
+        dist = ([inf] * n, [inf] * n)
+        parent = ([-1] * n, [-1] * n)
+        done = ([False] * n, [False] * n)
+        dist[0][start] = dist[1][end] = 0.0
+        heaps = ([(0.0, start)], [(0.0, end)])
+        best, meet = (0.0, start) if start == end else (inf, -1)
+        settled = [0, 0]
+        relaxations = 0
+        while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < best:
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heapq.heappop(heaps[side])
+            if done[side][u]:
+                continue
+            done[side][u] = True
+            settled[side] += 1
+            indptr, indices, weights = sides[side]
+            mine, other = dist[side], dist[1 - side]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                nd = d + weights[k]
+                if nd < mine[v]:
+                    mine[v] = nd
+                    parent[side][v] = u
+                    relaxations += 1
+                    heapq.heappush(heaps[side], (nd, v))
+                if mine[v] + other[v] < best:
+                    best, meet = mine[v] + other[v], v
+        path = []
+        if meet >= 0:
+            path = self._csr_path(parent[0], start, meet) + self._csr_path(parent[1], end, meet)[::-1][1:]
+        return {
+            'path': path,
+            'distance': best if path else None,
+            'meetingNode': meet if path else None,
+            'visitedCount': settled[0] + settled[1],
+            'forwardVisited': settled[0],
+            'backwardVisited': settled[1],
+            'relaxations': relaxations,
+        }
+
+    def _csr_bidirectional_bfs(self, graph: CSRGraph, start: int, end: int) -> Dict[str, Any]:
+        n = graph.num_nodes
+        graphs = (graph, graph.reversed())
+        dist = (np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64))
+        parent = (np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64))
+        dist[0][start] = dist[1][end] = 0
+        frontiers = [np.array([start], dtype=np.int64), np.array([end], dtype=np.int64)]
+        depth = [0, 0]
+        meet = start if start == end else -1
+        while meet < 0 and frontiers[0].size and frontiers[1].size:
+            # Expand one whole level of the smaller frontier, vectorised like _csr_bfs
+            side = 0 if frontiers[0].size <= frontiers[1].size else 1
+            src, nbrs, _ = graphs[side].expand(frontiers[side])
+            fresh = dist[side][nbrs] < 0
+            src, nbrs = src[fresh], nbrs[fresh]
+            _, first = np.unique(nbrs, return_index=True)
+            frontier = nbrs[first]
+            depth[side] += 1
+            dist[side][frontier] = depth[side]
+            parent[side][frontier] = src[first]
+            frontiers[side] = frontier
+            touching = frontier[dist[1 - side][frontier] >= 0]
+            if touching.size:
+                meet = int(touching[np.argmin(dist[1 - side][touching])])
+        path = []
+        if meet >= 0:
+            forward, backward = parent[0].tolist(), parent[1].tolist()
+            path = self._csr_path(forward, start, meet) + self._csr_path(backward, end, meet)[::-1][1:]
+        forward_seen = int(np.count_nonzero(dist[0] >= 0))
+        backward_seen = int(np.count_nonzero(dist[1] >= 0))
+        return {
+            'path': path,
+            'distance': len(path) - 1 if path else None,
+            'meetingNode': meet if path else None,
+            'visitedCount': forward_seen + backward_seen,
+            'forwardVisited': forward_seen,
+            'backwardVisited': backward_seen,
+        }
+
+    @staticmethod
+    def _csr_path(parents: List[int], start: int, end: int) -> List[int]:
+        if end < 0 or end >= len(parents) or (end != start and parents[end] < 0):
+            return []
+        path = [end]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return path[::-1]
 
     def _build_cpp_graph(self, request) :
         graph = algorithm_engine.Graph()
@@ -96,12 +457,19 @@ class GraphService:
         
         for edge in request.edges:
             from_node = edge.from_node if hasattr(edge, 'from_node') else getattr(edge, 'from', None)
-            cpp_edge = algorithm_engine.GraphEdge(from_node, edge.to, edge.weight or 1.0, edge.directed or False)
+            weight = edge.weight if edge.weight is not None else 1.0
+            cpp_edge = algorithm_engine.GraphEdge(from_node, edge.to, weight, edge.directed or False)
             graph.add_edge(cpp_edge)
         
         graph.build_adjacency_list()
         return graph
 
+    def _convert_engine_trace(self, steps) -> List[Dict[str, Any]]:
+        converted = [self._convert_graph_step(step) for step in steps]
+        if converted:
+            converted[-1]['visitedCount'] = len({n for step in converted for n in step['currentNodes']})
+        return converted
+
     def _convert_graph_step(self, step) -> Dict[str, Any]:
         return {
             'visitedNodes': list(step.visitedNodes),
@@ -114,11 +482,10 @@ class GraphService:
         }
 
     # Fallback Python implementations
-    async def _fallback_bfs(self, request) -> List[Dict[str, Any]]:
+    def _fallback_bfs(self, request) -> Iterator[Dict[str, Any]]:
         try:
             from collections import deque
             
-            steps = []
             adj_list = self._build_adjacency_list(request)
             visited = set()
             queue = deque()
@@ -131,7 +498,7 @@ class GraphService:
             
             print(f"Starting BFS from node {start}")
             
-            steps.append({
+            yield {
                 'visitedNodes': [],
                 'currentNodes': [],
                 'visitedEdges': [],
@@ -139,12 +506,12 @@ class GraphService:
                 'distances': {},
                 'parents': {},
                 'operation': f'Starting BFS from node {start}'
-            })
+            }
             
             queue.append(start)
             visited.add(start)
             
-            steps.append({
+            yield {
                 'visitedNodes': [],
                 'currentNodes': [start],
                 'visitedEdges': [],
@@ -152,7 +519,7 @@ class GraphService:
                 'distances': {start: 0},
                 'parents': {},
                 'operation': f'Added start node {start} to queue'
-            })
+            }
             
             step_count = 0
             max_steps = 50  # Prevent infinite loops
@@ -162,7 +529,7 @@ class GraphService:
                 step_count += 1
                 
                 visited_list = list(visited)
-                steps.append({
+                yield {
                     'visitedNodes': visited_list,
                     'currentNodes': [current],
                     'visitedEdges': [],
@@ -170,7 +537,7 @@ class GraphService:
                     'distances': {node: i for i, node in enumerate(visited_list)},
                     'parents': {},
                     'operation': f'Processing node {current}'
-                })
+                }
                 
                 # Get neighbors safely
                 neighbors = adj_list.get(current, [])
@@ -181,7 +548,7 @@ class GraphService:
                         visited.add(neighbor)
                         queue.append(neighbor)
                         
-                        steps.append({
+                        yield {
                             'visitedNodes': list(visited),
                             'currentNodes': [neighbor],
                             'visitedEdges': [],
@@ -189,9 +556,9 @@ class GraphService:
                             'distances': {node: i for i, node in enumerate(visited)},
                             'parents': {neighbor: current},
                             'operation': f'Discovered node {neighbor} from {current}'
-                        })
+                        }
             
-            steps.append({
+            yield {
                 'visitedNodes': list(visited),
                 'currentNodes': [],
                 'visitedEdges': [],
@@ -199,15 +566,12 @@ class GraphService:
                 'distances': {},
                 'parents': {},
                 'operation': 'BFS completed - All reachable nodes visited'
-            })
-            
-            print(f"BFS completed with {len(steps)} steps")
-            return steps
+            }
             
         except Exception as e:
             print(f"Error in fallback BFS: {e}")
             # Return minimal working result
-            return [{
+            yield {
                 'visitedNodes': [request.start_node or 0],
                 'currentNodes': [],
                 'visitedEdges': [],
@@ -215,17 +579,16 @@ class GraphService:
                 'distances': {},
                 'parents': {},
                 'operation': f'BFS failed: {str(e)}'
-            }]
+            }
 
-    async def _fallback_dfs(self, request) -> List[Dict[str, Any]]:
-        steps = []
+    def _fallback_dfs(self, request) -> Iterator[Dict[str, Any]]:
         adj_list = self._build_adjacency_list(request)
         visited = set()
         stack = []
         
         start = request.start_node if request.start_node is not None else 0
         
-        steps.append({
+        yield {
             'visitedNodes': [],
             'currentNodes': [],
             'visitedEdges': [],
@@ -233,7 +596,7 @@ class GraphService:
             'distances': {},
             'parents': {},
             'operation': f'Starting DFS from node {start}'
-        })
+        }
         
         stack.append(start)
         
@@ -244,7 +607,7 @@ class GraphService:
                 visited.add(current)
                 
                 visited_list = list(visited)
-                steps.append({
+                yield {
                     'visitedNodes': visited_list,
                     'currentNodes': [current],
                     'visitedEdges': [],
@@ -252,13 +615,13 @@ class GraphService:
                     'distances': {},
                     'parents': {},
                     'operation': f'Visiting node {current}'
-                })
+                }
                 
                 for neighbor in adj_list.get(current, []):
                     if neighbor not in visited:
                         stack.append(neighbor)
                         
-                        steps.append({
+                        yield {
                             'visitedNodes': visited_list,
                             'currentNodes': [neighbor],
                             'visitedEdges': [],
@@ -266,9 +629,9 @@ class GraphService:
                             'distances': {},
                             'parents': {},
                             'operation': f'Added neighbor {neighbor} to stack'
-                        })
+                        }
         
-        steps.append({
+        yield {
             'visitedNodes': list(visited),
             'currentNodes': [],
             'visitedEdges': [],
@@ -276,18 +639,18 @@ class GraphService:
             'distances': {},
             'parents': {},
             'operation': 'DFS Complete'
-        })
-        
-        return steps
+        }
 
-    async def _fallback_dijkstra(self, request) -> List[Dict[str, Any]]:
+    def _fallback_dijkstra(self, request) -> Iterator[Dict[str, Any]]:
         import heapq
         
-        steps = []
         adj_list = self._build_weighted_adjacency_list(request)
         
         start = request.start_node if request.start_node is not None else 0
         end = request.end_node
+        # One-to-many mode: stop once every target is settled instead of exploring the whole graph
+        targets = set(getattr(request, 'targets', None) or [])
+        pending = set(targets)
         
         dist = {node.id: float('inf') for node in request.nodes}
         dist[start] = 0
@@ -295,7 +658,7 @@ class GraphService:
         pq = [(0, start)]
         visited = set()
         
-        steps.append({
+        yield {
             'visitedNodes': [],
             'currentNodes': [],
             'visitedEdges': [],
@@ -303,7 +666,7 @@ class GraphService:
             'distances': {start: 0},
             'parents': {},
             'operation': f'Starting Dijkstra from node {start}'
-        })
+        }
         
         while pq:
             current_dist, u = heapq.heappop(pq)
@@ -313,18 +676,21 @@ class GraphService:
             
             visited.add(u)
             
-            steps.append({
+            yield {
                 'visitedNodes': list(visited),
                 'currentNodes': [u],
                 'visitedEdges': [],
                 'currentEdges': [],
                 'distances': {k: v for k, v in dist.items() if v != float('inf')},
-                'parents': parent,
+                'parents': dict(parent),
                 'operation': f'Processing node {u} with distance {current_dist}'
-            })
+            }
             
             if end is not None and u == end:
                 break
+            pending.discard(u)
+            if targets and not pending:
+                break
             
             for v, weight in adj_list.get(u, []):
                 if v not in visited:
@@ -334,27 +700,489 @@ class GraphService:
                         parent[v] = u
                         heapq.heappush(pq, (new_dist, v))
                         
-                        steps.append({
+                        yield {
                             'visitedNodes': list(visited),
                             'currentNodes': [v],
                             'visitedEdges': [],
                             'currentEdges': [(u, v)],
                             'distances': {k: v for k, v in dist.items() if v != float('inf')},
-                            'parents': parent,
+                            'parents': dict(parent),
                             'operation': f'Relaxed edge {u} -> {v}'
-                        })
+                        }
         
-        steps.append({
+        final = {
             'visitedNodes': list(visited),
             'currentNodes': [],
             'visitedEdges': [],
             'currentEdges': [],
             'distances': {k: v for k, v in dist.items() if v != float('inf')},
-            'parents': parent,
-            'operation': 'Dijkstra Complete'
-        })
-        
-        return steps
+            'parents': dict(parent),
+            'operation': 'Dijkstra Complete',
+            'visitedCount': len(visited),
+        }
+        if targets:
+            final['targetDistances'] = {t: (dist[t] if dist.get(t, float('inf')) != float('inf') else None) for t in sorted(targets)}
+            final['operation'] = f'Dijkstra Complete: settled all {len(targets)} target(s) after visiting {len(visited)} node(s)'
+        yield final
+
+    @staticmethod
+    def _graph_step(operation: str, visited=(), current=(), visited_edges=(), current_edges=(),
+                    distances=None, parents=None, **extra) -> Dict[str, Any]:
+        return {
+            'visitedNodes': list(visited),
+            'currentNodes': list(current),
+            'visitedEdges': list(visited_edges),
+            'currentEdges': list(current_edges),
+            'distances': dict(distances or {}),
+            'parents': dict(parents or {}),
+            'operation': operation,
+            **extra,
+        }
+
+    def _fallback_bellman_ford(self, request) -> Iterator[Dict[str, Any]]:
+        adj_list = self._build_weighted_adjacency_list(request)
+        start = request.start_node if request.start_node is not None else 0
+        inf = float('inf')
+        dist = {node: inf for node in adj_list}
+        dist[start] = 0
+        parent: Dict[int, int] = {}
+
+        def finite():
+            return {k: v for k, v in dist.items() if v != inf}
+
+        yield self._graph_step(f'Starting Bellman-Ford from node {start}', current=[start], distances=finite())
+
+        # At most V-1 rounds; stop as soon as a full round relaxes nothing
+        converged = False
+        for round_no in range(1, max(len(adj_list), 2)):
+            relaxed = 0
+            for u, edges in adj_list.items():
+                if dist[u] == inf:
+                    continue
+                for v, weight in edges:
+                    if dist[u] + weight < dist[v]:
+                        dist[v] = dist[u] + weight
+                        parent[v] = u
+                        relaxed += 1
+                        yield self._graph_step(
+                            f'Round {round_no}: relaxed edge {u} -> {v} (distance {dist[v]:g})',
+                            current=[v], current_edges=[(u, v)], distances=finite(), parents=parent,
+                        )
+            if relaxed == 0:
+                converged = True
+                yield self._graph_step(
+                    f'Round {round_no}: no distance changed, stopping early',
+                    visited=list(finite()), distances=finite(), parents=parent,
+                )
+                break
+
+        if not converged:
+            for u, edges in adj_list.items():
+                for v, weight in edges:
+                    if dist[u] != inf and dist[u] + weight < dist[v]:
+                        parent[v] = u
+                        cycle = self._negative_cycle(parent, v, len(adj_list))
+                        yield self._graph_step(
+                            f'Negative cycle detected: {" -> ".join(map(str, cycle + cycle[:1]))}',
+                            current=cycle,
+                            current_edges=list(zip(cycle, cycle[1:] + cycle[:1])),
+                            distances=finite(), parents=parent,
+                            negativeCycle=cycle,
+                        )
+                        return
+
+        yield self._graph_step(
+            'Bellman-Ford Complete',
+            visited=list(finite()),
+            visited_edges=[(p, v) for v, p in parent.items()],
+            distances=finite(), parents=parent,
+        )
+
+    @staticmethod
+    def _negative_cycle(parent: Dict[int, int], node: int, num_nodes: int) -> List[int]:
+        # Walking V parent links from a node still relaxable is guaranteed to land on the cycle
+        for _ in range(num_nodes):
+            node = parent[node]
+        cycle = [node]
+        current = parent[node]
+        while current != node:
+            cycle.append(current)
+            current = parent[current]
+        return cycle[::-1]
+
+    def _fallback_floyd_warshall(self, request) -> Iterator[Dict[str, Any]]:
+        ids = [node.id for node in request.nodes]
+        n = len(ids)
+        if n > FLOYD_MAX_NODES:
+            raise ValueError(f"Floyd-Warshall is limited to {FLOYD_MAX_NODES} nodes (got {n})")
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        start = request.start_node if request.start_node is not None else (ids[0] if ids else 0)
+        end = request.end_node
+        s = index.get(start, 0)
+
+        dist = np.full((n, n), np.inf)
+        pred = np.full((n, n), -1, dtype=np.int64)
+        for u, edges in self._build_weighted_adjacency_list(request).items():
+            for v, weight in edges:
+                i, j = index[u], index[v]
+                if weight < dist[i, j]:
+                    dist[i, j] = weight
+                    pred[i, j] = i
+        diagonal = np.arange(n)
+        dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0)
+
+        def row():
+            return {ids[j]: float(d) for j, d in enumerate(dist[s]) if np.isfinite(d)}
+
+        def parents():
+            return {ids[j]: ids[p] for j, p in enumerate(pred[s]) if p >= 0 and j != s}
+
+        yield self._graph_step(
+            f'Initialized {n}x{n} distance matrix (showing distances from node {start})',
+            current=[start], distances=row(),
+        )
+
+        for k in range(n):
+            # Rank-1 relaxation of every (i, j) pair through k, one vectorised pass per k
+            via = dist[:, k, None] + dist[None, k, :]
+            improved = via < dist
+            count = int(np.count_nonzero(improved))
+            if count:
+                np.copyto(dist, via, where=improved)
+                pred = np.where(improved, pred[k][None, :], pred)
+            yield self._graph_step(
+                f'Intermediate node {ids[k]}: {count} pair(s) improved',
+                current=[ids[k]], distances=row(), parents=parents(),
+            )
+
+        negative = np.flatnonzero(np.diag(dist) < 0)
+        if negative.size:
+            yield self._graph_step(
+                f'Negative cycle detected through node(s) {[ids[i] for i in negative]}',
+                current=[ids[i] for i in negative], distances=row(), parents=parents(),
+            )
+            return
+
+        path_edges = []
+        if end is not None and end in index and np.isfinite(dist[s, index[end]]):
+            j = index[end]
+            while j != s:
+                path_edges.append((ids[pred[s, j]], ids[j]))
+                j = pred[s, j]
+            path_edges.reverse()
+        extra = {}
+        if n <= FLOYD_MATRIX_MAX_NODES:
+            extra['matrix'] = [[float(d) if np.isfinite(d) else None for d in r] for r in dist]
+        yield self._graph_step(
+            'Floyd-Warshall Complete',
+            visited=list(row()), visited_edges=path_edges, distances=row(), parents=parents(), **extra,
+        )
+
+    def _fallback_topological_sort(self, request) -> Iterator[Dict[str, Any]]:
+        from collections import deque
+
+        adj_list = self._build_weighted_adjacency_list(request)
+        # In-degrees are shown in `distances` so each node is labelled with its remaining prerequisites
+        in_degree = {node: 0 for node in adj_list}
+        for edges in adj_list.values():
+            for v, _ in edges:
+                in_degree[v] += 1
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        order: List[int] = []
+        yield self._graph_step(
+            f"Computed in-degrees; {len(queue)} node(s) have no prerequisites",
+            current=list(queue), distances=in_degree,
+        )
+
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            yield self._graph_step(f'Output node {u} (position {len(order)})', visited=order, current=[u], distances=in_degree)
+            for v, _ in adj_list[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    queue.append(v)
+                yield self._graph_step(
+                    f'Removed edge {u} -> {v}; in-degree of {v} is now {in_degree[v]}',
+                    visited=order, current=[v], current_edges=[(u, v)], distances=in_degree,
+                )
+
+        if len(order) < len(adj_list):
+            remaining = [node for node, degree in in_degree.items() if degree > 0]
+            yield self._graph_step(
+                f'Cycle detected: {len(remaining)} node(s) never reached in-degree 0, no topological order exists',
+                visited=order, current=remaining, distances=in_degree, order=order,
+            )
+            return
+
+        yield self._graph_step(
+            f'Topological order: {" -> ".join(map(str, order))}',
+            visited=order, visited_edges=list(zip(order, order[1:])), distances=in_degree, order=order,
+        )
+
+    def _fallback_scc(self, request) -> Iterator[Dict[str, Any]]:
+        adj_list = self._build_weighted_adjacency_list(request)
+        index: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        on_stack = set()
+        stack: List[int] = []
+        components: List[List[int]] = []
+        component_of: Dict[int, int] = {}
+
+        yield self._graph_step("Starting Tarjan's strongly connected components")
+
+        # Explicit work stack of (node, neighbour iterator) instead of recursion
+        for root in adj_list:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adj_list[root]))]
+            yield self._graph_step(
+                f'Discovered node {root} (index {index[root]})',
+                visited=list(component_of), current=[root], distances=low, parents=component_of,
+            )
+            while work:
+                u, neighbours = work[-1]
+                for v, _ in neighbours:
+                    if v not in index:
+                        index[v] = low[v] = len(index)
+                        stack.append(v)
+                        on_stack.add(v)
+                        work.append((v, iter(adj_list[v])))
+                        yield self._graph_step(
+                            f'Tree edge {u} -> {v}: discovered node {v} (index {index[v]})',
+                            visited=list(component_of), current=[v], current_edges=[(u, v)],
+                            distances=low, parents=component_of,
+                        )
+                        break
+                    if v in on_stack and index[v] < low[u]:
+                        low[u] = index[v]
+                        yield self._graph_step(
+                            f'Back edge {u} -> {v}: low[{u}] = {low[u]}',
+                            visited=list(component_of), current=[u], current_edges=[(u, v)],
+                            distances=low, parents=component_of,
+                        )
+                else:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        low[caller] = min(low[caller], low[u])
+                    if low[u] == index[u]:
+                        component = []
+                        while True:
+                            w = stack.pop()
+                            on_stack.discard(w)
+                            component_of[w] = len(components)
+                            component.append(w)
+                            if w == u:
+                                break
+                        components.append(component)
+                        yield self._graph_step(
+                            f'Component {len(components)} rooted at {u}: {sorted(component)}',
+                            visited=list(component_of), current=component, distances=low, parents=component_of,
+                        )
+
+        # Final step: `parents` maps every node to its component number
+        yield self._graph_step(
+            f'Found {len(components)} strongly connected component(s)',
+            visited=list(component_of), distances=low, parents=component_of, components=components,
+        )
+
+    def _reverse_adjacency(self, adj_list: Dict[int, List[tuple]]) -> Dict[int, List[tuple]]:
+        reverse: Dict[int, List[tuple]] = {node: [] for node in adj_list}
+        for u, edges in adj_list.items():
+            for v, weight in edges:
+                reverse[v].append((u, weight))
+        return reverse
+
+    @staticmethod
+    def _search_endpoints(request):
+        start = request.start_node if request.start_node is not None else 0
+        end = request.end_node
+        if end is None:
+            raise ValueError("This search needs an end_node")
+        return start, end
+
+    @staticmethod
+    def _joined_path(parent_fwd: Dict[int, int], parent_bwd: Dict[int, int], start: int, end: int, meet: int) -> List[int]:
+        path = [meet]
+        while path[-1] != start:
+            path.append(parent_fwd[path[-1]])
+        path.reverse()
+        while path[-1] != end:
+            path.append(parent_bwd[path[-1]])
+        return path
+
+    def _fallback_bidirectional_dijkstra(self, request) -> Iterator[Dict[str, Any]]:
+        adj_list = self._build_weighted_adjacency_list(request)
+        if any(weight < 0 for edges in adj_list.values() for _, weight in edges):
+            raise ValueError("Bidirectional Dijkstra requires non-negative edge weights")
+        start, end = self._search_endpoints(request)
+        graphs = (adj_list, self._reverse_adjacency(adj_list))
+        inf = float('inf')
+        dist = ({start: 0.0}, {end: 0.0})
+        parent: tuple = ({}, {})
+        settled = (set(), set())
+        heaps = ([(0.0, start)], [(0.0, end)])
+        names = ('Forward', 'Backward')
+        best, meet = (0.0, start) if start == end else (inf, None)
+
+        def step(operation, **kwargs):
+            return self._graph_step(
+                operation, visited=settled[0] | settled[1], distances=dist[0], parents=parent[0],
+                backwardDistances=dict(dist[1]), **kwargs,
+            )
+
+        yield step(f'Starting bidirectional Dijkstra between {start} and {end}', current=[start, end])
+        while heaps[0] and heaps[1]:
+            # Any path not yet found is at least as long as the two smallest frontier keys combined
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                yield step(f'Frontier keys {heaps[0][0][0]:g} + {heaps[1][0][0]:g} >= best path {best:g}: stopping')
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heapq.heappop(heaps[side])
+            if u in settled[side]:
+                continue
+            settled[side].add(u)
+            yield step(f'{names[side]} search settles node {u} (distance {d:g})', current=[u])
+            for v, weight in graphs[side][u]:
+                candidate = d + weight
+                edge = (u, v) if side == 0 else (v, u)
+                if candidate < dist[side].get(v, inf):
+                    dist[side][v] = candidate
+                    parent[side][v] = u
+                    heapq.heappush(heaps[side], (candidate, v))
+                    yield step(f'{names[side]} search relaxed edge {edge[0]} -> {edge[1]}', current=[v], current_edges=[edge])
+                if v in dist[1 - side] and dist[side][v] + dist[1 - side][v] < best:
+                    best, meet = dist[side][v] + dist[1 - side][v], v
+                    yield step(f'Searches meet at node {v}: path of length {best:g}', current=[v], current_edges=[edge])
+
+        path = self._joined_path(parent[0], parent[1], start, end, meet) if meet is not None else []
+        yield step(
+            f'Shortest path {" -> ".join(map(str, path))} (length {best:g})' if path else f'No path from {start} to {end}',
+            visited_edges=list(zip(path, path[1:])),
+            path=path, pathLength=best if path else None,
+            visitedCount=len(settled[0] | settled[1]),
+            forwardVisited=len(settled[0]), backwardVisited=len(settled[1]),
+        )
+
+    def _fallback_bidirectional_bfs(self, request) -> Iterator[Dict[str, Any]]:
+        adj_list = self._build_weighted_adjacency_list(request)
+        start, end = self._search_endpoints(request)
+        graphs = (adj_list, self._reverse_adjacency(adj_list))
+        dist = ({start: 0}, {end: 0})
+        parent: tuple = ({}, {})
+        frontiers = [[start], [end]]
+        names = ('Forward', 'Backward')
+        meet = start if start == end else None
+
+        def step(operation, **kwargs):
+            return self._graph_step(
+                operation, visited=dist[0].keys() | dist[1].keys(), distances=dist[0], parents=parent[0],
+                backwardDistances=dict(dist[1]), **kwargs,
+            )
+
+        yield step(f'Starting bidirectional BFS between {start} and {end}', current=[start, end])
+        while meet is None and frontiers[0] and frontiers[1]:
+            # Always grow the smaller frontier by one full level
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            next_frontier = []
+            best = None
+            for u in frontiers[side]:
+                for v, _ in graphs[side][u]:
+                    if v in dist[side]:
+                        continue
+                    dist[side][v] = dist[side][u] + 1
+                    parent[side][v] = u
+                    next_frontier.append(v)
+                    edge = (u, v) if side == 0 else (v, u)
+                    yield step(f'{names[side]} search discovers node {v} (depth {dist[side][v]})', current=[v], current_edges=[edge])
+                    if v in dist[1 - side]:
+                        total = dist[0][v] + dist[1][v]
+                        if best is None or total < best[0]:
+                            best = (total, v)
+            frontiers[side] = next_frontier
+            if best is not None:
+                meet = best[1]
+                yield step(f'Searches meet at node {meet}: path of {best[0]} edge(s)', current=[meet])
+            else:
+                yield step(f'{names[side]} level complete: {len(next_frontier)} new node(s)', current=next_frontier)
+
+        path = self._joined_path(parent[0], parent[1], start, end, meet) if meet is not None else []
+        yield step(
+            f'Shortest path {" -> ".join(map(str, path))} ({len(path) - 1} edge(s))' if path else f'No path from {start} to {end}',
+            visited_edges=list(zip(path, path[1:])),
+            path=path, pathLength=len(path) - 1 if path else None,
+            visitedCount=len(dist[0].keys() | dist[1].keys()),
+            forwardVisited=len(dist[0]), backwardVisited=len(dist[1]),
+        )
+
+    @staticmethod
+    def _heuristic_scale(adj_list: Dict[int, List[tuple]], coords: Dict[int, tuple]) -> float:
+        """Largest factor that keeps scale * straight-line distance <= every edge weight (so A* stays exact)."""
+        scale = float('inf')
+        for u, edges in adj_list.items():
+            for v, weight in edges:
+                length = math.dist(coords[u], coords[v])
+                if length > 0:
+                    scale = min(scale, weight / length)
+        return max(scale, 0.0) if scale != float('inf') else 0.0
+
+    def _fallback_astar(self, request) -> Iterator[Dict[str, Any]]:
+        adj_list = self._build_weighted_adjacency_list(request)
+        if any(weight < 0 for edges in adj_list.values() for _, weight in edges):
+            raise ValueError("A* requires non-negative edge weights")
+        start, end = self._search_endpoints(request)
+        coords = {node.id: (node.x or 0.0, node.y or 0.0) for node in request.nodes}
+        scale = self._heuristic_scale(adj_list, coords)
+
+        def h(u):
+            return scale * math.dist(coords[u], coords[end])
+
+        g = {start: 0.0}
+        parent: Dict[int, int] = {}
+        closed = set()
+        # (f, h, node): ties on f go to the node estimated closer to the goal
+        open_heap = [(h(start), h(start), start)]
+        yield self._graph_step(
+            f'Starting A* from {start} to {end} (heuristic = {scale:.4g} x straight-line distance)',
+            current=[start], distances=g,
+        )
+        while open_heap:
+            f, _, u = heapq.heappop(open_heap)
+            if u in closed:
+                continue
+            closed.add(u)
+            yield self._graph_step(
+                f'Expanding node {u} (g={g[u]:g}, h={f - g[u]:.4g}, f={f:.4g})',
+                visited=closed, current=[u], distances=g, parents=parent,
+            )
+            if u == end:
+                break
+            for v, weight in adj_list[u]:
+                tentative = g[u] + weight
+                if v not in closed and tentative < g.get(v, float('inf')):
+                    g[v] = tentative
+                    parent[v] = u
+                    heapq.heappush(open_heap, (tentative + h(v), h(v), v))
+                    yield self._graph_step(
+                        f'Updated path to node {v} (g={tentative:g}, f={tentative + h(v):.4g})',
+                        visited=closed, current=[v], current_edges=[(u, v)], distances=g, parents=parent,
+                    )
+
+        path = []
+        if end in closed:
+            path = [end]
+            while path[-1] != start:
+                path.append(parent[path[-1]])
+            path.reverse()
+        yield self._graph_step(
+            f'Path found: {" -> ".join(map(str, path))} (length {g[end]:g})' if path else f'No path from {start} to {end}',
+            visited=closed, visited_edges=list(zip(path, path[1:])), distances=g, parents=parent,
+            path=path, pathLength=g[end] if path else None, visitedCount=len(closed), heuristicScale=scale,
+        )
 
     def _build_adjacency_list(self, request) -> Dict[int, List[int]]:
         try:
@@ -401,21 +1229,23 @@ class GraphService:
         
         for edge in request.edges:
             from_node = edge.from_node if hasattr(edge, 'from_node') else getattr(edge, 'from', None)
-            adj_list[from_node].append((edge.to, edge.weight or 1.0))
+            weight = edge.weight if edge.weight is not None else 1.0
+            adj_list[from_node].append((edge.to, weight))
             
             if not edge.directed:
-                adj_list[edge.to].append((from_node, edge.weight or 1.0))
+                adj_list[edge.to].append((from_node, weight))
         
         return adj_list
 
-    async def _astar(self, request) -> List[Dict[str, Any]]:
-        # Placeholder for A* algorithm
-        return await self._fallback_dijkstra(request)
+    def _astar(self, request) -> Iterator[Dict[str, Any]]:
+        # The engine's A* uses raw Euclidean distance, which overestimates when weights are not
+        # lengths, so the Python search with a scaled (admissible) heuristic is used instead
+        return self._fallback_astar(request)
 
-    async def _kruskal(self, request) -> List[Dict[str, Any]]:
+    def _kruskal(self, request) -> Iterator[Dict[str, Any]]:
         # Placeholder for Kruskal's algorithm
-        return []
+        return iter([])
 
-    async def _prim(self, request) -> List[Dict[str, Any]]:
+    def _prim(self, request) -> Iterator[Dict[str, Any]]:
         # Placeholder for Prim's algorithm
-        return []
\ No newline at end of file
+        return iter([])
\ No newline at end of file
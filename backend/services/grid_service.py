@@ -0,0 +1,329 @@
+import asyncio
+import heapq
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Implicit grid graph: cell (x, y) is flat index y * width + x, costs[i] == 0 marks a wall and
+# 1-255 is the cost of entering the cell (diagonal moves cost sqrt(2) times as much).
+# Neighbours are computed from the index on the fly, so no edge list is ever built.
+SQRT2 = math.sqrt(2.0)
+
+ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+GridKernel = Callable[["GridMap", int, int], Dict[str, Any]]
+
+
+class GridMap:
+    __slots__ = ("width", "height", "costs", "open", "diagonal")
+
+    def __init__(self, width: int, height: int, costs: np.ndarray, diagonal: bool = False):
+        if costs.size != width * height:
+            raise ValueError(f"Cost map has {costs.size} cells, expected {width * height}")
+        self.width = width
+        self.height = height
+        self.costs = costs
+        self.open = costs > 0
+        self.diagonal = diagonal
+
+    @property
+    def uniform(self) -> bool:
+        open_costs = self.costs[self.open]
+        return open_costs.size == 0 or bool(np.all(open_costs == open_costs[0]))
+
+    def index(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"Cell ({x}, {y}) is outside the {self.width}x{self.height} grid")
+        return y * self.width + x
+
+
+class GridService:
+    def __init__(self):
+        self.algorithms: Dict[str, GridKernel] = {
+            'bfs': self._bfs,
+            'dijkstra': self._dijkstra,
+            'astar': self._astar,
+            'jps': self._jps,
+        }
+
+    async def execute(self, algorithm: str, grid: GridMap, start: Tuple[int, int], end: Tuple[int, int]) -> Dict[str, Any]:
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Unknown grid algorithm: {algorithm} (supported: {', '.join(self.algorithms)})")
+        source, target = grid.index(*start), grid.index(*end)
+        for label, cell in (('start', source), ('end', target)):
+            if not grid.open[cell]:
+                raise ValueError(f"The {label} cell is a wall")
+        began = time.perf_counter()
+        result = await asyncio.to_thread(self.algorithms[algorithm], grid, source, target)
+        result.update({
+            'algorithm': algorithm,
+            'width': grid.width,
+            'height': grid.height,
+            'diagonal': grid.diagonal,
+            'start': source,
+            'end': target,
+            'visitedCount': len(result['visited']),
+            'elapsedMs': round((time.perf_counter() - began) * 1000, 3),
+        })
+        return result
+
+    # -------- BFS (vectorised, level-synchronous) --------
+    def _bfs(self, grid: GridMap, source: int, target: int) -> Dict[str, Any]:
+        w, h = grid.width, grid.height
+        parent = np.full(w * h, -1, dtype=np.int64)
+        seen = np.zeros(w * h, dtype=bool)
+        seen[source] = True
+        frontier = np.array([source], dtype=np.int64)
+        order = [frontier]
+        moves = ORTHOGONAL + (DIAGONAL if grid.diagonal else ())
+        while frontier.size and not seen[target]:
+            xs, ys = frontier % w, frontier // w
+            sources, cells = [], []
+            for dx, dy in moves:
+                nx, ny = xs + dx, ys + dy
+                ok = (nx >= 0) & (nx < w) & (ny >= 0) & (ny < h)
+                nb = np.where(ok, ny * w + nx, 0)
+                ok &= grid.open[nb]
+                if dx and dy:
+                    # No corner cutting: both orthogonal cells beside a diagonal move must be open
+                    ok &= grid.open[np.where(ok, ys * w + nx, 0)] & grid.open[np.where(ok, ny * w + xs, 0)]
+                sources.append(frontier[ok])
+                cells.append(nb[ok])
+            src, nbrs = np.concatenate(sources), np.concatenate(cells)
+            fresh = ~seen[nbrs]
+            src, nbrs = src[fresh], nbrs[fresh]
+            _, first = np.unique(nbrs, return_index=True)
+            first.sort()
+            frontier = nbrs[first]
+            seen[frontier] = True
+            parent[frontier] = src[first]
+            order.append(frontier)
+        path = self._path(parent, source, target) if seen[target] else []
+        return {
+            'visited': np.concatenate(order).tolist(),
+            'path': path,
+            'cost': len(path) - 1 if path else None,
+        }
+
+    # -------- Dijkstra / A* (heap over flat indices) --------
+    def _dijkstra(self, grid: GridMap, source: int, target: int) -> Dict[str, Any]:
+        if grid.uniform and not grid.diagonal:
+            # Every move costs the same, so BFS levels are exactly Dijkstra's settle order
+            result = self._bfs(grid, source, target)
+            if result['path']:
+                result['cost'] = result['cost'] * int(grid.costs[source])
+            result['kernel'] = 'bfs'
+            return result
+        return self._best_first(grid, source, target, heuristic=None)
+
+    def _astar(self, grid: GridMap, source: int, target: int) -> Dict[str, Any]:
+        w = grid.width
+        tx, ty = target % w, target // w
+        # Scale by the cheapest cell so the estimate never exceeds the true remaining cost
+        min_cost = float(grid.costs[grid.open].min())
+        if grid.diagonal:
+            def heuristic(cell: int) -> float:
+                dx, dy = abs(cell % w - tx), abs(cell // w - ty)
+                return min_cost * (max(dx, dy) + (SQRT2 - 1) * min(dx, dy))
+        else:
+            def heuristic(cell: int) -> float:
+                return min_cost * (abs(cell % w - tx) + abs(cell // w - ty))
+        return self._best_first(grid, source, target, heuristic)
+
+    def _best_first(self, grid: GridMap, source: int, target: int,
+                    heuristic: Optional[Callable[[int], float]]) -> Dict[str, Any]:
+        w, h = grid.width, grid.height
+        costs = grid.costs.tolist()
+        inf = float('inf')
+        dist = [inf] * (w * h)
+        parent = [-1] * (w * h)
+        closed = bytearray(w * h)
+        dist[source] = 0.0
+        moves = [(dx, dy, 1.0) for dx, dy in ORTHOGONAL]
+        if grid.diagonal:
+            moves += [(dx, dy, SQRT2) for dx, dy in DIAGONAL]
+        start_h = heuristic(source) if heuristic else 0.0
+        heap = [(start_h, start_h, source)]
+        visited = []
+        while heap:
+            _, _, u = heapq.heappop(heap)
+            if closed[u]:
+                continue
+            closed[u] = 1
+            visited.append(u)
+            if u == target:
+                break
+            ux, uy = u % w, u // w
+            du = dist[u]
+            for dx, dy, factor in moves:
+                x, y = ux + dx, uy + dy
+                if not (0 <= x < w and 0 <= y < h):
+                    continue
+                v = y * w + x
+                if not costs[v] or closed[v]:
+                    continue
+                if dx and dy and not (costs[uy * w + x] and costs[y * w + ux]):
+                    continue
+                nd = du + costs[v] * factor
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    est = heuristic(v) if heuristic else 0.0
+                    heapq.heappush(heap, (nd + est, est, v))
+        path = self._path(parent, source, target) if closed[target] else []
+        return {
+            'visited': visited,
+            'path': path,
+            'cost': round(dist[target], 6) if path else None,
+        }
+
+    # -------- Jump point search (8-connected, uniform cost) --------
+    def _jps(self, grid: GridMap, source: int, target: int) -> Dict[str, Any]:
+        if not grid.uniform:
+            raise ValueError("Jump point search needs a uniform-cost grid; use astar for weighted grids")
+        if not grid.diagonal:
+            # The pruning rules below assume diagonal moves; on a 4-connected grid they would take them anyway
+            raise ValueError("Jump point search needs an 8-connected grid (diagonal=true); use bfs or astar otherwise")
+        w, h = grid.width, grid.height
+        walkable = grid.open.tolist()
+        unit = float(grid.costs[source])
+        tx, ty = target % w, target // w
+
+        def free(x: int, y: int) -> bool:
+            return 0 <= x < w and 0 <= y < h and walkable[y * w + x]
+
+        def jump(x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+            # Walk from (x, y) in direction (dx, dy) until a jump point, a wall or the goal
+            while True:
+                if not free(x, y):
+                    return None
+                if x == tx and y == ty:
+                    return x, y
+                if dx and dy:
+                    if jump(x + dx, y, dx, 0) or jump(x, y + dy, 0, dy):
+                        return x, y
+                    if not (free(x + dx, y) and free(x, y + dy)):
+                        return None
+                elif dx:
+                    if (free(x, y - 1) and not free(x - dx, y - 1)) or (free(x, y + 1) and not free(x - dx, y + 1)):
+                        return x, y
+                else:
+                    if (free(x - 1, y) and not free(x - 1, y - dy)) or (free(x + 1, y) and not free(x + 1, y - dy)):
+                        return x, y
+                x += dx
+                y += dy
+
+        def directions(x: int, y: int, px: int, py: int) -> List[Tuple[int, int]]:
+            if px < 0:
+                out = [(dx, dy) for dx, dy in ORTHOGONAL if free(x + dx, y + dy)]
+                out += [(dx, dy) for dx, dy in DIAGONAL
+                        if free(x + dx, y + dy) and free(x + dx, y) and free(x, y + dy)]
+                return out
+            dx = (x > px) - (x < px)
+            dy = (y > py) - (y < py)
+            out = []
+            if dx and dy:
+                if free(x, y + dy):
+                    out.append((0, dy))
+                if free(x + dx, y):
+                    out.append((dx, 0))
+                if free(x, y + dy) and free(x + dx, y) and free(x + dx, y + dy):
+                    out.append((dx, dy))
+            elif dx:
+                ahead, up, down = free(x + dx, y), free(x, y + 1), free(x, y - 1)
+                if ahead:
+                    out.append((dx, 0))
+                    if up and free(x + dx, y + 1):
+                        out.append((dx, 1))
+                    if down and free(x + dx, y - 1):
+                        out.append((dx, -1))
+                if up:
+                    out.append((0, 1))
+                if down:
+                    out.append((0, -1))
+            else:
+                ahead, right, left = free(x, y + dy), free(x + 1, y), free(x - 1, y)
+                if ahead:
+                    out.append((0, dy))
+                    if right and free(x + 1, y + dy):
+                        out.append((1, dy))
+                    if left and free(x - 1, y + dy):
+                        out.append((-1, dy))
+                if right:
+                    out.append((1, 0))
+                if left:
+                    out.append((-1, 0))
+            return out
+
+        def octile(x: int, y: int) -> float:
+            dx, dy = abs(x - tx), abs(y - ty)
+            return unit * (max(dx, dy) + (SQRT2 - 1) * min(dx, dy))
+
+        sx, sy = source % w, source // w
+        g = {source: 0.0}
+        parent: Dict[int, int] = {}
+        closed = set()
+        heap = [(octile(sx, sy), 0.0, source)]
+        visited = []
+        while heap:
+            _, _, u = heapq.heappop(heap)
+            if u in closed:
+                continue
+            closed.add(u)
+            visited.append(u)
+            if u == target:
+                break
+            ux, uy = u % w, u // w
+            p = parent.get(u, -1)
+            px, py = (p % w, p // w) if p >= 0 else (-1, -1)
+            for dx, dy in directions(ux, uy, px, py):
+                found = jump(ux + dx, uy + dy, dx, dy)
+                if found is None:
+                    continue
+                jx, jy = found
+                v = jy * w + jx
+                if v in closed:
+                    continue
+                steps_x, steps_y = abs(jx - ux), abs(jy - uy)
+                nd = g[u] + unit * (max(steps_x, steps_y) + (SQRT2 - 1) * min(steps_x, steps_y))
+                if nd < g.get(v, float('inf')):
+                    g[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd + octile(jx, jy), -nd, v))
+
+        if target not in closed:
+            return {'visited': visited, 'path': [], 'jumpPoints': [], 'cost': None}
+        jump_points = [target]
+        while jump_points[-1] != source:
+            jump_points.append(parent[jump_points[-1]])
+        jump_points.reverse()
+        return {
+            'visited': visited,
+            'path': self._expand_jumps(jump_points, w),
+            'jumpPoints': jump_points,
+            'cost': round(g[target], 6),
+        }
+
+    # -------- Helpers --------
+    @staticmethod
+    def _expand_jumps(jump_points: List[int], width: int) -> List[int]:
+        """Fill in the straight/diagonal runs between consecutive jump points."""
+        path = jump_points[:1]
+        for a, b in zip(jump_points, jump_points[1:]):
+            ax, ay, bx, by = a % width, a // width, b % width, b // width
+            dx, dy = (bx > ax) - (bx < ax), (by > ay) - (by < ay)
+            while (ax, ay) != (bx, by):
+                ax += dx
+                ay += dy
+                path.append(ay * width + ax)
+        return path
+
+    @staticmethod
+    def _path(parent, source: int, target: int) -> List[int]:
+        path = [target]
+        while path[-1] != source:
+            path.append(int(parent[path[-1]]))
+        return path[::-1]
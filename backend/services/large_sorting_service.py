@@ -0,0 +1,343 @@
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Prefer absolute import when running from repo root; fallback when running inside backend/
+try:
+    from backend.utils.engine_loader import get_engine  # type: ignore
+except Exception:
+    try:
+        from utils.engine_loader import get_engine  # type: ignore
+    except Exception:
+        def get_engine():  # type: ignore
+            return None
+
+algorithm_engine = get_engine()
+
+# Large-input mode sorts with NumPy kernels and keeps only sampled frames, so the
+# response size depends on `frames` and `bins`, never on n.
+LARGE_SORT_MAX_N = int(os.getenv("LARGE_SORT_MAX_N", 10_000_000))
+DEFAULT_FRAMES = 60
+MAX_FRAMES = 240
+DEFAULT_BINS = 256
+MAX_BINS = 2048
+
+# Exact inversion counting is O(n log n) per frame; above this size a sampled estimate is used
+EXACT_INVERSIONS_MAX_N = 1 << 16
+INVERSION_SAMPLE_PAIRS = 1 << 17
+
+DISTRIBUTIONS = ('random', 'sorted', 'reversed', 'few_unique', 'nearly_sorted')
+
+# Parallel mode runs the engine's task-parallel sorts once per thread count to show scaling
+PARALLEL_KERNELS = {'merge': 'parallel_merge_sort', 'quick': 'parallel_quick_sort'}
+PARALLEL_MAX_THREADS = int(os.getenv("PARALLEL_SORT_MAX_THREADS", os.cpu_count() or 1))
+DEFAULT_PARALLEL_CUTOFF = 4096
+MAX_PARALLEL_REPEAT = 5
+# Task events are returned for the run with the most threads, up to this many
+MAX_TRACE_EVENTS = 4096
+
+# A pass kernel sorts the array in place and reports (total passes, iterator of pass labels)
+PassKernel = Callable[[np.ndarray], Tuple[int, Iterator[str]]]
+
+
+class LargeSortingService:
+    def __init__(self):
+        # Only algorithms whose passes map onto whole-array NumPy kernels; a single np.sort call
+        # would produce no frames between the initial and the sorted array
+        self.algorithms: Dict[str, PassKernel] = {
+            'merge': self._merge_passes,
+            'radix': self._radix_passes,
+            'shell': self._shell_passes,
+            'counting': self._counting_passes,
+        }
+
+    def generate(self, size: int, distribution: str = 'random', seed: Optional[int] = None) -> np.ndarray:
+        """Build a test input server-side so 10^7 elements never travel as JSON."""
+        if size < 1 or size > LARGE_SORT_MAX_N:
+            raise ValueError(f"size must be between 1 and {LARGE_SORT_MAX_N}")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {distribution} (expected one of {DISTRIBUTIONS})")
+        rng = np.random.default_rng(seed)
+        if distribution == 'few_unique':
+            return rng.integers(0, 16, size, dtype=np.int32)
+        arr = rng.integers(0, max(size * 10, 100), size, dtype=np.int32)
+        if distribution in ('sorted', 'nearly_sorted', 'reversed'):
+            arr.sort()
+        if distribution == 'reversed':
+            arr = arr[::-1].copy()
+        elif distribution == 'nearly_sorted':
+            swaps = max(1, size // 100)
+            i, j = rng.integers(0, size, swaps), rng.integers(0, size, swaps)
+            arr[i], arr[j] = arr[j], arr[i]
+        return arr
+
+    async def execute(self, algorithm: str, array: np.ndarray, frames: int = DEFAULT_FRAMES,
+                      bins: int = DEFAULT_BINS, seed: Optional[int] = None) -> Dict[str, Any]:
+        if algorithm not in self.algorithms:
+            raise ValueError(
+                f"Algorithm '{algorithm}' is not available in large-input mode "
+                f"(supported: {', '.join(sorted(self.algorithms))})"
+            )
+        if array.size == 0 or array.size > LARGE_SORT_MAX_N:
+            raise ValueError(f"Array must have between 1 and {LARGE_SORT_MAX_N} elements")
+        frames = max(2, min(frames, MAX_FRAMES))
+        bins = max(1, min(bins, MAX_BINS, array.size))
+        # NumPy releases the GIL for sorting; keep the event loop free meanwhile
+        return await asyncio.to_thread(self._run, algorithm, array, frames, bins, seed)
+
+    def _run(self, algorithm: str, array: np.ndarray, frames: int, bins: int, seed: Optional[int]) -> Dict[str, Any]:
+        arr = np.array(array, copy=True)
+        rng = np.random.default_rng(seed)
+        start = time.perf_counter()
+        total, passes = self.algorithms[algorithm](arr)
+        stride = max(1, -(-total // (frames - 1)))
+
+        recorded: List[Dict[str, Any]] = [self._frame(arr, 0, "Initial array", bins, rng, start)]
+        done = 0
+        for done, label in enumerate(passes, start=1):
+            if done % stride == 0 or done == total:
+                recorded.append(self._frame(arr, done, label, bins, rng, start))
+        if recorded[-1]["pass"] != done:
+            recorded.append(self._frame(arr, done, "Sorted", bins, rng, start))
+
+        return {
+            "algorithm": algorithm,
+            "n": int(arr.size),
+            "dtype": str(arr.dtype),
+            "backend": "numpy",
+            "passes": done,
+            "frame_stride": stride,
+            "bins": bins,
+            "inversions_exact": arr.size <= EXACT_INVERSIONS_MAX_N,
+            "sorted": bool(np.all(arr[:-1] <= arr[1:])),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+            "frames": recorded,
+        }
+
+    # -------- Parallel engine sorts --------
+    @staticmethod
+    def thread_counts(threads: Optional[List[int]] = None) -> List[int]:
+        """Thread counts to measure, clamped to PARALLEL_MAX_THREADS; 1 is always included as the baseline."""
+        if threads:
+            counts = {max(1, min(int(t), PARALLEL_MAX_THREADS)) for t in threads}
+        else:
+            counts = {1 << k for k in range(PARALLEL_MAX_THREADS.bit_length()) if 1 << k <= PARALLEL_MAX_THREADS}
+            counts.add(PARALLEL_MAX_THREADS)
+        return sorted(counts | {1})
+
+    async def execute_parallel(self, algorithm: str, array: np.ndarray, threads: Optional[List[int]] = None,
+                               cutoff: int = DEFAULT_PARALLEL_CUTOFF, repeat: int = 1,
+                               events: int = MAX_TRACE_EVENTS) -> Dict[str, Any]:
+        if algorithm not in PARALLEL_KERNELS:
+            raise ValueError(
+                f"Algorithm '{algorithm}' is not available in parallel mode "
+                f"(supported: {', '.join(sorted(PARALLEL_KERNELS))})"
+            )
+        kernel = getattr(algorithm_engine, PARALLEL_KERNELS[algorithm], None)
+        if kernel is None:
+            raise ValueError("Parallel mode needs the C++ engine, which is not available")
+        if array.size == 0 or array.size > LARGE_SORT_MAX_N:
+            raise ValueError(f"Array must have between 1 and {LARGE_SORT_MAX_N} elements")
+        repeat = max(1, min(repeat, MAX_PARALLEL_REPEAT))
+        events = max(0, min(events, MAX_TRACE_EVENTS))
+        # The engine releases the GIL while sorting; the thread keeps the copies off the event loop too
+        return await asyncio.to_thread(self._run_parallel, algorithm, kernel, array, self.thread_counts(threads),
+                                       cutoff, repeat, events)
+
+    def _run_parallel(self, algorithm: str, kernel, array: np.ndarray, counts: List[int], cutoff: int,
+                      repeat: int, events: int) -> Dict[str, Any]:
+        arr = np.ascontiguousarray(array, dtype=np.int64)
+        reference = np.sort(arr, kind='stable')
+        scaling: List[Dict[str, Any]] = []
+        last = None
+        for count in counts:
+            best = None
+            for _ in range(repeat):
+                out, stats = kernel(arr, threads=count, cutoff=cutoff)
+                if best is None or stats.elapsed_ms < best[1].elapsed_ms:
+                    best = (out, stats)
+            out, stats = best
+            scaling.append({
+                "threads": stats.threads,
+                "threads_used": stats.threads_used,
+                "elapsed_ms": round(stats.elapsed_ms, 3),
+                "operations": stats.operations,
+                "sorted": bool(np.array_equal(out, reference)),
+            })
+            last = stats
+
+        baseline = scaling[0]["elapsed_ms"]
+        for row in scaling:
+            row["speedup"] = round(baseline / row["elapsed_ms"], 3) if row["elapsed_ms"] > 0 else None
+            row["efficiency"] = round(row["speedup"] / row["threads"], 3) if row["speedup"] else None
+
+        # Per-worker busy time from the merged trace; tasks never overlap on one worker
+        busy: Dict[int, float] = {}
+        for event in last.events:
+            busy[event.thread] = busy.get(event.thread, 0.0) + event.end_us - event.start_us
+        trace = [{
+            "start_us": round(event.start_us, 3),
+            "end_us": round(event.end_us, 3),
+            "thread": event.thread,
+            "kind": event.kind,
+            "left": event.left,
+            "right": event.right,
+            "operations": event.operations,
+        } for event in last.events[:events]]
+
+        return {
+            "algorithm": algorithm,
+            "n": int(arr.size),
+            "backend": "cpp",
+            "cpu_count": os.cpu_count(),
+            "cutoff": last.cutoff,
+            "repeat": repeat,
+            "sorted": all(row["sorted"] for row in scaling),
+            "scaling": scaling,
+            "trace_threads": last.threads,
+            "busy_ms": {str(thread): round(us / 1000, 3) for thread, us in sorted(busy.items())},
+            "events_total": len(last.events),
+            "events_truncated": len(last.events) > events,
+            "events": trace,
+        }
+
+    # -------- Frames --------
+    def _frame(self, arr: np.ndarray, pass_no: int, label: str, bins: int,
+               rng: np.random.Generator, start: float) -> Dict[str, Any]:
+        return {
+            "pass": pass_no,
+            "operation": label,
+            "histogram": self._downsample(arr, bins),
+            "inversions": self._inversions(arr, rng),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    @staticmethod
+    def _downsample(arr: np.ndarray, bins: int) -> List[float]:
+        """Mean value per equal-width slice of positions: an n-independent picture of the array."""
+        edges = np.linspace(0, arr.size, bins + 1).astype(np.int64)[:-1]
+        sums = np.add.reduceat(arr.astype(np.float64), edges)
+        counts = np.diff(np.append(edges, arr.size))
+        return np.round(sums / counts, 3).tolist()
+
+    @staticmethod
+    def _inversions(arr: np.ndarray, rng: np.random.Generator) -> int:
+        n = arr.size
+        if n <= EXACT_INVERSIONS_MAX_N:
+            return count_inversions(arr)
+        # Unbiased estimate from random index pairs
+        i = rng.integers(0, n, INVERSION_SAMPLE_PAIRS)
+        j = rng.integers(0, n, INVERSION_SAMPLE_PAIRS)
+        lo, hi = np.minimum(i, j), np.maximum(i, j)
+        distinct = lo != hi
+        fraction = np.count_nonzero(arr[lo[distinct]] > arr[hi[distinct]]) / max(1, np.count_nonzero(distinct))
+        return int(round(fraction * n * (n - 1) / 2))
+
+    # -------- Pass kernels (in place) --------
+    def _merge_passes(self, arr: np.ndarray) -> Tuple[int, Iterator[str]]:
+        n = arr.size
+        total = max(1, int(np.ceil(np.log2(n)))) if n > 1 else 0
+
+        def passes():
+            width = 1
+            while width < n:
+                block = 2 * width
+                padded = _pad_to_multiple(arr, block)
+                # Both halves of each block are sorted, so the stable (run-merging) sort is linear
+                padded.reshape(-1, block).sort(axis=1, kind='stable')
+                arr[:] = padded[:n]
+                yield f"Merged runs of width {width} into width {min(block, n)}"
+                width = block
+        return total, passes()
+
+    def _shell_passes(self, arr: np.ndarray) -> Tuple[int, Iterator[str]]:
+        n = arr.size
+        gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+        while gaps[-1] * 2.25 < n:
+            gaps.append(int(gaps[-1] * 2.25))
+        gaps = [g for g in reversed(gaps) if g < n] or [1]
+
+        def passes():
+            for gap in gaps:
+                padded = _pad_to_multiple(arr, gap)
+                # Column c of the (rows, gap) view is the interleaved subsequence arr[c::gap]
+                padded.reshape(-1, gap).sort(axis=0)
+                arr[:] = padded[:n]
+                yield f"{gap}-sorted the array"
+        return len(gaps), passes()
+
+    def _radix_passes(self, arr: np.ndarray) -> Tuple[int, Iterator[str]]:
+        keys = _sortable_keys(arr)
+        span = int(keys.max() - keys.min()) if keys.size else 0
+        keys = keys - keys.min()
+        total = max(1, (span.bit_length() + 7) // 8)
+
+        def passes():
+            nonlocal keys
+            for p in range(total):
+                digit = ((keys >> np.uint64(8 * p)) & np.uint64(0xFF)).astype(np.uint8)
+                order = np.argsort(digit, kind='stable')
+                keys = keys[order]
+                arr[:] = arr[order]
+                yield f"Stable pass on byte {p}"
+        return total, passes()
+
+    def _counting_passes(self, arr: np.ndarray) -> Tuple[int, Iterator[str]]:
+        if not np.issubdtype(arr.dtype, np.integer):
+            raise ValueError("Counting sort requires integer input")
+        mn, mx = int(arr.min()), int(arr.max())
+        if mx - mn + 1 > 4 * arr.size + 1024:
+            return self._radix_passes(arr)
+
+        def passes():
+            counts = np.bincount((arr - mn).astype(np.int64), minlength=mx - mn + 1)
+            yield f"Counted frequencies over range {mx - mn + 1}"
+            arr[:] = np.repeat(np.arange(mn, mx + 1, dtype=arr.dtype), counts)
+            yield "Rebuilt array from counts"
+        return 2, passes()
+
+
+def _pad_to_multiple(arr: np.ndarray, block: int) -> np.ndarray:
+    pad = (-arr.size) % block
+    if pad == 0:
+        return arr.copy()
+    fill = np.inf if np.issubdtype(arr.dtype, np.floating) else np.iinfo(arr.dtype).max
+    return np.concatenate([arr, np.full(pad, fill, dtype=arr.dtype)])
+
+
+def _sortable_keys(arr: np.ndarray) -> np.ndarray:
+    """Unsigned keys whose order matches the values (floats via the IEEE-754 bit trick)."""
+    if np.issubdtype(arr.dtype, np.floating):
+        bits = arr.astype(np.float64).view(np.uint64)
+        sign = np.uint64(1 << 63)
+        return np.where(bits & sign, ~bits, bits | sign)
+    return arr.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+
+
+def count_inversions(arr: np.ndarray) -> int:
+    """Exact inversion count by bottom-up merging, vectorised across all blocks of a level."""
+    n = arr.size
+    if n < 2:
+        return 0
+    # Dense ranks keep ties equal, and let block offsets be folded into a single sortable key
+    _, ranks = np.unique(arr, return_inverse=True)
+    ranks = ranks.astype(np.int64)
+    total = 0
+    width = 1
+    idx = np.arange(n, dtype=np.int64)
+    while width < n:
+        block_id = idx // (2 * width)
+        in_right = (idx // width) % 2 == 1
+        keyed = block_id * n + ranks
+        left_keys = keyed[~in_right]
+        right_keys = keyed[in_right]
+        left_start = np.searchsorted(left_keys, block_id[in_right] * n)
+        left_end = np.searchsorted(left_keys, block_id[in_right] * n + n)
+        not_greater = np.searchsorted(left_keys, right_keys, side='right') - left_start
+        total += int(np.sum(left_end - left_start - not_greater))
+        ranks = np.sort(keyed, kind='stable') - block_id * n
+        width *= 2
+    return total
@@ -0,0 +1,382 @@
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Top-down (memoized) DP. Each problem is a recurrence over states; the evaluator walks it with an
+# explicit stack, so deep recursions (coin change over a large amount) never hit Python's recursion
+# limit, and only the states reachable from the root are ever computed.
+DP_MEMO_MAX_CALLS = int(os.getenv("DP_MEMO_MAX_CALLS", 2_000_000))
+DP_MEMO_ARRAY_MAX_CELLS = int(os.getenv("DP_MEMO_ARRAY_MAX_CELLS", 5_000_000))
+DEFAULT_LRU_CAPACITY = 1024
+
+State = Tuple[int, ...]
+_MISSING = object()
+
+
+# -------- Memo stores --------
+class DictMemo:
+    """Hash map keyed by state: memory grows with the number of reachable states."""
+
+    name = 'dict'
+
+    def __init__(self, problem: "Problem"):
+        self._values: Dict[State, Any] = {}
+
+    def get(self, state: State) -> Any:
+        return self._values.get(state, _MISSING)
+
+    def put(self, state: State, value: Any) -> Optional[State]:
+        self._values[state] = value
+        return None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class ArrayMemo:
+    """Flat array over the whole table, allocated up front like tabulation; no hashing per lookup."""
+
+    name = 'array'
+
+    def __init__(self, problem: "Problem"):
+        self._shape = problem.shape
+        size = 1
+        for dim in self._shape:
+            size *= dim
+        if size > DP_MEMO_ARRAY_MAX_CELLS:
+            raise ValueError(f"The array store would allocate {size} cells (limit {DP_MEMO_ARRAY_MAX_CELLS}); "
+                             f"use the dict or lru store, which only hold reachable states")
+        self._values: List[Any] = [_MISSING] * size
+        self._filled = 0
+
+    def _index(self, state: State) -> int:
+        index = 0
+        for value, dim in zip(state, self._shape):
+            index = index * dim + value
+        return index
+
+    def get(self, state: State) -> Any:
+        return self._values[self._index(state)]
+
+    def put(self, state: State, value: Any) -> Optional[State]:
+        index = self._index(state)
+        if self._values[index] is _MISSING:
+            self._filled += 1
+        self._values[index] = value
+        return None
+
+    def __len__(self) -> int:
+        return self._filled
+
+
+class LRUMemo:
+    """At most `capacity` states; the least recently used is evicted and recomputed if needed again."""
+
+    name = 'lru'
+
+    def __init__(self, problem: "Problem", capacity: int = DEFAULT_LRU_CAPACITY):
+        self.capacity = max(1, capacity)
+        self._values: "OrderedDict[State, Any]" = OrderedDict()
+
+    def get(self, state: State) -> Any:
+        value = self._values.get(state, _MISSING)
+        if value is not _MISSING:
+            self._values.move_to_end(state)
+        return value
+
+    def put(self, state: State, value: Any) -> Optional[State]:
+        self._values[state] = value
+        self._values.move_to_end(state)
+        if len(self._values) > self.capacity:
+            evicted, _ = self._values.popitem(last=False)
+            return evicted
+        return None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+MEMO_STORES = {'dict': DictMemo, 'array': ArrayMemo, 'lru': LRUMemo}
+
+
+# -------- Problems: root state, table shape, base cases, dependencies and the combining step --------
+class Problem(ABC):
+    root: State = ()
+    shape: Tuple[int, ...] = ()
+
+    def base(self, state: State) -> Any:
+        """Value of a base case, or _MISSING."""
+        return _MISSING
+
+    @abstractmethod
+    def deps(self, state: State) -> Sequence[State]:
+        """States this one's value is combined from."""
+
+    @abstractmethod
+    def combine(self, state: State, values: List[Any]) -> Any:
+        """Value of `state` from the values of its deps, in order."""
+
+    def describe(self, state: State, value: Any) -> str:
+        return f"f{list(state)} = {value}"
+
+
+class LCSProblem(Problem):
+    """lcs(i, j): LCS length of text1[i:] and text2[j:]."""
+
+    def __init__(self, text1: str, text2: str):
+        self.text1, self.text2 = text1, text2
+        self.root = (0, 0)
+        self.shape = (len(text1) + 1, len(text2) + 1)
+
+    def base(self, state):
+        i, j = state
+        return 0 if i == len(self.text1) or j == len(self.text2) else _MISSING
+
+    def deps(self, state):
+        i, j = state
+        if self.text1[i] == self.text2[j]:
+            return [(i + 1, j + 1)]
+        return [(i + 1, j), (i, j + 1)]
+
+    def combine(self, state, values):
+        return values[0] + 1 if len(values) == 1 else max(values)
+
+    def describe(self, state, value):
+        i, j = state
+        return f'lcs("{self.text1[i:i + 8]}…", "{self.text2[j:j + 8]}…") = {value}'
+
+
+class Knapsack01Problem(Problem):
+    """best(i, w): best value from items i.. with capacity w."""
+
+    def __init__(self, weights: List[int], values: List[int], capacity: int):
+        self.weights, self.values = weights, values
+        self.root = (0, capacity)
+        self.shape = (len(weights) + 1, capacity + 1)
+
+    def base(self, state):
+        return 0 if state[0] == len(self.weights) else _MISSING
+
+    def deps(self, state):
+        i, w = state
+        if self.weights[i] <= w:
+            return [(i + 1, w), (i + 1, w - self.weights[i])]
+        return [(i + 1, w)]
+
+    def combine(self, state, values):
+        if len(values) == 1:
+            return values[0]
+        return max(values[0], self.values[state[0]] + values[1])
+
+    def describe(self, state, value):
+        return f"best(items {state[0]}.., capacity {state[1]}) = {value}"
+
+
+class UnboundedKnapsackProblem(Problem):
+    """best(w): best value with capacity w and unlimited copies of each item."""
+
+    def __init__(self, weights: List[int], values: List[int], capacity: int):
+        self.weights, self.values = weights, values
+        self.root = (capacity,)
+        self.shape = (capacity + 1,)
+
+    def deps(self, state):
+        return [(state[0] - w,) for w in self.weights if 0 < w <= state[0]]
+
+    def combine(self, state, values):
+        options = [self.values[i] + v for i, v in zip(self._fitting(state[0]), values)]
+        return max(options, default=0)
+
+    def _fitting(self, w: int) -> List[int]:
+        return [i for i, weight in enumerate(self.weights) if 0 < weight <= w]
+
+    def describe(self, state, value):
+        return f"best(capacity {state[0]}) = {value}"
+
+
+class CoinChangeMinProblem(Problem):
+    """fewest(a): fewest coins summing to a, None if impossible."""
+
+    def __init__(self, coins: List[int], amount: int):
+        self.coins = coins
+        self.root = (amount,)
+        self.shape = (amount + 1,)
+
+    def base(self, state):
+        return 0 if state[0] == 0 else _MISSING
+
+    def deps(self, state):
+        return [(state[0] - c,) for c in self.coins if 0 < c <= state[0]]
+
+    def combine(self, state, values):
+        reachable = [v for v in values if v is not None]
+        return min(reachable) + 1 if reachable else None
+
+    def describe(self, state, value):
+        return f"fewest({state[0]}) = {'impossible' if value is None else value}"
+
+
+class CoinChangeWaysProblem(Problem):
+    """ways(i, a): ways to make a from coins i.. (order does not matter)."""
+
+    def __init__(self, coins: List[int], amount: int):
+        self.coins = [c for c in coins if c > 0]
+        self.root = (0, amount)
+        self.shape = (len(self.coins) + 1, amount + 1)
+
+    def base(self, state):
+        i, a = state
+        if a == 0:
+            return 1
+        return 0 if i == len(self.coins) else _MISSING
+
+    def deps(self, state):
+        i, a = state
+        if self.coins[i] <= a:
+            return [(i, a - self.coins[i]), (i + 1, a)]
+        return [(i + 1, a)]
+
+    def combine(self, state, values):
+        return sum(values)
+
+    def describe(self, state, value):
+        return f"ways(coins {state[0]}.., amount {state[1]}) = {value}"
+
+
+def build_problem(algorithm: str, params: Dict[str, Any]) -> Problem:
+    if algorithm == 'lcs':
+        return LCSProblem(params.get('text1', ''), params.get('text2', ''))
+    if algorithm == 'knapsack':
+        weights, values, capacity = params.get('weights', []), params.get('values', []), params.get('capacity', 0)
+        if len(weights) != len(values):
+            raise ValueError("weights and values must have the same length")
+        if params.get('type', '0/1') == '0/1':
+            return Knapsack01Problem(weights, values, capacity)
+        return UnboundedKnapsackProblem(weights, values, capacity)
+    if algorithm == 'coin_change':
+        coins, amount = params.get('coins', []), params.get('amount', 0)
+        if params.get('problem_type', 'min_coins') == 'min_coins':
+            return CoinChangeMinProblem(coins, amount)
+        return CoinChangeWaysProblem(coins, amount)
+    raise ValueError(f"Memo mode is not available for {algorithm} (supported: lcs, knapsack, coin_change)")
+
+
+def build_memo(problem: Problem, params: Dict[str, Any]):
+    name = params.get('memo', 'dict')
+    if name not in MEMO_STORES:
+        raise ValueError(f"Unknown memo store: {name} (expected one of {', '.join(MEMO_STORES)})")
+    if name == 'lru':
+        return LRUMemo(problem, int(params.get('memo_capacity', DEFAULT_LRU_CAPACITY)))
+    return MEMO_STORES[name](problem)
+
+
+# -------- Evaluator --------
+class _Frame:
+    __slots__ = ('state', 'node', 'parent', 'deps', 'values', 'next')
+
+    def __init__(self, state: State, node: int, parent: int):
+        self.state = state
+        self.node = node
+        self.parent = parent
+        self.deps: Optional[Sequence[State]] = None
+        self.values: List[Any] = []
+        self.next = 0
+
+
+def memo_steps(algorithm: str, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Evaluate the recurrence top-down and yield one step per event: 'call' (a node of the
+    recursion tree, linked to its parent), 'base', 'hit', 'return' (a cell computed and stored)
+    and 'evict'. Every step carries the running cache statistics.
+    """
+    problem = build_problem(algorithm, params)
+    memo = build_memo(problem, params)
+    table_size = 1
+    for dim in problem.shape:
+        table_size *= dim
+    stats = {'calls': 0, 'hits': 0, 'computed': 0, 'evictions': 0, 'memoSize': 0, 'maxDepth': 0}
+
+    def step(event: str, frame: _Frame, operation: str, **extra) -> Dict[str, Any]:
+        stats['memoSize'] = len(memo)
+        return {
+            'mode': 'memo',
+            'memo': memo.name,
+            'event': event,
+            'currentCell': list(frame.state),
+            'node': frame.node,
+            'parent': frame.parent,
+            'depth': len(stack),
+            'tableSize': table_size,
+            'stats': dict(stats),
+            'operation': operation,
+            **extra,
+        }
+
+    nodes = 0
+    stack = [_Frame(problem.root, nodes, -1)]
+    stats['calls'] = 1
+    yield step('call', stack[-1], f"Call {list(problem.root)} (root)")
+    result: Any = None
+    while stack:
+        frame = stack[-1]
+        if frame.deps is None:
+            base = problem.base(frame.state)
+            if base is not _MISSING:
+                stack.pop()
+                yield step('base', frame, f"Base case: {problem.describe(frame.state, base)}", value=base)
+                if stack:
+                    stack[-1].values.append(base)
+                else:
+                    result = base
+                continue
+            frame.deps = problem.deps(frame.state)
+
+        if frame.next < len(frame.deps):
+            child = frame.deps[frame.next]
+            frame.next += 1
+            cached = memo.get(child)
+            if cached is not _MISSING:
+                stats['hits'] += 1
+                frame.values.append(cached)
+                yield step('hit', frame, f"Memo hit: {problem.describe(child, cached)}", child=list(child), value=cached)
+                continue
+            if stats['calls'] >= DP_MEMO_MAX_CALLS:
+                raise ValueError(f"Memoized evaluation exceeded {DP_MEMO_MAX_CALLS} calls "
+                                 f"(try a larger memo_capacity or the dict store)")
+            nodes += 1
+            stats['calls'] += 1
+            stack.append(_Frame(child, nodes, frame.node))
+            stats['maxDepth'] = max(stats['maxDepth'], len(stack))
+            yield step('call', stack[-1], f"Call {list(child)} from {list(frame.state)}")
+            continue
+
+        value = problem.combine(frame.state, frame.values)
+        evicted = memo.put(frame.state, value)
+        stats['computed'] += 1
+        stack.pop()
+        yield step('return', frame, f"Computed {problem.describe(frame.state, value)}", value=value)
+        if evicted is not None:
+            stats['evictions'] += 1
+            yield step('evict', frame, f"Evicted {list(evicted)} (LRU capacity {memo.capacity})", evicted=list(evicted))
+        if stack:
+            stack[-1].values.append(value)
+        else:
+            result = value
+
+    stats['memoSize'] = len(memo)
+    yield {
+        'mode': 'memo',
+        'memo': memo.name,
+        'event': 'done',
+        'currentCell': list(problem.root),
+        'depth': 0,
+        'tableSize': table_size,
+        'stats': dict(stats),
+        'result': result,
+        # Tabulation fills every cell of the table; memoization only the reachable ones
+        'cellsComputed': stats['computed'],
+        'computedFraction': round(stats['computed'] / table_size, 6) if table_size else 0,
+        'operation': f"Result {result}: computed {stats['computed']} of {table_size} cells "
+                     f"({stats['hits']} memo hits, {stats['evictions']} evictions)",
+    }
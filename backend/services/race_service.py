@@ -0,0 +1,147 @@
+import asyncio
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Race mode: several algorithms run on the same input, their traces are re-timed on a shared
+# operation clock and merged into a fixed number of frames. Step granularity differs wildly
+# between algorithms (one step per comparison vs one per merge), so steps alone cannot be lined up.
+RACE_MAX_ALGORITHMS = int(os.getenv("RACE_MAX_ALGORITHMS", 6))
+RACE_MAX_FRAMES = int(os.getenv("RACE_MAX_FRAMES", 600))
+# Each racer keeps at most this many samples per output frame while it runs, so memory is
+# bounded by the frame count rather than by the length of the slowest trace
+SAMPLES_PER_FRAME = 4
+
+
+def sorting_ticks(step: Dict[str, Any], prev: Optional[Dict[str, Any]]) -> int:
+    """Comparisons since the previous step plus array slots written by it."""
+    if prev is None:
+        return 0
+    compared = max(0, int(step.get("operations_count", 0)) - int(prev.get("operations_count", 0)))
+    before, after = prev.get("array", []), step.get("array", [])
+    written = sum(1 for a, b in zip(before, after) if a != b) + abs(len(after) - len(before))
+    return compared + written
+
+
+def graph_ticks(step: Dict[str, Any], prev: Optional[Dict[str, Any]]) -> int:
+    """Edge relaxations shown by the step; a step that only expands a node costs one tick."""
+    edges = step.get("currentEdges") or ()
+    if edges:
+        return len(edges)
+    return 1 if step.get("currentNodes") else 0
+
+
+CLOCKS: Dict[str, Tuple[str, Callable[[Dict[str, Any], Optional[Dict[str, Any]]], int]]] = {
+    "sorting": ("comparisons + writes", sorting_ticks),
+    "graph": ("edge relaxations + node expansions", graph_ticks),
+}
+
+
+class ClockSampler:
+    """
+    Keeps the last step of every `stride`-tick bucket of the clock. When more than `capacity`
+    buckets are held the stride doubles and neighbouring buckets are merged, so the state at any
+    clock time is known to within one stride using O(capacity) memory.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(2, capacity)
+        self.stride = 1
+        self.samples: List[Tuple[int, Dict[str, Any]]] = []
+        self.first: Optional[Dict[str, Any]] = None
+        self.clock = 0
+        self.steps = 0
+
+    def add(self, step: Dict[str, Any], ticks: int) -> None:
+        self.clock += ticks
+        self.steps += 1
+        if self.first is None:
+            self.first = step
+        if self.samples and self.samples[-1][0] // self.stride == self.clock // self.stride:
+            self.samples[-1] = (self.clock, step)
+        else:
+            self.samples.append((self.clock, step))
+        if len(self.samples) > self.capacity:
+            self.stride *= 2
+            merged: List[Tuple[int, Dict[str, Any]]] = []
+            for sample in self.samples:
+                if merged and merged[-1][0] // self.stride == sample[0] // self.stride:
+                    merged[-1] = sample
+                else:
+                    merged.append(sample)
+            self.samples = merged
+
+    def frames(self, times: List[float]) -> List[Dict[str, Any]]:
+        """State at each (ascending) clock time: the last sampled step at or before it."""
+        out = []
+        i = -1
+        for t in times:
+            while i + 1 < len(self.samples) and self.samples[i + 1][0] <= t:
+                i += 1
+            clock, step = self.samples[i] if i >= 0 else (0, self.first or {})
+            out.append({**step, "clock": clock, "done": t >= self.clock})
+        return out
+
+
+class RaceService:
+    def __init__(self, sorting_service, graph_service):
+        self.services = {"sorting": sorting_service, "graph": graph_service}
+
+    def validate(self, kind: str, algorithms: List[str]) -> None:
+        if kind not in self.services:
+            raise ValueError(f"Unknown kind: {kind} (expected {' or '.join(self.services)})")
+        if not 2 <= len(algorithms) <= RACE_MAX_ALGORITHMS:
+            raise ValueError(f"A race needs between 2 and {RACE_MAX_ALGORITHMS} algorithms")
+        if len(set(algorithms)) != len(algorithms):
+            raise ValueError("Each algorithm can only race once")
+        unknown = [a for a in algorithms if a not in self.services[kind].algorithms]
+        if unknown:
+            raise ValueError(f"Unknown algorithm(s): {', '.join(unknown)}")
+
+    async def race(self, kind: str, algorithms: List[str], race_input, fps: int = 30,
+                   duration: float = 4.0) -> Dict[str, Any]:
+        """Frames at `fps` over `duration` seconds of playback; the slowest racer finishes on the last one."""
+        self.validate(kind, algorithms)
+        frames = max(2, min(int(round(fps * duration)) + 1, RACE_MAX_FRAMES))
+        # One worker thread per racer; engine traces and NumPy work release the GIL between steps
+        samplers = await asyncio.gather(*(
+            asyncio.to_thread(self._run, kind, algorithm, race_input, frames * SAMPLES_PER_FRAME)
+            for algorithm in algorithms
+        ))
+        total = max(sampler.clock for sampler in samplers) or 1
+        times = [total * k / (frames - 1) for k in range(frames)]
+        per_algorithm = {a: s.frames(times) for a, s in zip(algorithms, samplers)}
+
+        return {
+            "kind": kind,
+            "clock": CLOCKS[kind][0],
+            "total_clock": total,
+            "fps": fps,
+            "duration": round((frames - 1) / fps, 3),
+            "frame_count": frames,
+            "ticks_per_frame": round(total / (frames - 1), 3),
+            "algorithms": {
+                a: {
+                    "clock": s.clock,
+                    "steps": s.steps,
+                    "finish_frame": next((k for k, t in enumerate(times) if t >= s.clock), frames - 1),
+                    "resolution": s.stride,
+                }
+                for a, s in zip(algorithms, samplers)
+            },
+            "ranking": [a for _, a in sorted((s.clock, a) for a, s in zip(algorithms, samplers))],
+            "frames": [
+                {"frame": k, "clock": round(t, 3), "states": {a: per_algorithm[a][k] for a in algorithms}}
+                for k, t in enumerate(times)
+            ],
+        }
+
+    def _run(self, kind: str, algorithm: str, race_input, capacity: int) -> ClockSampler:
+        ticks = CLOCKS[kind][1]
+        sampler = ClockSampler(capacity)
+        prev = None
+        steps: Iterator[Dict[str, Any]] = self.services[kind].iter_steps(
+            algorithm, list(race_input) if kind == "sorting" else race_input)
+        for step in steps:
+            sampler.add(step, ticks(step, prev))
+            prev = step
+        return sampler
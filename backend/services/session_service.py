@@ -0,0 +1,140 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+# Interactive runs keep a suspended step generator per WebSocket instead of a full trace.
+# Limits are per worker process: each gunicorn/uvicorn worker has its own manager.
+WS_MAX_SESSIONS = int(os.getenv("WS_MAX_SESSIONS", 64))
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", 300))
+# Steps kept behind the generator for backward seeks; older steps are recomputed on demand
+WS_WINDOW = int(os.getenv("WS_WINDOW", 256))
+MAX_BATCH = 500
+
+StepFactory = Callable[[], Iterator[Dict[str, Any]]]
+
+
+class SessionLimitError(RuntimeError):
+    pass
+
+
+def _close_steps(steps: Iterator[Dict[str, Any]]) -> None:
+    # Engine-backed factories hand back iter(list), which has no close()
+    close = getattr(steps, "close", None)
+    if close is not None:
+        close()
+
+
+class StepSession:
+    """Pull-based view over a step generator with a bounded history window."""
+
+    def __init__(self, factory: StepFactory, window: int = WS_WINDOW):
+        self._factory = factory
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=max(1, window))
+        self._generator = factory()
+        self.produced = 0  # steps pulled from the generator so far
+        self.cursor = 0  # index of the next step handed to the client
+        self.done = False
+        self.last_active = time.monotonic()
+        self.playing = False
+        # Steps are pulled in worker threads; a cancelled await must not let two pulls overlap
+        self._lock = threading.Lock()
+
+    def next(self, count: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self._next(max(1, min(int(count), MAX_BATCH)))
+
+    def _next(self, count: int) -> List[Dict[str, Any]]:
+        if self.cursor < self.produced - len(self._history):
+            self._restart()
+        steps = []
+        while len(steps) < count:
+            if self.cursor < self.produced:
+                steps.append(self._history[self.cursor - (self.produced - len(self._history))])
+                self.cursor += 1
+            elif not self._pull():
+                break
+            else:
+                steps.append(self._history[-1])
+                self.cursor += 1
+        self.last_active = time.monotonic()
+        return steps
+
+    def seek(self, step: int) -> int:
+        """Move the cursor to `step` (clamped to the end of the trace); returns the new cursor."""
+        if step < 0:
+            raise ValueError("step must be non-negative")
+        with self._lock:
+            return self._seek(step)
+
+    def _seek(self, step: int) -> int:
+        if step < self.produced - len(self._history):
+            self._restart()
+        while self.produced < step and self._pull():
+            pass
+        self.cursor = min(step, self.produced)
+        self.last_active = time.monotonic()
+        return self.cursor
+
+    def close(self) -> None:
+        self.playing = False
+        with self._lock:
+            _close_steps(self._generator)
+            self._history.clear()
+
+    def _pull(self) -> bool:
+        if self.done:
+            return False
+        try:
+            self._history.append(next(self._generator))
+        except StopIteration:
+            self.done = True
+            return False
+        self.produced += 1
+        return True
+
+    def _restart(self) -> None:
+        # The window no longer covers the target, so replay the algorithm from the start
+        _close_steps(self._generator)
+        self._generator = self._factory()
+        self._history.clear()
+        self.produced = 0
+        self.done = False
+        target, self.cursor = self.cursor, 0
+        while self.produced < target and self._pull():
+            pass
+        self.cursor = min(target, self.produced)
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        return {"cursor": self.cursor, "produced": self.produced, "done": self.done and self.cursor >= self.produced}
+
+
+class SessionManager:
+    """Tracks open sessions in this worker and enforces WS_MAX_SESSIONS."""
+
+    def __init__(self, max_sessions: int = WS_MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self._sessions: Dict[int, StepSession] = {}
+
+    @property
+    def active(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def full(self) -> bool:
+        return self.active >= self.max_sessions
+
+    def open(self, factory: StepFactory, window: int = WS_WINDOW) -> StepSession:
+        if self.full:
+            raise SessionLimitError(f"Session limit reached ({self.max_sessions} per worker)")
+        session = StepSession(factory, window)
+        self._sessions[id(session)] = session
+        return session
+
+    def release(self, session: Optional[StepSession]) -> None:
+        if session is None:
+            return
+        self._sessions.pop(id(session), None)
+        session.close()
@@ -1,18 +1,50 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
+from functools import partial
 import asyncio
 
 # Prefer absolute import when running from repo root; fallback when running inside backend/
 try:
     from backend.utils.engine_loader import get_engine  # type: ignore
+    from backend.utils.engine_health import record_fallback  # type: ignore
 except Exception:
     try:
         from utils.engine_loader import get_engine  # type: ignore
+        from utils.engine_health import record_fallback  # type: ignore
     except Exception:
         def get_engine():  # type: ignore
             return None
 
+        def record_fallback(algorithm: str) -> None:  # type: ignore
+            pass
+
+try:
+    from backend.utils.trace_file import write_trace  # type: ignore
+except Exception:
+    from utils.trace_file import write_trace  # type: ignore
+
 algorithm_engine = get_engine()
 
+# Segments at or below this size are finished with insertion sort in quick sort / introsort
+QUICK_INSERTION_CUTOFF = 8
+
+# Timsort computes minrun from n the same way as java.util.TimSort
+TIM_MIN_MERGE = 32
+
+RADIX_BASE = 10
+
+# Counting sort switches to radix sort when max - min + 1 exceeds this many times n (plus slack),
+# so a single wide-range input such as [0, 10**9] cannot allocate a huge count array
+COUNTING_RANGE_FACTOR = 4
+COUNTING_RANGE_SLACK = 1024
+
+SHELL_COMPLEXITY = {
+    'ciura': "O(n^(4/3))",
+    'sedgewick': "O(n^(4/3))",
+    'knuth': "O(n^(3/2))",
+    'hibbard': "O(n^(3/2))",
+    'halving': "O(n²)",
+}
+
 class SortingService:
     def __init__(self):
         self.algorithms = {
@@ -21,13 +53,38 @@ class SortingService:
             'quick': self._quick_sort,
             'heap': self._heap_sort,
             'counting': self._counting_sort,
+            'intro': self._intro_fallback,
+            'tim': self._tim_fallback,
+            'radix': self._radix_fallback,
+            'shell': partial(self._shell_fallback, gaps='ciura'),
+            'shell_knuth': partial(self._shell_fallback, gaps='knuth'),
+            'shell_hibbard': partial(self._shell_fallback, gaps='hibbard'),
+            'shell_sedgewick': partial(self._shell_fallback, gaps='sedgewick'),
+            'shell_halving': partial(self._shell_fallback, gaps='halving'),
         }
 
     async def execute_algorithm(self, algorithm: str, array: List[int]) -> Dict[str, Any]:
+        return {"steps": self.run_algorithm(algorithm, array)}
+
+    def run_algorithm(self, algorithm: str, array: List[int]) -> List[Dict[str, Any]]:
+        """The whole trace, built synchronously; request handlers call this through asyncio.to_thread."""
+        return list(self.iter_steps(algorithm, array))
+
+    def iter_steps(self, algorithm: str, array: List[int]) -> Iterator[Dict[str, Any]]:
+        """Lazily produce the trace; Python fallbacks only advance as far as the caller pulls."""
         if algorithm not in self.algorithms:
             raise ValueError(f"Unknown algorithm: {algorithm}")
-        steps = await self.algorithms[algorithm](array or [])
-        return {"steps": steps}
+        return self.algorithms[algorithm](array or [])
+
+    def claimed_complexity(self, algorithm: str) -> Optional[str]:
+        """The time_complexity string this algorithm's trace reports."""
+        step = next(self.iter_steps(algorithm, [2, 1]), None)
+        return step.get("time_complexity") if step else None
+
+    def record_trace(self, algorithm: str, array: List[int], path: str) -> Dict[str, Any]:
+        """Stream the trace into a binary trace file (utils/trace_file.py) instead of a JSON list."""
+        steps = self.iter_steps(algorithm, array)
+        return write_trace(path, steps, {"kind": "sorting", "algorithm": algorithm, "input": {"array": list(array)}})
 
     # -------- Engine conversion helpers --------
     def _convert_cpp_steps(self, cpp_steps) -> List[Dict[str, Any]]:
@@ -44,86 +101,84 @@ class SortingService:
             })
         return out
 
-    # -------- Algorithm dispatchers --------
-    async def _bubble_sort(self, array: List[int]) -> List[Dict[str, Any]]:
+    def _engine_steps(self, name: str, array: List[int]):
+        """Full engine trace, or None when the engine is missing or fails."""
         if algorithm_engine:
             try:
-                cpp_steps = algorithm_engine.bubble_sort(list(array))
-                return self._convert_cpp_steps(cpp_steps)
+                return self._convert_cpp_steps(getattr(algorithm_engine, name)(list(array)))
             except Exception:
                 pass
-        return await self._bubble_fallback(array)
+        return None
 
-    async def _merge_sort(self, array: List[int]) -> List[Dict[str, Any]]:
-        if algorithm_engine:
-            try:
-                cpp_steps = algorithm_engine.merge_sort(list(array))
-                return self._convert_cpp_steps(cpp_steps)
-            except Exception:
-                pass
-        return await self._merge_fallback(array)
+    # -------- Algorithm dispatchers --------
+    def _bubble_sort(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        steps = self._engine_steps('bubble_sort', array)
+        if steps is not None:
+            return iter(steps)
+        record_fallback('bubble')
+        return self._bubble_fallback(array)
 
-    async def _quick_sort(self, array: List[int]) -> List[Dict[str, Any]]:
-        if algorithm_engine:
-            try:
-                cpp_steps = algorithm_engine.quick_sort(list(array))
-                return self._convert_cpp_steps(cpp_steps)
-            except Exception:
-                pass
-        # Minimal placeholder: reuse merge fallback to avoid 400s
-        return await self._merge_fallback(array)
+    def _merge_sort(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        steps = self._engine_steps('merge_sort', array)
+        if steps is not None:
+            return iter(steps)
+        record_fallback('merge')
+        return self._merge_fallback(array)
 
-    async def _heap_sort(self, array: List[int]) -> List[Dict[str, Any]]:
-        if algorithm_engine:
-            try:
-                cpp_steps = algorithm_engine.heap_sort(list(array))
-                return self._convert_cpp_steps(cpp_steps)
-            except Exception:
-                pass
-        # Minimal placeholder: reuse bubble fallback
-        return await self._bubble_fallback(array)
+    def _quick_sort(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        steps = self._engine_steps('quick_sort', array)
+        if steps is not None:
+            return iter(steps)
+        record_fallback('quick')
+        return self._quick_fallback(array)
 
-    async def _counting_sort(self, array: List[int]) -> List[Dict[str, Any]]:
-        if algorithm_engine:
-            try:
-                cpp_steps = algorithm_engine.counting_sort(list(array))
-                return self._convert_cpp_steps(cpp_steps)
-            except Exception:
-                pass
-        # Minimal placeholder: stable counting sort when numbers >= 0
-        return await self._counting_fallback(array)
+    def _heap_sort(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        steps = self._engine_steps('heap_sort', array)
+        if steps is not None:
+            return iter(steps)
+        record_fallback('heap')
+        return self._heap_fallback(array)
+
+    def _counting_sort(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        if array:
+            rng = max(array) - min(array) + 1
+            if rng > COUNTING_RANGE_FACTOR * len(array) + COUNTING_RANGE_SLACK:
+                # The count array would be mostly empty: radix sort needs O(n) memory instead of O(range)
+                return self._radix_fallback(array, note=f"Value range {rng} too wide for counting sort; ")
+        steps = self._engine_steps('counting_sort', array)
+        if steps is not None:
+            return iter(steps)
+        record_fallback('counting')
+        return self._counting_fallback(array)
 
     # -------- Python fallbacks (concise) --------
-    async def _bubble_fallback(self, array: List[int]) -> List[Dict[str, Any]]:
-        steps: List[Dict[str, Any]] = []
+    def _bubble_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
         arr = list(array)
         n = len(arr)
         ops = 0
-        steps.append(self._step(arr, [], [], "Starting Bubble Sort", ops, "O(n²)", "O(1)"))
+        yield self._step(arr, [], [], "Starting Bubble Sort", ops, "O(n²)", "O(1)")
         for i in range(n - 1):
             for j in range(n - i - 1):
                 ops += 1
-                steps.append(self._step(arr, [], [j, j + 1], f"Comparing {arr[j]} and {arr[j+1]}", ops, "O(n²)", "O(1)"))
+                yield self._step(arr, [], [j, j + 1], f"Comparing {arr[j]} and {arr[j+1]}", ops, "O(n²)", "O(1)")
                 if arr[j] > arr[j + 1]:
                     arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    steps.append(self._step(arr, [j, j + 1], [], f"Swapped positions {j} and {j+1}", ops, "O(n²)", "O(1)"))
-        steps.append(self._step(arr, [], [], "Bubble Sort Complete", ops, "O(n²)", "O(1)"))
-        return steps
+                    yield self._step(arr, [j, j + 1], [], f"Swapped positions {j} and {j+1}", ops, "O(n²)", "O(1)")
+        yield self._step(arr, [], [], "Bubble Sort Complete", ops, "O(n²)", "O(1)")
 
-    async def _merge_fallback(self, array: List[int]) -> List[Dict[str, Any]]:
-        steps: List[Dict[str, Any]] = []
+    def _merge_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
         arr = list(array)
         ops = 0
-        steps.append(self._step(arr, [], [], "Starting Merge Sort", ops, "O(n log n)", "O(n)"))
+        yield self._step(arr, [], [], "Starting Merge Sort", ops, "O(n log n)", "O(n)")
 
         def merge_sort(l: int, r: int):
-            nonlocal ops, arr, steps
+            nonlocal ops, arr
             if l >= r:
                 return
             m = (l + r) // 2
-            steps.append(self._step(arr, [l, m, r], [], f"Divide [{l},{r}] => [{l},{m}] and [{m+1},{r}]", ops, "O(n log n)", "O(n)"))
-            merge_sort(l, m)
-            merge_sort(m + 1, r)
+            yield self._step(arr, [l, m, r], [], f"Divide [{l},{r}] => [{l},{m}] and [{m+1},{r}]", ops, "O(n log n)", "O(n)")
+            yield from merge_sort(l, m)
+            yield from merge_sort(m + 1, r)
             # merge
             i, j = l, m + 1
             tmp = []
@@ -136,27 +191,192 @@ class SortingService:
             while i <= m: tmp.append(arr[i]); i += 1
             while j <= r: tmp.append(arr[j]); j += 1
             arr[l:r + 1] = tmp
-            steps.append(self._step(arr, list(range(l, r + 1)), [], f"Merged [{l},{m}] and [{m+1},{r}]", ops, "O(n log n)", "O(n)"))
+            yield self._step(arr, list(range(l, r + 1)), [], f"Merged [{l},{m}] and [{m+1},{r}]", ops, "O(n log n)", "O(n)")
 
         if arr:
-            merge_sort(0, len(arr) - 1)
-        steps.append(self._step(arr, [], [], "Merge Sort Complete", ops, "O(n log n)", "O(n)"))
-        return steps
+            yield from merge_sort(0, len(arr) - 1)
+        yield self._step(arr, [], [], "Merge Sort Complete", ops, "O(n log n)", "O(n)")
+
+    def _quick_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        # In-place: median-of-three pivot, three-way partition, insertion sort for short segments
+        arr = list(array)
+        ops = 0
+        t, s = "O(n log n)", "O(log n)"
+        yield self._step(arr, [], [], "Starting Quick Sort", ops, t, s)
+
+        # Explicit stack; the smaller side is pushed last so depth stays O(log n)
+        stack = [(0, len(arr) - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo + 1 <= QUICK_INSERTION_CUTOFF:
+                ops = yield from self._insertion_range(arr, lo, hi, ops, t, s)
+                continue
+            lt, gt, ops = yield from self._partition3(arr, lo, hi, ops, t, s)
+            stack.extend(self._smaller_last((lo, lt - 1), (gt + 1, hi)))
+
+        yield self._step(arr, [], [], "Quick Sort Complete", ops, t, s)
+
+    def _heap_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        arr = list(array)
+        ops = 0
+        t, s = "O(n log n)", "O(1)"
+        yield self._step(arr, [], [], "Starting Heap Sort", ops, t, s)
+        ops = yield from self._heap_range(arr, 0, len(arr) - 1, ops, t, s)
+        yield self._step(arr, [], [], "Heap Sort Complete", ops, t, s)
+
+    def _intro_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        # Quick sort that hands a segment to heap sort once recursion depth exceeds 2*log2(n)
+        arr = list(array)
+        ops = 0
+        t, s = "O(n log n)", "O(log n)"
+        depth_limit = 2 * max(len(arr), 1).bit_length()
+        yield self._step(arr, [], [], f"Starting Introsort (depth limit {depth_limit})", ops, t, s)
+
+        stack = [(0, len(arr) - 1, depth_limit)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo + 1 <= QUICK_INSERTION_CUTOFF:
+                ops = yield from self._insertion_range(arr, lo, hi, ops, t, s)
+                continue
+            if depth == 0:
+                yield self._step(arr, list(range(lo, hi + 1)), [], f"Depth limit reached: heap sorting [{lo},{hi}]", ops, t, s)
+                ops = yield from self._heap_range(arr, lo, hi, ops, t, s)
+                continue
+            lt, gt, ops = yield from self._partition3(arr, lo, hi, ops, t, s)
+            for seg_lo, seg_hi in self._smaller_last((lo, lt - 1), (gt + 1, hi)):
+                stack.append((seg_lo, seg_hi, depth - 1))
+
+        yield self._step(arr, [], [], "Introsort Complete", ops, t, s)
+
+    def _tim_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        # Simplified Timsort: natural runs, minrun extension by insertion, stack-invariant merges (no galloping)
+        arr = list(array)
+        n = len(arr)
+        ops = 0
+        t, s = "O(n log n)", "O(n)"
+        min_run = self._min_run(n)
+        yield self._step(arr, [], [], f"Starting Timsort (minrun {min_run})", ops, t, s)
+
+        def merge(a: int):
+            nonlocal ops
+            (lo, mid), (_, hi) = runs[a], runs[a + 1]
+            left = arr[lo:mid]
+            i, j, k = 0, mid, lo
+            while i < len(left) and j < hi:
+                ops += 1
+                if left[i] <= arr[j]:
+                    arr[k] = left[i]; i += 1
+                else:
+                    arr[k] = arr[j]; j += 1
+                k += 1
+            arr[k:k + len(left) - i] = left[i:]
+            runs[a:a + 2] = [(lo, hi)]
+            yield self._step(arr, list(range(lo, hi)), [], f"Merged runs [{lo},{mid - 1}] and [{mid},{hi - 1}]", ops, t, s)
+
+        runs: List[tuple] = []
+        lo = 0
+        while lo < n:
+            hi = lo + 1
+            if hi < n:
+                ops += 1
+                if arr[hi] < arr[lo]:
+                    while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                        ops += 1
+                        hi += 1
+                    arr[lo:hi + 1] = arr[lo:hi + 1][::-1]
+                    yield self._step(arr, list(range(lo, hi + 1)), [], f"Reversed descending run [{lo},{hi}]", ops, t, s)
+                else:
+                    while hi + 1 < n and arr[hi + 1] >= arr[hi]:
+                        ops += 1
+                        hi += 1
+            run_end = min(max(hi + 1, lo + min_run), n)
+            yield self._step(arr, list(range(lo, hi + 1)), [], f"Found natural run [{lo},{hi}]", ops, t, s)
+            if run_end > hi + 1:
+                ops = yield from self._insertion_range(arr, lo, run_end - 1, ops, t, s, start=hi + 1)
+            runs.append((lo, run_end))
+            lo = run_end
+
+            # Keep run lengths decreasing like a Fibonacci sequence so merges stay balanced
+            while len(runs) > 1:
+                size = [r[1] - r[0] for r in runs]
+                if len(runs) > 2 and size[-3] <= size[-2] + size[-1]:
+                    yield from merge(len(runs) - 3 if size[-3] < size[-1] else len(runs) - 2)
+                elif size[-2] <= size[-1]:
+                    yield from merge(len(runs) - 2)
+                else:
+                    break
+
+        while len(runs) > 1:
+            yield from merge(len(runs) - 2)
+
+        yield self._step(arr, [], [], "Timsort Complete", ops, t, s)
 
-    async def _counting_fallback(self, array: List[int]) -> List[Dict[str, Any]]:
-        steps: List[Dict[str, Any]] = []
+    def _shell_fallback(self, array: List[int], gaps: str = 'ciura') -> Iterator[Dict[str, Any]]:
+        arr = list(array)
+        n = len(arr)
+        ops = 0
+        t, s = SHELL_COMPLEXITY[gaps], "O(1)"
+        sequence = self._shell_gaps(n, gaps)
+        yield self._step(arr, [], [], f"Starting Shell Sort ({gaps} gaps: {sequence})", ops, t, s)
+
+        for gap in sequence:
+            yield self._step(arr, [], [], f"Current gap: {gap}", ops, t, s)
+            for i in range(gap, n):
+                key = arr[i]
+                j = i
+                while j >= gap:
+                    ops += 1
+                    if arr[j - gap] <= key:
+                        break
+                    arr[j] = arr[j - gap]
+                    j -= gap
+                if j != i:
+                    arr[j] = key
+                    yield self._step(arr, [j, i], [], f"Gap {gap}: moved {key} from {i} to {j}", ops, t, s)
+
+        yield self._step(arr, [], [], "Shell Sort Complete", ops, t, s)
+
+    def _radix_fallback(self, array: List[int], note: str = "") -> Iterator[Dict[str, Any]]:
+        # LSD radix sort, base 10; values are shifted by the minimum so negatives work
         arr = list(array)
         ops = 0
+        t, s = "O(n·w)", f"O(n + {RADIX_BASE})"
         if not arr:
-            return [self._step([], [], [], "Array is empty", 0, "O(n + k)", "O(k)")]
+            yield self._step([], [], [], "Array is empty", 0, t, s)
+            return
+        mn = min(arr)
+        span = max(arr) - mn
+        yield self._step(arr, [], [], f"{note}Starting Radix Sort (LSD, base {RADIX_BASE}, offset {-mn})", ops, t, s)
+
+        place = 1
+        while True:
+            buckets: List[List[int]] = [[] for _ in range(RADIX_BASE)]
+            for v in arr:
+                buckets[((v - mn) // place) % RADIX_BASE].append(v)
+                ops += 1
+            arr = [v for bucket in buckets for v in bucket]
+            ops += len(arr)
+            yield self._step(arr, [], [], f"Stable pass on digit {place}: bucket sizes {[len(b) for b in buckets]}", ops, t, s)
+            if span // place < RADIX_BASE:
+                break
+            place *= RADIX_BASE
+
+        yield self._step(arr, [], [], "Radix Sort Complete", ops, t, s)
+
+    def _counting_fallback(self, array: List[int]) -> Iterator[Dict[str, Any]]:
+        arr = list(array)
+        ops = 0
+        if not arr:
+            yield self._step([], [], [], "Array is empty", 0, "O(n + k)", "O(k)")
+            return
         mn, mx = min(arr), max(arr)
         rng = mx - mn + 1
-        steps.append(self._step(arr, [], [], f"Starting Counting Sort. Range: {rng}", ops, "O(n + k)", "O(k)"))
+        yield self._step(arr, [], [], f"Starting Counting Sort. Range: {rng}", ops, "O(n + k)", "O(k)")
         count = [0] * rng
         for v in arr:
             count[v - mn] += 1
             ops += 1
-        steps.append(self._step(arr, [], [], "Counted element frequencies", ops, "O(n + k)", "O(k)"))
+        yield self._step(arr, [], [], "Counted element frequencies", ops, "O(n + k)", "O(k)")
         idx = 0
         for i, c in enumerate(count):
             while c > 0:
@@ -164,8 +384,134 @@ class SortingService:
                 idx += 1
                 c -= 1
                 ops += 1
-        steps.append(self._step(arr, [], [], "Counting Sort Complete", ops, "O(n + k)", "O(k)"))
-        return steps
+        yield self._step(arr, [], [], "Counting Sort Complete", ops, "O(n + k)", "O(k)")
+
+    # -------- Shared in-place building blocks --------
+    def _insertion_range(self, arr, lo, hi, ops, t, s, start=None) -> Iterator[Dict[str, Any]]:
+        """Insertion sort arr[lo..hi] (arr[lo..start-1] already sorted), yielding steps. Returns the new ops count."""
+        for i in range(start if start is not None else lo + 1, hi + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= lo:
+                ops += 1
+                if arr[j] <= key:
+                    break
+                arr[j + 1] = arr[j]
+                j -= 1
+            if j + 1 != i:
+                arr[j + 1] = key
+                yield self._step(arr, [j + 1], [], f"Insertion: placed {key} at {j + 1}", ops, t, s)
+        return ops
+
+    def _partition3(self, arr, lo, hi, ops, t, s) -> Iterator[Dict[str, Any]]:
+        """Median-of-three partition of arr[lo..hi] into < / == / > pivot, yielding steps. Returns (lt, gt, ops)."""
+        mid = (lo + hi) // 2
+        for a, b in ((lo, mid), (mid, hi), (lo, mid)):
+            ops += 1
+            if arr[a] > arr[b]:
+                arr[a], arr[b] = arr[b], arr[a]
+        pivot = arr[mid]
+        yield self._step(arr, [mid], [lo, hi], f"Median-of-three pivot {pivot} for [{lo},{hi}]", ops, t, s)
+
+        # Hoare-style sweep splits [< pivot | >= pivot] without disturbing sorted runs
+        i, j = lo, hi
+        while True:
+            while i <= j and arr[i] < pivot:
+                ops += 1
+                i += 1
+            while i <= j and arr[j] >= pivot:
+                ops += 1
+                j -= 1
+            if i >= j:
+                break
+            arr[i], arr[j] = arr[j], arr[i]
+            yield self._step(arr, [i, j], [], f"Swapped {arr[j]} and {arr[i]} across pivot {pivot}", ops, t, s)
+            i += 1
+            j -= 1
+        # Gather duplicates of the pivot so they are never partitioned again
+        lt = gt = i
+        for k in range(i, hi + 1):
+            ops += 1
+            if arr[k] == pivot:
+                if k != gt:
+                    arr[gt], arr[k] = arr[k], arr[gt]
+                    yield self._step(arr, [gt, k], [], f"Grouped duplicate {pivot} at position {gt}", ops, t, s)
+                gt += 1
+        gt -= 1
+        yield self._step(arr, list(range(lt, gt + 1)), [], f"Partitioned [{lo},{hi}]: {gt - lt + 1} element(s) equal to pivot {pivot} in place", ops, t, s)
+        return lt, gt, ops
+
+    def _heap_range(self, arr, lo, hi, ops, t, s) -> Iterator[Dict[str, Any]]:
+        """Heap sort arr[lo..hi] in place, yielding steps. Returns the new ops count."""
+        n = hi - lo + 1
+
+        def sift_down(root: int, end: int):
+            nonlocal ops
+            while True:
+                largest = root
+                for child in (2 * root + 1, 2 * root + 2):
+                    if child < end:
+                        ops += 1
+                        if arr[lo + child] > arr[lo + largest]:
+                            largest = child
+                if largest == root:
+                    return
+                arr[lo + root], arr[lo + largest] = arr[lo + largest], arr[lo + root]
+                yield self._step(arr, [lo + root, lo + largest], [], f"Heapify: swapped {arr[lo + largest]} down to {lo + largest}", ops, t, s)
+                root = largest
+
+        for i in range(n // 2 - 1, -1, -1):
+            yield from sift_down(i, n)
+        yield self._step(arr, [], [], "Max heap built", ops, t, s)
+
+        for end in range(n - 1, 0, -1):
+            arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+            yield self._step(arr, [lo, lo + end], [], f"Moved max element {arr[lo + end]} to position {lo + end}", ops, t, s)
+            yield from sift_down(0, end)
+        return ops
+
+    @staticmethod
+    def _smaller_last(left: tuple, right: tuple) -> List[tuple]:
+        # Pushing the smaller segment last means it is popped first, bounding stack depth
+        if left[1] - left[0] > right[1] - right[0]:
+            return [left, right]
+        return [right, left]
+
+    @staticmethod
+    def _min_run(n: int) -> int:
+        r = 0
+        while n >= TIM_MIN_MERGE:
+            r |= n & 1
+            n >>= 1
+        return n + r
+
+    @staticmethod
+    def _shell_gaps(n: int, gaps: str) -> List[int]:
+        seq: List[int] = []
+        if gaps == 'halving':
+            g = n // 2
+            while g > 0:
+                seq.append(g)
+                g //= 2
+            return seq
+        if gaps == 'ciura':
+            seq = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+            while seq[-1] < n:
+                seq.append(int(seq[-1] * 2.25))
+        else:
+            k = 1
+            while True:
+                if gaps == 'knuth':
+                    g = (3 ** k - 1) // 2
+                elif gaps == 'hibbard':
+                    g = 2 ** k - 1
+                else:  # sedgewick (1986): 1, 8, 23, 77, 281, ...
+                    g = 1 if k == 1 else 4 ** (k - 1) + 3 * 2 ** (k - 2) + 1
+                if g >= n and seq:
+                    break
+                seq.append(g)
+                k += 1
+        return [g for g in reversed(seq) if g < n] or [1]
 
     # -------- Utils --------
     def _step(self, arr, highlighted, comparing, operation, ops, t, s) -> Dict[str, Any]:
@@ -177,4 +523,32 @@ class SortingService:
             "operations_count": int(ops),
             "time_complexity": t,
             "space_complexity": s,
-        }
\ No newline at end of file
+        }
+
+class OperationCounter(SortingService):
+    """
+    The Python implementations with recording switched off: a step is just the running operation
+    count, so arrays are never copied and wall time reflects the algorithm itself. Used by the
+    complexity analyzer; the engine is bypassed because its traces always record.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.algorithms.update({
+            'bubble': self._bubble_fallback,
+            'merge': self._merge_fallback,
+            'quick': self._quick_fallback,
+            'heap': self._heap_fallback,
+            # Without the radix switch, so the count array's O(range) cost shows up in the fit
+            'counting': self._counting_fallback,
+        })
+
+    def count(self, algorithm: str, array: List[int]) -> int:
+        """Run to completion and return the algorithm's own operation count."""
+        ops = 0
+        for ops in self.iter_steps(algorithm, array):
+            pass
+        return int(ops)
+
+    def _step(self, arr, highlighted, comparing, operation, ops, t, s) -> int:
+        return ops
@@ -1,21 +1,258 @@
-from typing import List, Dict, Any
+import os
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Tuple, Union
 from models.api_models import StringRequest
 
+try:
+    from backend.utils.chunked_search import CHUNK_BYTES, scan_file  # type: ignore
+except Exception:
+    from utils.chunked_search import CHUNK_BYTES, scan_file  # type: ignore
+
+# Shift tables depend only on the pattern, so repeated searches for the same pattern reuse them
+SHIFT_TABLE_CACHE_SIZE = int(os.getenv("STRING_SHIFT_TABLE_CACHE", 256))
+# Server-side text files that can be searched by name; unset disables searching them
+STRING_FILE_DIR = os.getenv("STRING_FILE_DIR")
+# Result-only searches return at most this many match positions (the count is always exact)
+MAX_RESULT_MATCHES = 10_000
+
+# One alignment of a skip-based search: (window start, mismatch index or -1 on a match,
+# characters examined in this window, shift applied afterwards, rule that chose the shift)
+Window = Tuple[int, int, int, int, str]
+
+
+@lru_cache(maxsize=SHIFT_TABLE_CACHE_SIZE)
+def last_occurrence(pattern: str) -> Dict[str, int]:
+    """Bad-character table: rightmost index of each pattern character."""
+    return {c: i for i, c in enumerate(pattern)}
+
+
+@lru_cache(maxsize=SHIFT_TABLE_CACHE_SIZE)
+def good_suffix_shifts(pattern: str) -> Tuple[int, ...]:
+    """Strong good-suffix table: shift[j + 1] is the safe shift after a mismatch at pattern[j]."""
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return tuple(shift)
+
+
+@lru_cache(maxsize=SHIFT_TABLE_CACHE_SIZE)
+def horspool_shifts(pattern: str) -> Dict[str, int]:
+    """Shift by the text character under the last pattern position; absent characters shift by m."""
+    m = len(pattern)
+    return {c: m - 1 - i for i, c in enumerate(pattern[:-1])}
+
+
+def boyer_moore_windows(text: str, pattern: str) -> Iterator[Window]:
+    m, n = len(pattern), len(text)
+    last, good = last_occurrence(pattern), good_suffix_shifts(pattern)
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        examined = m - j if j >= 0 else m
+        if j < 0:
+            yield s, -1, examined, good[0], 'good suffix'
+            s += good[0]
+            continue
+        bad = j - last.get(text[s + j], -1)
+        shift = max(bad, good[j + 1])
+        yield s, j, examined, shift, 'bad character' if bad >= good[j + 1] else 'good suffix'
+        s += shift
+
+
+def horspool_windows(text: str, pattern: str) -> Iterator[Window]:
+    m, n = len(pattern), len(text)
+    table = horspool_shifts(pattern)
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        shift = table.get(text[s + m - 1], m)
+        yield s, j, m - j if j >= 0 else m, shift, 'bad character'
+        s += shift
+
+
+def find_all(text: Union[str, bytes], pattern: Union[str, bytes], limit: int = MAX_RESULT_MATCHES) -> Tuple[int, List[int]]:
+    """Every (overlapping) occurrence via str.find / bytes.find, which scan in C; returns (count, first positions)."""
+    count, positions = 0, []
+    i = text.find(pattern)
+    while i != -1:
+        count += 1
+        if len(positions) < limit:
+            positions.append(i)
+        i = text.find(pattern, i + 1)
+    return count, positions
+
+
 class StringService:
     def __init__(self):
         self.algorithms = {
             'kmp': self._kmp,
             'rabin_karp': self._rabin_karp,
-            'z_algorithm': self._z_algorithm
+            'z_algorithm': self._z_algorithm,
+            'boyer_moore': self._boyer_moore,
+            'horspool': self._horspool,
         }
+        self.window_searches = {'boyer_moore': boyer_moore_windows, 'horspool': horspool_windows}
 
     async def execute_algorithm(self, algorithm: str, request: StringRequest) -> List[Dict[str, Any]]:
+        return self.run_algorithm(algorithm, request)
+
+    def run_algorithm(self, algorithm: str, request: StringRequest) -> List[Dict[str, Any]]:
+        """The whole trace, built synchronously; request handlers call this through asyncio.to_thread."""
         if algorithm not in self.algorithms:
             raise ValueError(f"Unknown algorithm: {algorithm}")
-        
-        return await self.algorithms[algorithm](request)
+        return self.algorithms[algorithm](request)
+
+    def search(self, text: str, pattern: str, limit: int = MAX_RESULT_MATCHES) -> Dict[str, Any]:
+        """Result-only mode for large texts: no trace, the scan itself runs in C."""
+        began = time.perf_counter()
+        count, positions = find_all(text, pattern, limit)
+        return {
+            'pattern': pattern,
+            'textLength': len(text),
+            'count': count,
+            'matches': positions,
+            'truncated': count > len(positions),
+            'elapsedMs': round((time.perf_counter() - began) * 1000, 3),
+        }
+
+    def characters_examined(self, algorithm: str, text: str, pattern: str) -> Tuple[List[int], int]:
+        """(matches, text characters compared) without building a trace."""
+        if algorithm in self.window_searches:
+            matches, examined = [], 0
+            for start, mismatch, seen, _, _ in self.window_searches[algorithm](text, pattern):
+                examined += seen
+                if mismatch < 0:
+                    matches.append(start)
+            return matches, examined
+        if algorithm == 'kmp':
+            lps = self._build_lps(pattern)
+            matches, examined, j = [], 0, 0
+            for i, c in enumerate(text):
+                while True:
+                    examined += 1
+                    if pattern[j] == c:
+                        j += 1
+                        break
+                    if j == 0:
+                        break
+                    j = lps[j - 1]
+                if j == len(pattern):
+                    matches.append(i - j + 1)
+                    j = lps[j - 1]
+            return matches, examined
+        if algorithm == 'naive':
+            matches, examined = [], 0
+            m = len(pattern)
+            for s in range(len(text) - m + 1):
+                j = 0
+                while j < m:
+                    examined += 1
+                    if text[s + j] != pattern[j]:
+                        break
+                    j += 1
+                if j == m:
+                    matches.append(s)
+            return matches, examined
+        raise ValueError(f"Cannot count characters for '{algorithm}' "
+                         f"(supported: naive, kmp, {', '.join(self.window_searches)})")
+
+    def resolve_file(self, name: str) -> str:
+        """Path of a file under STRING_FILE_DIR; names that escape the directory are rejected."""
+        if not STRING_FILE_DIR:
+            raise FileNotFoundError("Server-side file search is disabled (STRING_FILE_DIR is not set)")
+        root = os.path.realpath(STRING_FILE_DIR)
+        path = os.path.realpath(os.path.join(root, name))
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            raise FileNotFoundError(f"No such file: {name}")
+        return path
+
+    def scan_file(self, path: str, pattern: str, chunk_size: int = CHUNK_BYTES) -> Iterator[Dict[str, Any]]:
+        """Chunked mmap search of a file; offsets are byte offsets into the UTF-8 encoded text."""
+        return scan_file(path, pattern.encode('utf-8'), chunk_size)
+
+    def _boyer_moore(self, request: StringRequest) -> List[Dict[str, Any]]:
+        return self._window_trace('Boyer-Moore', boyer_moore_windows, request, {
+            'badCharacter': last_occurrence(request.pattern),
+            'goodSuffix': list(good_suffix_shifts(request.pattern)),
+        })
+
+    def _horspool(self, request: StringRequest) -> List[Dict[str, Any]]:
+        return self._window_trace('Horspool', horspool_windows, request, {
+            'shiftTable': horspool_shifts(request.pattern),
+        })
+
+    def _window_trace(self, name: str, windows, request: StringRequest, tables: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """One step per alignment: the right-to-left comparison, its outcome and the skip that follows."""
+        text, pattern = request.text, request.pattern
+        m = len(pattern)
+        steps = [{
+            'text': text,
+            'pattern': pattern,
+            'windowStart': 0,
+            'matches': [],
+            'charactersExamined': 0,
+            **tables,
+            'operation': f'Starting {name} search for pattern "{pattern}" (shift tables precomputed)'
+        }]
+        if m > len(text):
+            steps[0]['operation'] = 'Pattern longer than text'
+            return steps
 
-    async def _kmp(self, request: StringRequest) -> List[Dict[str, Any]]:
+        examined = 0
+        found = []
+        for start, mismatch, seen, shift, rule in windows(text, pattern):
+            examined += seen
+            if mismatch < 0:
+                found.append(start)
+                operation = f'Pattern found at index {start}; shift by {shift}'
+            else:
+                operation = (f'Mismatch at pattern[{mismatch}] = "{pattern[mismatch]}" vs text[{start + mismatch}] = '
+                             f'"{text[start + mismatch]}" after {seen} comparison(s); {rule} rule skips {shift}')
+            steps.append({
+                'text': text,
+                'pattern': pattern,
+                'windowStart': start,
+                'patternIndex': mismatch,
+                'compared': [start + j for j in range(m - 1, m - 1 - seen, -1)],
+                'shift': shift,
+                'rule': rule,
+                'matches': [start] if mismatch < 0 else [],
+                'charactersExamined': examined,
+                'operation': operation,
+            })
+
+        steps.append({
+            'text': text,
+            'pattern': pattern,
+            'windowStart': len(text) - m,
+            'matches': found,
+            'charactersExamined': examined,
+            'operation': f'{name} search complete: {len(found)} match(es), {examined} of {len(text)} characters examined'
+        })
+        return steps
+
+    def _kmp(self, request: StringRequest) -> List[Dict[str, Any]]:
         text = request.text
         pattern = request.pattern
         steps = []
@@ -118,7 +355,7 @@ class StringService:
         
         return lps
 
-    async def _rabin_karp(self, request: StringRequest) -> List[Dict[str, Any]]:
+    def _rabin_karp(self, request: StringRequest) -> List[Dict[str, Any]]:
         text = request.text
         pattern = request.pattern
         steps = []
@@ -215,7 +452,7 @@ class StringService:
         
         return steps
 
-    async def _z_algorithm(self, request: StringRequest) -> List[Dict[str, Any]]:
+    def _z_algorithm(self, request: StringRequest) -> List[Dict[str, Any]]:
         text = request.text
         pattern = request.pattern
         steps = []
@@ -223,6 +460,7 @@ class StringService:
         # Concatenate pattern and text with a separator
         s = pattern + "$" + text
         n = len(s)
+        m = len(pattern)
         z = [0] * n
         
         steps.append({
@@ -242,7 +480,9 @@ class StringService:
                 z[i] = min(right - i + 1, z[i - left])
             
             # Try to extend match
-            while i + z[i] < n and s[z[i]] == s[i + z[i]]:
+            # Z values are capped at the pattern length, so the separator is never compared and a
+            # "$" in the text cannot extend a match past it
+            while z[i] < m and i + z[i] < n and s[z[i]] == s[i + z[i]]:
                 z[i] += 1
             
             if i + z[i] - 1 > right:
@@ -0,0 +1,101 @@
+import os
+import secrets
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+try:
+    from backend.utils.trace_file import TraceReader  # type: ignore
+except Exception:
+    from utils.trace_file import TraceReader  # type: ignore
+
+# Recorded and uploaded traces are plain files, so every worker on the host serves them through
+# mmap; the directory is capped and the least recently written traces are evicted first
+TRACE_DIR = os.getenv("TRACE_DIR") or os.path.join(tempfile.gettempdir(), "algorithm_traces")
+TRACE_DIR_MAX_BYTES = int(os.getenv("TRACE_DIR_MAX_BYTES", 2 * 1024 * 1024 * 1024))
+TRACE_SUFFIX = ".avtrace"
+
+
+class TraceStore:
+    def __init__(self, root: str = TRACE_DIR, max_bytes: int = TRACE_DIR_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def new_id(self) -> str:
+        return secrets.token_hex(8)
+
+    def path(self, trace_id: str) -> Optional[str]:
+        """Path of an existing trace, or None; ids are hex only, so they cannot escape the directory."""
+        if not trace_id or any(c not in "0123456789abcdef" for c in trace_id):
+            return None
+        path = os.path.join(self.root, trace_id + TRACE_SUFFIX)
+        return path if os.path.exists(path) else None
+
+    def staging_path(self, trace_id: str) -> str:
+        # Written under a dot-name and renamed into place, so readers never see a partial file
+        return os.path.join(self.root, f".{trace_id}.{os.getpid()}.tmp")
+
+    def commit(self, trace_id: str, staging: str) -> str:
+        path = os.path.join(self.root, trace_id + TRACE_SUFFIX)
+        os.replace(staging, path)
+        self._evict(keep=trace_id)
+        return path
+
+    def discard(self, staging: str) -> None:
+        try:
+            os.remove(staging)
+        except OSError:
+            pass
+
+    def open(self, trace_id: str) -> Optional[TraceReader]:
+        path = self.path(trace_id)
+        return TraceReader(path) if path else None
+
+    def delete(self, trace_id: str) -> bool:
+        path = self.path(trace_id)
+        if path is None:
+            return False
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
+
+    def list(self) -> List[Dict[str, Any]]:
+        traces = []
+        for trace_id, path, stat in self._entries():
+            try:
+                with TraceReader(path) as reader:
+                    meta = reader.describe()
+            except Exception:
+                continue
+            meta.pop("input", None)
+            meta.pop("fields", None)
+            traces.append({"id": trace_id, "created": stat.st_mtime, **meta})
+        return traces
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(TRACE_SUFFIX):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                entries.append((name[:-len(TRACE_SUFFIX)], path, os.stat(path)))
+            except OSError:
+                continue
+        entries.sort(key=lambda entry: entry[2].st_mtime, reverse=True)
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        with self._lock:
+            total = 0
+            for trace_id, path, stat in self._entries():
+                total += stat.st_size
+                if total > self.max_bytes and trace_id != keep:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
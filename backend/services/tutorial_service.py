@@ -1,95 +1,287 @@
-from typing import Dict, List, Optional
-from models.tutorial_models import Tutorial, TutorialStep, Quiz, QuizOption
-
-# Mock database of tutorials
-TUTORIALS_DB: Dict[str, Tutorial] = {
-    "sorting": Tutorial(
-        id="sorting",
-        title="Sorting Algorithms Mastery",
-        description="Learn about different sorting algorithms and their implementations",
-        difficulty="Beginner",
-        estimatedTime="30 minutes",
-        prerequisites=["basic-arrays"],
-        category="sorting",
-        icon="🔄",
-        steps=[
-            TutorialStep(
-                id="intro",
-                type="explanation",
-                title="Introduction to Sorting",
-                content="Sorting is a fundamental operation in computer science...",
-                interactive=True
-            ),
-            TutorialStep(
-                id="bubble-sort",
-                type="explanation",
-                title="Bubble Sort Algorithm",
-                content="Bubble Sort is the simplest sorting algorithm...",
-                codeExample="""def bubble_sort(arr):
-    n = len(arr)
-    for i in range(n):
-        for j in range(0, n-i-1):
-            if arr[j] > arr[j+1]:
-                arr[j], arr[j+1] = arr[j+1], arr[j]
-    return arr""",
-                interactive=True,
-                quiz=Quiz(
-                    question="What is the time complexity of Bubble Sort?",
-                    options=[
-                        QuizOption(text="O(n)", isCorrect=False),
-                        QuizOption(text="O(n²)", isCorrect=True),
-                        QuizOption(text="O(n log n)", isCorrect=False),
-                        QuizOption(text="O(1)", isCorrect=False)
-                    ],
-                    explanation="Bubble Sort uses nested loops, leading to O(n²) time complexity"
-                )
-            )
-        ]
-    ),
-    "graph": Tutorial(
-        id="graph",
-        title="Graph Algorithms",
-        description="Master graph traversal and pathfinding algorithms",
-        difficulty="Intermediate",
-        estimatedTime="45 minutes",
-        prerequisites=["basic-arrays", "sorting"],
-        category="graph",
-        icon="🕸️",
-        steps=[
-            TutorialStep(
-                id="intro",
-                type="explanation",
-                title="Introduction to Graphs",
-                content="Graphs are versatile data structures...",
-                interactive=True
-            )
-        ]
-    )
-}
+import hashlib
+import heapq
+import json
+import os
+import re
+import threading
+from collections import Counter
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.tutorial_models import Tutorial
+
+# Tutorials are content files (one tutorial, or a list of them, per .json/.yaml file) loaded once;
+# files are read in name order, so a numeric prefix ("01-sorting.json") sets the catalogue order
+TUTORIALS_DIR = Path(os.getenv("TUTORIALS_DIR", Path(__file__).resolve().parents[1] / "content" / "tutorials"))
+TUTORIAL_CACHE_MAX_AGE = int(os.getenv("TUTORIAL_CACHE_MAX_AGE", 300))
+# Rendered list responses kept per distinct filter/page combination
+RENDERED_CACHE_SIZE = 256
+
+INDEXED_FIELDS = ("difficulty", "category", "prerequisite")
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# Full-text search weights: a hit in a title counts for more than one in body text or code
+SEARCH_WEIGHTS = {"title": 5, "description": 3, "step_title": 3, "content": 1, "code": 1}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+class PrerequisiteCycleError(ValueError):
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Prerequisite cycle: {' -> '.join(cycle)}")
+
+
+class TutorialStore:
+    def __init__(self, directory: Path = TUTORIALS_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """(Re)read every content file and rebuild the indexes and pre-serialised bodies."""
+        tutorials: Dict[str, Tutorial] = {}
+        mtime = 0.0
+        files = sorted(p for p in self.directory.glob("*") if p.suffix in (".json", ".yaml", ".yml"))
+        for path in files:
+            for raw in self._read(path):
+                tutorial = Tutorial.model_validate(raw)
+                if tutorial.id in tutorials:
+                    raise ValueError(f"Duplicate tutorial id '{tutorial.id}' in {path.name}")
+                tutorials[tutorial.id] = tutorial
+            mtime = max(mtime, path.stat().st_mtime)
+
+        bodies = {tid: t.model_dump_json().encode("utf-8") for tid, t in tutorials.items()}
+        etags = {tid: self._etag(body) for tid, body in bodies.items()}
+        indexes: Dict[str, Dict[str, List[str]]] = {field: {} for field in INDEXED_FIELDS}
+        for tid, tutorial in tutorials.items():
+            indexes["difficulty"].setdefault(tutorial.difficulty.lower(), []).append(tid)
+            indexes["category"].setdefault(tutorial.category.lower(), []).append(tid)
+            for prerequisite in tutorial.prerequisites:
+                indexes["prerequisite"].setdefault(prerequisite.lower(), []).append(tid)
+
+        postings: Dict[str, Dict[str, int]] = {}
+        for tid, tutorial in tutorials.items():
+            for token, score in self._term_scores(tutorial).items():
+                postings.setdefault(token, {})[tid] = score
+
+        digest = hashlib.sha256()
+        for tid, body in bodies.items():
+            digest.update(body)
+        with self._lock:
+            self.tutorials = tutorials
+            self.order = {tid: i for i, tid in enumerate(tutorials)}
+            self.bodies = bodies
+            self.etags = etags
+            self.indexes = indexes
+            self.version = digest.hexdigest()[:16]
+            self.last_modified = formatdate(mtime or None, usegmt=True)
+            self.postings = postings
+            self._rendered: Dict[Tuple, Tuple[bytes, str, int]] = {}
+            # Learning paths only depend on the catalogue, so they are memoised until the next load
+            self._paths: Dict[str, Tuple[bytes, str]] = {}
+        print(f"📚 Loaded {len(tutorials)} tutorials from {self.directory}")
+
+    @staticmethod
+    def _read(path: Path) -> List[dict]:
+        text = path.read_text(encoding="utf-8")
+        if path.suffix == ".json":
+            data = json.loads(text)
+        else:
+            try:
+                import yaml  # type: ignore
+            except ImportError:
+                print(f"⚠️  Skipping {path.name}: YAML tutorials need the optional 'PyYAML' package")
+                return []
+            data = yaml.safe_load(text)
+        return data if isinstance(data, list) else [data]
+
+    # -------- Queries --------
+    def get(self, tutorial_id: str) -> Optional[Tutorial]:
+        return self.tutorials.get(tutorial_id)
+
+    def get_body(self, tutorial_id: str) -> Optional[Tuple[bytes, str]]:
+        body = self.bodies.get(tutorial_id)
+        return (body, self.etags[tutorial_id]) if body is not None else None
+
+    def query(self, difficulty: Optional[str] = None, category: Optional[str] = None,
+              prerequisite: Optional[str] = None) -> List[str]:
+        """Ids matching every given filter (case-insensitive), in catalogue order."""
+        matched = None
+        for field, value in zip(INDEXED_FIELDS, (difficulty, category, prerequisite)):
+            if value is None:
+                continue
+            ids = set(self.indexes[field].get(value.lower(), ()))
+            matched = ids if matched is None else matched & ids
+        if matched is None:
+            return list(self.tutorials)
+        return sorted(matched, key=self.order.__getitem__)
+
+    def render(self, difficulty: Optional[str] = None, category: Optional[str] = None,
+               prerequisite: Optional[str] = None, offset: int = 0,
+               limit: Optional[int] = None) -> Tuple[bytes, str, int]:
+        """JSON array body, its ETag and the total match count, spliced from pre-serialised tutorials."""
+        key = (difficulty and difficulty.lower(), category and category.lower(),
+               prerequisite and prerequisite.lower(), offset, limit)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            ids = self.query(difficulty, category, prerequisite)
+            page = ids[offset:offset + limit if limit is not None else None]
+            body = b"[" + b",".join(self.bodies[tid] for tid in page) + b"]"
+            rendered = (body, self._etag(body), len(ids))
+            if len(self._rendered) >= RENDERED_CACHE_SIZE:
+                self._rendered.clear()
+            self._rendered[key] = rendered
+        return rendered
+
+    # -------- Learning paths --------
+    def learning_path(self, target: str) -> Dict[str, Any]:
+        """
+        Every tutorial needed before `target` (transitively), in an order that respects all
+        prerequisites, ending with `target`. Prerequisites that are not in the catalogue are
+        listed under `missing`; a prerequisite cycle raises PrerequisiteCycleError.
+        """
+        if target not in self.tutorials:
+            raise KeyError(target)
+        # Collect the target's ancestors in the prerequisite DAG
+        needed, missing = {target}, []
+        stack = [target]
+        while stack:
+            for prerequisite in self.tutorials[stack.pop()].prerequisites:
+                if prerequisite not in self.tutorials:
+                    if prerequisite not in missing:
+                        missing.append(prerequisite)
+                elif prerequisite not in needed:
+                    needed.add(prerequisite)
+                    stack.append(prerequisite)
+
+        # Kahn's algorithm on that subgraph; ties go to catalogue order so the path is stable
+        indegree = {tid: 0 for tid in needed}
+        unlocks: Dict[str, List[str]] = {tid: [] for tid in needed}
+        for tid in needed:
+            for prerequisite in dict.fromkeys(self.tutorials[tid].prerequisites):
+                if prerequisite in needed:
+                    indegree[tid] += 1
+                    unlocks[prerequisite].append(tid)
+        ready = [(self.order[tid], tid) for tid, degree in indegree.items() if degree == 0]
+        heapq.heapify(ready)
+        path = []
+        while ready:
+            _, tid = heapq.heappop(ready)
+            path.append(tid)
+            for nxt in unlocks[tid]:
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    heapq.heappush(ready, (self.order[nxt], nxt))
+        if len(path) < len(needed):
+            raise PrerequisiteCycleError(self._find_cycle({tid for tid, d in indegree.items() if d > 0}))
+        return {
+            "target": target,
+            "path": [self._summary(tid) for tid in path],
+            "missing": missing,
+            "catalogueVersion": self.version,
+        }
+
+    def render_learning_path(self, target: str) -> Tuple[bytes, str]:
+        rendered = self._paths.get(target)
+        if rendered is None:
+            body = json.dumps(self.learning_path(target), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            rendered = self._paths[target] = (body, self._etag(body))
+        return rendered
+
+    def _find_cycle(self, blocked: set) -> List[str]:
+        # Every blocked node has a blocked prerequisite, so walking those must revisit a node
+        node = min(blocked, key=self.order.__getitem__)
+        seen: Dict[str, int] = {}
+        walk: List[str] = []
+        while node not in seen:
+            seen[node] = len(walk)
+            walk.append(node)
+            node = next(p for p in self.tutorials[node].prerequisites if p in blocked)
+        cycle = walk[seen[node]:] + [node]
+        # Report it in learning order: prerequisite -> dependant
+        return cycle[::-1]
+
+    # -------- Search --------
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Tutorials containing every query term, ranked by weighted term frequency."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return {"query": query, "total": 0, "results": []}
+        lists = sorted((self.postings.get(term, {}) for term in terms), key=len)
+        # Intersect starting from the rarest term, so the work is bounded by its posting list
+        scores = dict(lists[0])
+        for posting in lists[1:]:
+            scores = {tid: score + posting[tid] for tid, score in scores.items() if tid in posting}
+            if not scores:
+                break
+        ranked = heapq.nsmallest(offset + limit, scores, key=lambda tid: (-scores[tid], self.order[tid]))
+        return {
+            "query": query,
+            "total": len(scores),
+            "results": [{**self._summary(tid), "score": scores[tid]} for tid in ranked[offset:]],
+        }
+
+    @staticmethod
+    def _term_scores(tutorial: Tutorial) -> Counter:
+        scores: Counter = Counter()
+        fields = [("title", tutorial.title), ("description", tutorial.description)]
+        for step in tutorial.steps:
+            fields += [("step_title", step.title), ("content", step.content), ("code", step.codeExample)]
+            if step.quiz:
+                fields += [("content", step.quiz.question), ("content", step.quiz.explanation)]
+        for field, text in fields:
+            for token in tokenize(text):
+                scores[token] += SEARCH_WEIGHTS[field]
+        return scores
+
+    def _summary(self, tutorial_id: str) -> Dict[str, Any]:
+        tutorial = self.tutorials[tutorial_id]
+        return {
+            "id": tutorial.id,
+            "title": tutorial.title,
+            "difficulty": tutorial.difficulty,
+            "category": tutorial.category,
+            "estimatedTime": tutorial.estimatedTime,
+        }
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+_store: Optional[TutorialStore] = None
+
+
+def get_tutorial_store() -> TutorialStore:
+    global _store
+    if _store is None:
+        _store = TutorialStore()
+    return _store
+
 
 class TutorialService:
     @staticmethod
     def get_all_tutorials() -> List[Tutorial]:
         """Get all available tutorials."""
-        return list(TUTORIALS_DB.values())
+        return list(get_tutorial_store().tutorials.values())
 
     @staticmethod
     def get_tutorial_by_id(tutorial_id: str) -> Optional[Tutorial]:
         """Get a specific tutorial by ID."""
-        return TUTORIALS_DB.get(tutorial_id)
+        return get_tutorial_store().get(tutorial_id)
 
     @staticmethod
     def get_tutorials_by_difficulty(difficulty: str) -> List[Tutorial]:
         """Get tutorials filtered by difficulty level."""
-        return [
-            tutorial for tutorial in TUTORIALS_DB.values()
-            if tutorial.difficulty.lower() == difficulty.lower()
-        ]
+        store = get_tutorial_store()
+        return [store.tutorials[tid] for tid in store.query(difficulty=difficulty)]
 
     @staticmethod
     def get_tutorials_by_category(category: str) -> List[Tutorial]:
         """Get tutorials filtered by category."""
-        return [
-            tutorial for tutorial in TUTORIALS_DB.values()
-            if tutorial.category.lower() == category.lower()
-        ]
+        store = get_tutorial_store()
+        return [store.tutorials[tid] for tid in store.query(category=category)]
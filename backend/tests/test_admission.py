@@ -0,0 +1,78 @@
+import pytest
+
+from utils.admission import AdmissionController, AdmissionRejected, estimate_cost
+
+
+def test_first_request_may_spend_the_whole_burst():
+    controller = AdmissionController(burst=1_000_000, rate=1)
+    controller.charge("client", 1_000_000)
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.charge("client", 1)
+    assert rejected.value.status_code == 429
+    assert rejected.value.headers["Retry-After"] == "1"
+
+
+def test_request_above_the_ceiling_is_refused_even_with_a_full_bucket():
+    controller = AdmissionController(burst=30_000_000, rate=1e12)
+    cost = estimate_cost("sorting", "bubble", n=10 ** 6)
+    for _ in range(2):
+        with pytest.raises(AdmissionRejected) as rejected:
+            controller.charge("client", cost)
+        assert rejected.value.status_code == 413
+        assert rejected.value.headers is None
+    assert controller.stats["rejected_size"] == 2
+    assert "client" not in controller.buckets
+
+
+def test_trace_mode_sorting_inputs_are_capped():
+    import numpy as np
+    from fastapi.testclient import TestClient
+
+    import main
+    from models.api_models import TRACE_MAX_ELEMENTS
+
+    client = TestClient(main.app)
+    too_long = list(range(TRACE_MAX_ELEMENTS + 1))
+    assert client.post("/api/sorting/bubble", json={"array": too_long}).status_code == 422
+    body = np.arange(TRACE_MAX_ELEMENTS + 1, dtype=np.int32).tobytes()
+    response = client.post("/api/sorting/bubble/binary?mode=trace", content=body,
+                           headers={"content-type": "application/octet-stream"})
+    assert response.status_code == 413
+
+
+def test_traces_are_priced_by_the_state_each_step_copies():
+    from utils.admission import STRING_COST, dp_dimensions
+    from services.string_service import StringService
+
+    # 120-character LCS: 14,400 cells, each step copying the whole table
+    lcs = estimate_cost("dp", "lcs", **dp_dimensions("lcs", {"text1": "a" * 120, "text2": "b" * 120}))
+    assert lcs > 30_000_000
+    assert estimate_cost("sorting", "bubble", n=200) == 200 ** 3
+    assert estimate_cost("sorting", "bubble", mode="native", n=200) < 200 ** 2
+    banded = dp_dimensions("edit_distance", {"text1": "a" * 120, "text2": "b" * 120, "mode": "banded"})
+    assert estimate_cost("dp", "edit_distance", **banded) < lcs / 100
+    assert set(StringService().algorithms) <= set(STRING_COST)
+
+
+def test_traces_are_built_off_the_event_loop(monkeypatch):
+    import asyncio
+    from fastapi.testclient import TestClient
+
+    import main
+
+    service = main.get_string_service()
+    build = service.run_algorithm
+    loops = []
+
+    def recording(*args):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return build(*args)
+
+    monkeypatch.setattr(service, "run_algorithm", recording)
+    response = TestClient(main.app).post("/api/string/kmp", json={"text": "abcabc", "pattern": "bc"})
+    found = [step["operation"] for step in response.json()["steps"] if step["operation"].startswith("Pattern found")]
+    assert found == ["Pattern found at index 1", "Pattern found at index 4"]
+    assert loops == [None]
@@ -0,0 +1,59 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "ADMISSION_ENABLED", False)
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("algorithm, params", [
+    ("lcs", {"text1": "abcde", "text2": "ace"}),
+    ("lcs", {"text1": "abcde", "text2": "ace", "mode": "memo"}),
+    ("edit_distance", {"text1": "kitten", "text2": "sitting", "mode": "banded"}),
+    ("needleman_wunsch", {"text1": "GATTACA", "text2": "GCATGCU", "mode": "linear"}),
+    ("smith_waterman", {"text1": "TGTTACGG", "text2": "GGTTGACTA"}),
+])
+def test_dp_route_returns_steps(client, algorithm, params):
+    body = client.post(f"/api/dp/{algorithm}", json=params).json()
+    assert "error" not in body
+    assert body["steps"]
+
+
+def test_dp_route_reports_unknown_algorithms(client):
+    body = client.post("/api/dp/unknown", json={}).json()
+    assert body["steps"] == [] and "error" in body
+
+
+def test_edit_distance_result(client):
+    steps = client.post("/api/dp/edit_distance", json={"text1": "kitten", "text2": "sitting"}).json()["steps"]
+    assert steps[-1]["distance"] == 3
+
+
+def test_memo_knapsack_with_a_huge_capacity_is_admitted():
+    body = TestClient(main.app).post("/api/dp/knapsack", json={
+        "weights": [3, 4, 5, 9, 4], "values": [3, 4, 4, 10, 4], "capacity": 10 ** 8, "mode": "memo",
+    }).json()
+    assert "error" not in body
+    assert body["steps"][-1]["result"] == 25
+
+
+def test_memo_array_store_refuses_huge_tables(client):
+    body = client.post("/api/dp/knapsack", json={
+        "weights": [1, 2], "values": [1, 2], "capacity": 10 ** 8, "mode": "memo", "memo": "array",
+    }).json()
+    assert body["steps"] == [] and "dict or lru store" in body["error"]
+
+
+@pytest.mark.parametrize("algorithm, mode", [
+    ("edit_distance", "banded"), ("needleman_wunsch", "linear"), ("smith_waterman", "linear"),
+])
+def test_banded_and_linear_steps_send_the_inputs_once(client, algorithm, mode):
+    params = {"text1": "GATTACAGATTACA", "text2": "GCATGCUGATTACA", "mode": mode, "band": 0}
+    steps = client.post(f"/api/dp/{algorithm}", json=params).json()["steps"]
+    assert len(steps) > 2
+    assert steps[0]["text1"] == params["text1"] and steps[0]["text2"] == params["text2"]
+    assert not any("text1" in step or "text2" in step for step in steps[1:])
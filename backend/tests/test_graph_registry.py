@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.dynamic_sssp import SSSPTreeCache
+from services.graph_registry import GraphBusyError, GraphRegistry
+from utils.shared_store import MemoryStore, SQLiteStore
+
+GRAPH = {
+    "nodes": [{"id": i, "label": str(i)} for i in range(4)],
+    "edges": [{"from": 0, "to": 1, "weight": 1}, {"from": 1, "to": 2, "weight": 2}, {"from": 2, "to": 3, "weight": 1}],
+}
+EDIT = {"edits": [{"op": "set_weight", "from_node": 0, "to": 1, "weight": 5}]}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "_graph_registry", GraphRegistry(MemoryStore()))
+    monkeypatch.setattr(main, "_sssp_trees", SSSPTreeCache())
+    return TestClient(main.app)
+
+
+def test_edit_after_delete_does_not_recreate_the_graph(client):
+    graph_id = client.post("/api/graphs", json=GRAPH).json()["id"]
+    assert client.patch(f"/api/graphs/{graph_id}", json=EDIT).status_code == 200
+    assert client.delete(f"/api/graphs/{graph_id}").status_code == 200
+    assert client.patch(f"/api/graphs/{graph_id}", json=EDIT).status_code == 404
+    assert client.get(f"/api/graphs/{graph_id}").status_code == 404
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_concurrent_version_bumps_are_unique(backend, tmp_path):
+    store = MemoryStore() if backend == "memory" else SQLiteStore(str(tmp_path / "store.sqlite3"))
+    registry = GraphRegistry(store)
+    versions = []
+
+    def bump():
+        for _ in range(50):
+            versions.append(registry._bump_version("g"))
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(versions) == list(range(1, 201))
+
+
+def test_graph_lock_is_exclusive(tmp_path):
+    registry = GraphRegistry(SQLiteStore(str(tmp_path / "store.sqlite3")))
+    with registry.lock("g"):
+        with pytest.raises(GraphBusyError):
+            with registry.lock("g", timeout=0.05):
+                pass
+    with registry.lock("g", timeout=0.05):
+        pass
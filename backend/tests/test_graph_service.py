@@ -0,0 +1,111 @@
+import pytest
+
+from models.api_models import GraphRequest
+from services.graph_service import GraphService
+from utils.engine_loader import get_engine
+
+requires_engine = pytest.mark.skipif(get_engine() is None, reason="C++ engine not built")
+
+
+def grid_request(side, **kwargs):
+    nodes = [{"id": i, "label": str(i)} for i in range(side * side)]
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            i = r * side + c
+            if c + 1 < side:
+                edges.append({"from": i, "to": i + 1})
+            if r + 1 < side:
+                edges.append({"from": i, "to": i + side})
+    return GraphRequest(nodes=nodes, edges=edges, **kwargs)
+
+
+@requires_engine
+@pytest.mark.parametrize("algorithm", ["bfs", "dfs"])
+def test_engine_traversal_visited_sets_grow_by_one(algorithm):
+    steps = list(GraphService().iter_steps(algorithm, grid_request(12)))
+    visits = [s for s in steps if s["operation"].startswith("Visiting node")]
+    assert len(visits) == 144
+    for count, step in enumerate(visits, 1):
+        assert len(step["visitedNodes"]) == count
+
+
+def weighted_request(edges, **kwargs):
+    nodes = [{"id": i, "label": str(i)} for i in range(5)]
+    return GraphRequest(
+        nodes=nodes,
+        edges=[{"from": u, "to": v, "weight": w, "directed": True} for u, v, w in edges],
+        **kwargs,
+    )
+
+
+DAG_EDGES = [(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (2, 3, 5), (3, 4, 3)]
+NEGATIVE_CYCLE_EDGES = [(0, 1, 1), (1, 2, -1), (2, 3, -1), (3, 1, -1), (3, 4, 2)]
+RESULT_KEYS = ("matrix", "order", "components", "negativeCycle", "visitedEdges", "distances")
+
+
+@requires_engine
+@pytest.mark.parametrize("algorithm, edges", [
+    ("bellman_ford", DAG_EDGES),
+    ("bellman_ford", NEGATIVE_CYCLE_EDGES),
+    ("floyd_warshall", DAG_EDGES),
+    ("topological_sort", DAG_EDGES),
+    ("topological_sort", NEGATIVE_CYCLE_EDGES),
+    ("scc", NEGATIVE_CYCLE_EDGES),
+])
+def test_engine_result_keys_match_fallback(algorithm, edges):
+    service = GraphService()
+    request = weighted_request(edges, start_node=0, end_node=4)
+    engine_final = list(service.iter_steps(algorithm, request))[-1]
+    fallback_final = list(getattr(service, f"_fallback_{algorithm}")(request))[-1]
+    for key in RESULT_KEYS:
+        assert engine_final.get(key) == fallback_final.get(key), key
+
+
+@pytest.mark.parametrize("algorithm", ["bellman_ford", "floyd_warshall"])
+def test_unknown_start_node_is_rejected(algorithm):
+    with pytest.raises(ValueError):
+        GraphService().iter_steps(algorithm, weighted_request(DAG_EDGES, start_node=100000))
+
+
+@requires_engine
+def test_engine_rejects_out_of_range_start():
+    service = GraphService()
+    graph = service._build_cpp_graph(weighted_request(DAG_EDGES))
+    with pytest.raises(IndexError):
+        graph.bellman_ford(100000)
+    with pytest.raises(IndexError):
+        graph.floyd_warshall(0, 100000)
+
+
+def test_csr_dijkstra_counts_stale_heap_entries():
+    from utils.csr import CSRGraph
+
+    # 1 is pushed twice (via 0, then cheaper via 2), so one pop is stale
+    graph = CSRGraph.from_edges([0, 0, 2], [1, 2, 1], [5.0, 1.0, 1.0], num_nodes=3, directed=True)
+    result = GraphService()._csr_dijkstra(graph, 0, None)
+    pops, scanned, pushes = 4, 3, 3
+    assert result['operations'] == pops + scanned + pushes
+
+
+def test_csr_dfs_counts_every_pop():
+    from utils.csr import CSRGraph
+
+    triangle = CSRGraph.from_edges([0, 1, 2], [1, 2, 0], num_nodes=3)
+    result = GraphService()._csr_dfs(triangle, 0, None)
+    # Both neighbours of 0 are pushed, and 2 is pushed again from 1, leaving one stale pop
+    assert result['operations'] > triangle.num_nodes + triangle.indices.size
+
+
+def test_topological_sort_needs_directed_edges():
+    request = GraphRequest(nodes=[{"id": 0}, {"id": 1}, {"id": 2}], edges=[{"from": 0, "to": 1}, {"from": 1, "to": 2}])
+    with pytest.raises(ValueError, match="needs directed edges"):
+        GraphService().iter_steps("topological_sort", request)
+
+
+@requires_engine
+def test_engine_topological_sort_rejects_undirected_edges():
+    graph = GraphService()._build_cpp_graph(
+        GraphRequest(nodes=[{"id": 0}, {"id": 1}], edges=[{"from": 0, "to": 1}]))
+    with pytest.raises(ValueError, match="needs directed edges"):
+        graph.topological_sort()
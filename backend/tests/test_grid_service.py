@@ -0,0 +1,29 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from services.grid_service import GridMap, GridService
+
+
+def random_grid(rng, side, diagonal):
+    costs = np.where(rng.random(side * side) < 0.25, 0, 1).astype(np.uint8)
+    costs[0] = costs[-1] = 1
+    return GridMap(side, side, costs, diagonal=diagonal)
+
+
+def run(algorithm, grid):
+    return asyncio.run(GridService().execute(algorithm, grid, (0, 0), (grid.width - 1, grid.height - 1)))
+
+
+def test_jps_rejects_four_connected_grids():
+    grid = random_grid(np.random.default_rng(0), 8, diagonal=False)
+    with pytest.raises(ValueError, match="8-connected"):
+        run("jps", grid)
+
+
+def test_jps_matches_dijkstra_on_eight_connected_grids():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        grid = random_grid(rng, 12, diagonal=True)
+        assert run("jps", grid)["cost"] == run("dijkstra", grid)["cost"]
@@ -0,0 +1,19 @@
+import asyncio
+
+import pytest
+
+from services.large_sorting_service import LargeSortingService
+
+
+@pytest.mark.parametrize("algorithm", sorted(LargeSortingService().algorithms))
+def test_every_large_mode_algorithm_produces_intermediate_frames(algorithm):
+    service = LargeSortingService()
+    result = asyncio.run(service.execute(algorithm, service.generate(4096, seed=1), frames=8, bins=16))
+    assert result["sorted"]
+    assert len(result["frames"]) > 2
+
+
+def test_single_call_sorts_are_not_offered_in_large_mode():
+    service = LargeSortingService()
+    with pytest.raises(ValueError, match="supported: counting, merge, radix, shell"):
+        asyncio.run(service.execute("quick", service.generate(16, seed=1)))
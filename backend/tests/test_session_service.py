@@ -0,0 +1,62 @@
+from functools import partial
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.session_service import SessionManager, StepSession
+from services.sorting_service import SortingService
+from utils.engine_loader import get_engine
+
+requires_engine = pytest.mark.skipif(get_engine() is None, reason="C++ engine not built")
+
+
+def list_factory(n):
+    return lambda: iter([{"i": i} for i in range(n)])
+
+
+def test_backward_seek_restarts_a_list_iterator():
+    session = StepSession(list_factory(10), window=2)
+    assert [s["i"] for s in session.next(8)] == list(range(8))
+    assert session.seek(1) == 1
+    assert [s["i"] for s in session.next(2)] == [1, 2]
+    session.close()
+
+
+def test_release_closes_list_iterator_sessions():
+    manager = SessionManager(max_sessions=1)
+    session = manager.open(list_factory(3))
+    session.next(1)
+    manager.release(session)
+    assert manager.active == 0
+
+
+@requires_engine
+def test_engine_session_seeks_back_past_window():
+    service = SortingService()
+    array = [5, 3, 8, 1, 9, 2, 7]
+    expected = list(service.iter_steps("bubble", array))
+    session = StepSession(lambda: service.iter_steps("bubble", array), window=2)
+    session.next(len(expected))
+    assert session.seek(0) == 0
+    assert session.next(3) == expected[:3]
+    session.close()
+
+
+@requires_engine
+def test_websocket_seek_with_engine(monkeypatch):
+    manager = SessionManager()
+    monkeypatch.setattr(manager, "open", partial(manager.open, window=2))
+    monkeypatch.setattr(main, "_session_manager", manager)
+    monkeypatch.setattr(main, "ADMISSION_ENABLED", False)
+    with TestClient(main.app).websocket_connect("/ws/run") as ws:
+        ws.send_json({"type": "start", "kind": "sorting", "algorithm": "bubble", "input": {"array": [4, 3, 2, 1]}})
+        assert ws.receive_json()["type"] == "started"
+        ws.send_json({"type": "next", "count": 6})
+        assert len(ws.receive_json()["steps"]) == 6
+        ws.send_json({"type": "seek", "step": 1})
+        reply = ws.receive_json()
+        assert (reply["type"], reply["step"]) == ("seeked", 1)
+        ws.send_json({"type": "next", "count": 1})
+        assert ws.receive_json()["start"] == 1
+    assert manager.active == 0
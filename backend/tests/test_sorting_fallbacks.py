@@ -0,0 +1,50 @@
+import math
+import random
+
+import pytest
+
+from services.sorting_service import SortingService
+
+SIZES = (64, 256, 1024)
+FALLBACKS = ("_quick_fallback", "_heap_fallback")
+
+
+def make_input(shape, n):
+    rng = random.Random(n)
+    if shape == "random":
+        return [rng.randrange(n) for _ in range(n)]
+    if shape == "sorted":
+        return list(range(n))
+    if shape == "reversed":
+        return list(range(n, 0, -1))
+    return [7] * n  # all duplicates: the three-way partition finishes in one pass
+
+
+def run(fallback, array):
+    """Step count, operation count and final array, without keeping every step in memory."""
+    count, last = 0, None
+    for last in getattr(SortingService(), fallback)(array):
+        count += 1
+    return count, last["operations_count"], last["array"]
+
+
+@pytest.mark.parametrize("fallback", FALLBACKS)
+@pytest.mark.parametrize("shape", ["random", "sorted", "reversed", "duplicates"])
+def test_fallback_sorts_with_n_log_n_steps(fallback, shape):
+    step_ratios, op_ratios = [], []
+    for n in SIZES:
+        array = make_input(shape, n)
+        steps, operations, result = run(fallback, array)
+        assert result == sorted(array)
+        step_ratios.append(steps / (n * math.log2(n)))
+        op_ratios.append(operations / (n * math.log2(n)))
+    # O(n log n) keeps both ratios bounded; O(n²) would grow them about 4x per size here
+    for ratios in (step_ratios, op_ratios):
+        assert max(ratios) < 4
+        assert ratios[-1] <= ratios[0] * 1.5
+
+
+@pytest.mark.parametrize("fallback", FALLBACKS)
+def test_fallback_handles_tiny_inputs(fallback):
+    for array in ([], [1], [2, 1], [1, 1, 1]):
+        assert run(fallback, array)[2] == sorted(array)
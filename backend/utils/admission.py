@@ -0,0 +1,301 @@
+# Cost-based admission control: every request is priced from its input size and the algorithm's
+# complexity, charged against a per-client token bucket, and expensive work is capped per worker
+# so a burst of O(n²) traces queues (or is shed) instead of starving cheap requests.
+import asyncio
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional, Sequence, Union
+
+from fastapi import HTTPException
+from starlette.requests import HTTPConnection
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "1") != "0"
+# Costs are in rough microseconds of work; the budget is per client and per worker process
+ADMISSION_BURST = float(os.getenv("ADMISSION_BURST", 30_000_000))
+ADMISSION_RATE = float(os.getenv("ADMISSION_RATE", 500_000))
+# Hard ceiling on a single request: anything priced above it is refused with 413, whatever the bucket holds
+ADMISSION_MAX_COST = float(os.getenv("ADMISSION_MAX_COST", ADMISSION_BURST))
+# Requests at or below this cost skip the expensive-work queue entirely
+ADMISSION_CHEAP_COST = float(os.getenv("ADMISSION_CHEAP_COST", 20_000))
+ADMISSION_MAX_EXPENSIVE = int(os.getenv("ADMISSION_MAX_EXPENSIVE", max(2, os.cpu_count() or 2)))
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", 32))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 5))
+ADMISSION_TRUST_PROXY = os.getenv("ADMISSION_TRUST_PROXY", "0") == "1"
+MAX_TRACKED_CLIENTS = 10_000
+
+
+def _log2(n: float) -> float:
+    return math.log2(n + 2)
+
+
+# Operation counts per algorithm, from the input dimensions: n (elements), v/e (nodes/edges),
+# m/n (string or DP table sides), cells (grid), capacity/amount (DP)
+SORTING_COST: Dict[str, Callable[..., float]] = {
+    'bubble': lambda n: n * n,
+    'insertion': lambda n: n * n,
+    'selection': lambda n: n * n,
+    'merge': lambda n: n * _log2(n),
+    'quick': lambda n: n * _log2(n),
+    'heap': lambda n: n * _log2(n),
+    'intro': lambda n: n * _log2(n),
+    'tim': lambda n: n * _log2(n),
+    'counting': lambda n: 2 * n,
+    'radix': lambda n: 4 * n,
+    'shell': lambda n: n ** 1.25,
+}
+GRAPH_COST: Dict[str, Callable[..., float]] = {
+    'bfs': lambda v, e: v + e,
+    'dfs': lambda v, e: v + e,
+    'bidirectional_bfs': lambda v, e: v + e,
+    'topological_sort': lambda v, e: v + e,
+    'scc': lambda v, e: v + e,
+    'dijkstra': lambda v, e: (v + e) * _log2(v),
+    'bidirectional_dijkstra': lambda v, e: (v + e) * _log2(v),
+    'astar': lambda v, e: (v + e) * _log2(v),
+    'kruskal': lambda v, e: e * _log2(e),
+    'prim': lambda v, e: (v + e) * _log2(v),
+    'bellman_ford': lambda v, e: v * e,
+    'floyd_warshall': lambda v, e: v ** 3,
+}
+DP_COST: Dict[str, Callable[..., float]] = {
+    'lcs': lambda m, n, **_: m * n,
+    # Alignments take an optional band width: a banded run fills about m * band cells
+    'edit_distance': lambda m, n, band=None, **_: m * (n if band is None else min(n + 1, band)),
+    'needleman_wunsch': lambda m, n, band=None, **_: m * (n if band is None else min(n + 1, band)),
+    'smith_waterman': lambda m, n, **_: m * n,
+    'knapsack': lambda n, capacity, **_: n * capacity,
+    'coin_change': lambda n, amount, **_: n * amount,
+}
+STRING_COST: Dict[str, Callable[..., float]] = {
+    'naive': lambda n, m: n * m,
+    'kmp': lambda n, m: 2 * n + m,
+    # Z runs over pattern + separator + text
+    'z_algorithm': lambda n, m: 2 * (n + m),
+    # Worst case: every window's hash matches and is verified character by character
+    'rabin_karp': lambda n, m: n * m,
+    # Worst case: a match at every alignment still compares the whole pattern
+    'boyer_moore': lambda n, m: n * m,
+    'horspool': lambda n, m: n * m,
+}
+GRID_COST: Dict[str, Callable[..., float]] = {
+    'bfs': lambda cells: cells,
+    'dijkstra': lambda cells: cells * _log2(cells),
+    'astar': lambda cells: cells * _log2(cells),
+    'jps': lambda cells: cells * _log2(cells),
+}
+COST_MODELS = {'sorting': SORTING_COST, 'graph': GRAPH_COST, 'dp': DP_COST, 'string': STRING_COST, 'grid': GRID_COST}
+# Fallback for algorithms without an entry: linear in the total input size
+DEFAULT_COST = {'sorting': lambda n: n * _log2(n), 'graph': lambda v, e: v + e,
+                'dp': lambda **dims: sum(dims.values()), 'string': lambda n, m: n + m, 'grid': lambda cells: cells}
+
+# Traces build a Python step per operation; array kernels (numpy, CSR, C++) are far cheaper per op
+MODE_WEIGHT = {'trace': 1.0, 'python': 0.3, 'native': 0.02}
+
+# Every trace step copies the visible state (the array, visited map, strings or DP table), so a
+# trace costs operations x state size in both time and bytes. DP requests pass `state` themselves
+# because it depends on the mode (see dp_dimensions).
+TRACE_STATE: Dict[str, Callable[..., float]] = {
+    'sorting': lambda n: n,
+    'graph': lambda v, e: v,
+    'string': lambda n, m: n + m,
+    'grid': lambda cells: cells,
+}
+
+
+def dp_dimensions(algorithm: str, params: Dict) -> Dict[str, float]:
+    """
+    Table dimensions of a DP request, as the DP_COST models expect them, plus `state`: the values
+    one trace step carries. Full tables copy the whole table per step; banded rows, Hirschberg
+    splits and memo events carry a bounded slice of it.
+    """
+    whole_table = params.get('mode') in (None, '', 'full')
+    if algorithm in ('lcs', 'edit_distance', 'needleman_wunsch', 'smith_waterman'):
+        dims = {'m': len(params.get('text1') or ''), 'n': len(params.get('text2') or '')}
+        if params.get('mode') == 'banded':
+            # Both sides of the corner-to-corner diagonals, allowing for one doubling of the band
+            dims['band'] = abs(dims['m'] - dims['n']) + 4 * int(params.get('band') or 1) + 1
+        dims['state'] = (dims['m'] + 1) * (dims['n'] + 1) if whole_table else 1
+        return dims
+    if algorithm == 'knapsack':
+        dims = {'n': len(params.get('weights') or []), 'capacity': float(params.get('capacity') or 0)}
+        unbounded = params.get('type', '0/1') != '0/1'
+        table = (dims['capacity'] + 1) * (1 if unbounded else dims['n'] + 1)
+        dims['state'] = table if whole_table else 1
+        if params.get('mode') == 'memo' and not unbounded:
+            # Top-down only visits reachable states: after i items at most 2^i distinct capacities remain
+            dims['capacity'] = min(dims['capacity'], 2.0 ** min(dims['n'], 62))
+        return dims
+    if algorithm == 'coin_change':
+        dims = {'n': len(params.get('coins') or []), 'amount': float(params.get('amount') or 0)}
+        dims['state'] = dims['amount'] + 1 if whole_table else 1
+        return dims
+    return {'n': float(sum(len(v) for v in params.values() if isinstance(v, (list, str))))}
+
+
+def estimate_cost(kind: str, algorithm: str, mode: str = 'trace', **dims) -> float:
+    state = dims.pop('state', None)
+    models = COST_MODELS.get(kind, {})
+    model = models.get(algorithm) or models.get(algorithm.split('_')[0]) or DEFAULT_COST[kind]
+    cost = float(model(**dims)) * MODE_WEIGHT[mode]
+    if mode == 'trace':
+        if state is None:
+            state = TRACE_STATE[kind](**dims) if kind in TRACE_STATE else 1
+        cost *= max(1.0, float(state))
+    return max(1.0, cost)
+
+
+class AdmissionRejected(HTTPException):
+    def __init__(self, status_code: int, reason: str, retry_after: Optional[float] = None):
+        # No Retry-After when waiting cannot help (a request over the cost ceiling)
+        self.retry_after = None if retry_after is None else max(1, math.ceil(retry_after))
+        headers = None if self.retry_after is None else {"Retry-After": str(self.retry_after)}
+        super().__init__(status_code=status_code, detail=reason, headers=headers)
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, capacity: float, now: float):
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, capacity: float, rate: float, now: float) -> None:
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+
+class AdmissionController:
+    def __init__(self, burst: float = ADMISSION_BURST, rate: float = ADMISSION_RATE,
+                 cheap_cost: float = ADMISSION_CHEAP_COST, max_expensive: int = ADMISSION_MAX_EXPENSIVE,
+                 queue_size: int = ADMISSION_QUEUE_SIZE, queue_timeout: float = ADMISSION_QUEUE_TIMEOUT,
+                 max_cost: Optional[float] = None):
+        self.burst = burst
+        self.rate = rate
+        self.max_cost = min(burst, ADMISSION_MAX_COST) if max_cost is None else max_cost
+        self.cheap_cost = cheap_cost
+        self.max_expensive = max_expensive
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.running = 0
+        self.waiting = 0
+        self.running_cost = 0.0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.stats = {"admitted": 0, "cheap": 0, "queued": 0, "rejected_budget": 0, "rejected_size": 0, "shed": 0}
+
+    def charge(self, client: str, cost: float) -> None:
+        """
+        Take `cost` tokens from the client's bucket or raise 429 with the time until they refill.
+        A request priced above max_cost is refused with 413: no amount of waiting makes it affordable.
+        """
+        if cost > self.max_cost:
+            self.stats["rejected_size"] += 1
+            raise AdmissionRejected(413, f"Input too large for this algorithm (estimated cost {cost:.3g}, "
+                                         f"limit {self.max_cost:.3g}); use a smaller input or a result-only mode")
+        now = time.monotonic()
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            if len(self.buckets) >= MAX_TRACKED_CLIENTS:
+                self._prune(now)
+            bucket = self.buckets[client] = TokenBucket(self.burst, now)
+        bucket.refill(self.burst, self.rate, now)
+        if bucket.tokens < cost:
+            self.stats["rejected_budget"] += 1
+            raise AdmissionRejected(429, "Rate limit exceeded for this client; retry later",
+                                    (cost - bucket.tokens) / self.rate)
+        bucket.tokens -= cost
+
+    @asynccontextmanager
+    async def admit(self, client: str, cost: float):
+        self.charge(client, cost)
+        if cost <= self.cheap_cost:
+            self.stats["cheap"] += 1
+            yield
+            return
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_expensive)
+        if self._slots.locked():
+            # Shed rather than queue without bound; the backlog's cost sets the Retry-After hint
+            if self.waiting >= self.queue_size:
+                self._shed(client, cost)
+            self.stats["queued"] += 1
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._shed(client, cost)
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        self.running_cost += cost
+        self.stats["admitted"] += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self.running_cost -= cost
+            self._slots.release()
+
+    def _shed(self, client: str, cost: float) -> None:
+        # Shedding is the server's doing, so the client gets its tokens back
+        bucket = self.buckets.get(client)
+        if bucket is not None:
+            bucket.tokens = min(self.burst, bucket.tokens + cost)
+        self.stats["shed"] += 1
+        # Cost units are ~microseconds, spread over the expensive slots
+        raise AdmissionRejected(503, "Server is busy; retry later", self.running_cost / 1e6 / max(1, self.max_expensive))
+
+    def _prune(self, now: float) -> None:
+        # Clients whose buckets have refilled completely carry no state worth keeping
+        for client in [c for c, b in self.buckets.items() if b.tokens + (now - b.updated) * self.rate >= self.burst]:
+            del self.buckets[client]
+
+    def describe(self) -> Dict[str, object]:
+        return {
+            "enabled": ADMISSION_ENABLED,
+            "running": self.running,
+            "waiting": self.waiting,
+            "maxExpensive": self.max_expensive,
+            "maxCost": self.max_cost,
+            "clients": len(self.buckets),
+            **self.stats,
+        }
+
+
+def client_id(request: HTTPConnection) -> str:
+    if ADMISSION_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
+
+
+@asynccontextmanager
+async def admission(request: HTTPConnection, kind: str, algorithm: Union[str, Sequence[str]],
+                    mode: str = 'trace', cost_cap: Optional[float] = None, **dims):
+    """
+    Price the request and hold an admission slot for the duration of the block. `cost_cap` bounds
+    the price of work that stops itself on a time budget, whatever its input dimensions.
+    """
+    if not ADMISSION_ENABLED:
+        yield
+        return
+    # A race runs several algorithms on the same input and pays for all of them
+    algorithms = [algorithm] if isinstance(algorithm, str) else algorithm
+    cost = sum(estimate_cost(kind, name, mode, **dims) for name in algorithms)
+    if cost_cap is not None:
+        cost = min(cost, cost_cap)
+    async with get_admission_controller().admit(client_id(request), cost):
+        yield
@@ -0,0 +1,106 @@
+# Zero-copy parsing of binary request bodies: raw little-endian buffers, .npy and Arrow IPC
+import ast
+from typing import Optional, Tuple
+
+import numpy as np
+
+NPY_MAGIC = b"\x93NUMPY"
+ARROW_FILE_MAGIC = b"ARROW1"
+ARROW_STREAM_CONTINUATION = b"\xff\xff\xff\xff"
+
+ARRAY_DTYPES = {
+    "int32": np.dtype("<i4"),
+    "int64": np.dtype("<i8"),
+    "float64": np.dtype("<f8"),
+}
+
+# Packed edge record: from (int32), to (int32), weight (float64) -> 16 bytes per edge
+EDGE_RECORD = np.dtype([("from", "<i4"), ("to", "<i4"), ("weight", "<f8")])
+
+
+def parse_array(body: bytes, content_type: str = "", dtype: Optional[str] = None) -> np.ndarray:
+    """Return a read-only 1-D view over `body` without copying the payload."""
+    if body.startswith(NPY_MAGIC) or "npy" in content_type:
+        arr = _npy_view(body)
+    else:
+        dt = ARRAY_DTYPES.get(dtype or "int32")
+        if dt is None:
+            raise ValueError(f"Unsupported dtype '{dtype}' (expected one of {', '.join(ARRAY_DTYPES)})")
+        if len(body) % dt.itemsize:
+            raise ValueError(f"Body length {len(body)} is not a multiple of {dt.itemsize} bytes ({dtype})")
+        arr = np.frombuffer(body, dtype=dt)
+    if arr.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, got shape {arr.shape}")
+    if arr.dtype.kind not in "iuf":
+        raise ValueError(f"Expected a numeric array, got dtype {arr.dtype}")
+    return arr
+
+
+def parse_edges(body: bytes, content_type: str = "") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (from, to, weight) column views for a packed-record, .npy or Arrow IPC edge list."""
+    if body.startswith(ARROW_FILE_MAGIC) or body.startswith(ARROW_STREAM_CONTINUATION) or "arrow" in content_type:
+        return _arrow_columns(body)
+    if body.startswith(NPY_MAGIC) or "npy" in content_type:
+        records = _npy_view(body)
+        if records.dtype.names is None:
+            # Plain (E, 3) float/int matrix: from, to, weight
+            if records.ndim != 2 or records.shape[1] not in (2, 3):
+                raise ValueError(f"Expected an (E, 2) or (E, 3) edge matrix, got shape {records.shape}")
+            weight = records[:, 2].astype(np.float64) if records.shape[1] == 3 else np.ones(len(records))
+            return records[:, 0].astype(np.int64), records[:, 1].astype(np.int64), weight
+    else:
+        if len(body) % EDGE_RECORD.itemsize:
+            raise ValueError(f"Body length {len(body)} is not a multiple of the {EDGE_RECORD.itemsize}-byte edge record")
+        records = np.frombuffer(body, dtype=EDGE_RECORD)
+    names = records.dtype.names
+    missing = {"from", "to"} - set(names)
+    if missing:
+        raise ValueError(f"Edge records are missing field(s): {', '.join(sorted(missing))}")
+    weight = records["weight"] if "weight" in names else np.ones(len(records))
+    return records["from"], records["to"], weight
+
+
+def _npy_view(body: bytes) -> np.ndarray:
+    """Parse the .npy header by hand and view the data section in place."""
+    if not body.startswith(NPY_MAGIC) or len(body) < 10:
+        raise ValueError("Not a .npy payload")
+    major = body[6]
+    if major == 1:
+        header_len = int.from_bytes(body[8:10], "little")
+        offset = 10
+    elif major in (2, 3):
+        header_len = int.from_bytes(body[8:12], "little")
+        offset = 12
+    else:
+        raise ValueError(f"Unsupported .npy version {major}")
+    header = ast.literal_eval(body[offset:offset + header_len].decode("latin1"))
+    dtype = np.dtype(header["descr"])
+    shape = tuple(header["shape"])
+    if header.get("fortran_order") and len(shape) > 1:
+        raise ValueError("Fortran-ordered .npy arrays are not supported")
+    count = int(np.prod(shape)) if shape else 1
+    data = np.frombuffer(body, dtype=dtype, count=count, offset=offset + header_len)
+    return data.reshape(shape)
+
+
+def _arrow_columns(body: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError:
+        raise ValueError("Arrow IPC uploads require the optional 'pyarrow' package")
+    buf = pa.py_buffer(body)
+    if body.startswith(ARROW_FILE_MAGIC):
+        table = pa.ipc.open_file(buf).read_all()
+    else:
+        table = pa.ipc.open_stream(buf).read_all()
+    names = set(table.column_names)
+    missing = {"from", "to"} - names
+    if missing:
+        raise ValueError(f"Arrow table is missing column(s): {', '.join(sorted(missing))}")
+
+    def column(name):
+        # Single-chunk columns without nulls convert without copying
+        return table.column(name).combine_chunks().to_numpy(zero_copy_only=False)
+
+    weight = column("weight") if "weight" in names else np.ones(table.num_rows)
+    return column("from"), column("to"), weight
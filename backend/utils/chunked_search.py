@@ -0,0 +1,116 @@
+"""
+Pattern search over files too large to load: the file is mapped with mmap and scanned in fixed-size
+chunks. Matches that lie inside a chunk are found by the buffer's own find (a C scan, no copy);
+matches that straddle a boundary are caught by a KMP automaton whose state is carried from one
+chunk to the next. Memory stays at O(pattern + chunk) whatever the file size.
+"""
+import mmap
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+CHUNK_BYTES = int(os.getenv("STRING_FILE_CHUNK_BYTES", 1024 * 1024))
+MIN_CHUNK_BYTES = mmap.ALLOCATIONGRANULARITY
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+# Each run walks the automaton over about 2 * pattern bytes per chunk in Python
+MAX_PATTERN_BYTES = int(os.getenv("STRING_FILE_MAX_PATTERN", 4096))
+# Positions reported per scan; the count is always exact
+MAX_REPORTED_MATCHES = int(os.getenv("STRING_FILE_MAX_MATCHES", 100_000))
+
+
+def prefix_function(pattern: bytes) -> List[int]:
+    lps = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k and pattern[i] != pattern[k]:
+            k = lps[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        lps[i] = k
+    return lps
+
+
+class StreamMatcher:
+    """
+    Finds every (overlapping) occurrence of `pattern` in a byte stream fed in pieces of any size.
+    `state` is the KMP automaton state: the length of the longest proper pattern prefix that ends
+    the bytes seen so far, which is all that is needed to continue across a boundary.
+    """
+
+    def __init__(self, pattern: bytes):
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        self.pattern = bytes(pattern)
+        self.lps = prefix_function(self.pattern)
+        self.state = 0
+        self.offset = 0
+
+    def _advance(self, state: int, buffer, begin: int, end: int, matches: List[int]) -> int:
+        p, lps, m = self.pattern, self.lps, len(self.pattern)
+        for k in range(begin, end):
+            c = buffer[k]
+            while state and p[state] != c:
+                state = lps[state - 1]
+            if p[state] == c:
+                state += 1
+                if state == m:
+                    matches.append(k - m + 1)
+                    state = lps[m - 1]
+        return state
+
+    def feed(self, buffer, start: int = 0, end: Optional[int] = None) -> List[int]:
+        """Stream offsets of the matches ending in buffer[start:end]; `buffer` is bytes or an mmap."""
+        end = len(buffer) if end is None else end
+        m = len(self.pattern)
+        length = end - start
+        found: List[int] = []
+        # A match that began in an earlier piece ends within the first m - 1 bytes of this one
+        head = min(length, m - 1)
+        state = self._advance(self.state, buffer, start, start + head, found)
+        matches = [self.offset + i - start for i in found]
+        i = buffer.find(self.pattern, start, end)
+        while i != -1:
+            matches.append(self.offset + i - start)
+            i = buffer.find(self.pattern, i + 1, end)
+        if length > m - 1:
+            # The state depends only on the last m - 1 bytes, so rebuild it from there
+            state = self._advance(0, buffer, end - (m - 1), end, [])
+        self.state = state
+        self.offset += length
+        return matches
+
+
+def scan_file(path: str, pattern: bytes, chunk_size: int = CHUNK_BYTES,
+              limit: int = MAX_REPORTED_MATCHES) -> Iterator[Dict[str, Any]]:
+    """One event per chunk with the matches found in it, then a summary event; bad input raises here."""
+    if len(pattern) > MAX_PATTERN_BYTES:
+        raise ValueError(f"Pattern is longer than {MAX_PATTERN_BYTES} bytes")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    return _scan(path, StreamMatcher(pattern), max(MIN_CHUNK_BYTES, min(chunk_size, MAX_CHUNK_BYTES)), limit)
+
+
+def _scan(path: str, matcher: StreamMatcher, chunk_size: int, limit: int) -> Iterator[Dict[str, Any]]:
+    # Each chunk gets its own mapping, unmapped before the next, so resident pages stay bounded by
+    # the chunk rather than growing with the file; mapping offsets must be granularity-aligned
+    chunk_size -= chunk_size % mmap.ALLOCATIONGRANULARITY
+    began = time.perf_counter()
+    count = reported = 0
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        for start in range(0, size, chunk_size):
+            length = min(chunk_size, size - start)
+            with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ, offset=start) as window:
+                matches = matcher.feed(window)
+            count += len(matches)
+            shown = matches[:max(0, limit - reported)]
+            reported += len(shown)
+            yield {"offset": start, "scanned": start + length, "count": len(matches), "matches": shown}
+    yield {
+        "done": True,
+        "bytes": size,
+        "count": count,
+        "truncated": count > reported,
+        "chunkSize": chunk_size,
+        "elapsedMs": round((time.perf_counter() - began) * 1000, 3),
+    }
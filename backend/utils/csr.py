@@ -0,0 +1,67 @@
+from typing import Optional
+
+import numpy as np
+
+
+class CSRGraph:
+    """Compressed sparse row adjacency: neighbours of u are indices[indptr[u]:indptr[u+1]]."""
+
+    __slots__ = ("num_nodes", "indptr", "indices", "weights", "directed")
+
+    def __init__(self, num_nodes: int, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, directed: bool):
+        self.num_nodes = num_nodes
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_edges(cls, src, dst, weight=None, num_nodes: Optional[int] = None, directed: bool = False) -> "CSRGraph":
+        """Build from edge columns in O(E log E); undirected edges are stored in both directions."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.ones(src.size) if weight is None else np.asarray(weight, dtype=np.float64)
+        if not (src.size == dst.size == weight.size):
+            raise ValueError("Edge columns must have the same length")
+        if src.size and (src.min() < 0 or dst.min() < 0):
+            raise ValueError("Node ids must be non-negative")
+        inferred = int(max(src.max(), dst.max())) + 1 if src.size else 0
+        if num_nodes is None:
+            num_nodes = inferred
+        elif inferred > num_nodes:
+            raise ValueError(f"Edge references node {inferred - 1} but num_nodes is {num_nodes}")
+
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            weight = np.concatenate([weight, weight])
+        order = np.argsort(src, kind="stable")
+        counts = np.bincount(src, minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(num_nodes, indptr, dst[order], weight[order], directed)
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.indices.size)
+
+    def reversed(self) -> "CSRGraph":
+        """Graph with every edge flipped, for backward searches; undirected graphs are their own reverse."""
+        if not self.directed:
+            return self
+        src = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+        return CSRGraph.from_edges(self.indices, src, self.weights, num_nodes=self.num_nodes, directed=True)
+
+    def neighbors(self, u: int) -> np.ndarray:
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def expand(self, frontier: np.ndarray):
+        """All (source, neighbour, weight) triples leaving `frontier`, in adjacency order."""
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        src = np.repeat(frontier, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+        return src, self.indices[offsets], self.weights[offsets]
@@ -0,0 +1,233 @@
+import heapq
+import os
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+try:
+    from backend.utils.engine_loader import get_engine, get_engine_dir, get_load_error  # type: ignore
+except Exception:
+    from utils.engine_loader import get_engine, get_engine_dir, get_load_error  # type: ignore
+
+# Inputs cover duplicates, negatives, single element and reversed order
+SAMPLE_ARRAYS: List[List[int]] = [
+    [5, 2, 9, 1, 5, 6],
+    [3, -1, 0, -7, 8, 8, 2],
+    [1],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1],
+]
+
+SORTING_FUNCTIONS = ['bubble_sort', 'merge_sort', 'quick_sort', 'heap_sort', 'counting_sort']
+
+# Parallel sorts only split ranges above their cutoff, so they also get an input large enough to fork
+PARALLEL_SORTING_FUNCTIONS = ['parallel_merge_sort', 'parallel_quick_sort']
+PARALLEL_SAMPLE = [(i * 7919) % 1009 - 500 for i in range(1009)]
+
+# Small connected graph: (from, to, weight), undirected
+SAMPLE_NODES = [0, 1, 2, 3, 4, 5]
+SAMPLE_EDGES = [(0, 1, 2.0), (0, 2, 4.0), (1, 2, 1.0), (1, 3, 7.0), (2, 4, 3.0), (4, 3, 2.0), (3, 5, 1.0)]
+SAMPLE_START = 0
+
+_report: Dict[str, Any] = {}
+_fallbacks: Dict[str, int] = {}
+
+
+def is_strict_mode() -> bool:
+    """ENGINE_STRICT=1 makes startup fail when the engine is missing or disagrees with Python."""
+    return os.getenv("ENGINE_STRICT", "").lower() in ("1", "true", "yes")
+
+
+def record_fallback(algorithm: str) -> None:
+    """Count a request that was served by the Python fallback instead of the engine."""
+    _fallbacks[algorithm] = _fallbacks.get(algorithm, 0) + 1
+
+
+def reset_fallbacks() -> None:
+    """Forget the fallback counts, e.g. the ones recorded by warm-up calls."""
+    _fallbacks.clear()
+
+
+def get_report() -> Dict[str, Any]:
+    """Latest self-test report plus live fallback counters."""
+    if not _report:
+        run_self_test()
+    return {**_report, "fallbacks": dict(_fallbacks)}
+
+
+def run_self_test(engine=None) -> Dict[str, Any]:
+    """Load the engine once and check every bound function against the Python reference."""
+    global _report
+    if engine is None:
+        engine = get_engine()
+
+    checks: Dict[str, Dict[str, Any]] = {}
+    if engine is not None:
+        for name in SORTING_FUNCTIONS:
+            checks[name] = _check_sorting(engine, name)
+        for name in PARALLEL_SORTING_FUNCTIONS:
+            checks[name] = _check_parallel_sorting(engine, name)
+        checks['graph.bfs'] = _check_graph(engine, 'bfs')
+        checks['graph.dfs'] = _check_graph(engine, 'dfs')
+        checks['graph.dijkstra'] = _check_graph(engine, 'dijkstra')
+        checks['graph.bellman_ford'] = _check_graph(engine, 'bellman_ford')
+        checks['graph.floyd_warshall'] = _check_graph(engine, 'floyd_warshall')
+
+    engine_dir = get_engine_dir()
+    _report = {
+        "available": engine is not None,
+        "path": str(engine_dir) if engine_dir else None,
+        "load_error": get_load_error() if engine is None else None,
+        "version": getattr(engine, "__version__", None),
+        "healthy": engine is not None and all(c["ok"] for c in checks.values()),
+        "checks": checks,
+        "checked_at": time.time(),
+    }
+    return _report
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    try:
+        return fn(), None, (time.perf_counter() - start) * 1000
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}", (time.perf_counter() - start) * 1000
+
+
+def _check_sorting(engine, name: str) -> Dict[str, Any]:
+    fn = getattr(engine, name, None)
+    if fn is None:
+        return {"ok": False, "error": "not bound", "time_ms": 0.0}
+    total_ms = 0.0
+    for sample in SAMPLE_ARRAYS:
+        steps, error, ms = _timed(lambda: fn(list(sample)))
+        total_ms += ms
+        if error:
+            return {"ok": False, "error": error, "time_ms": round(total_ms, 3)}
+        final = list(getattr(steps[-1], "array", [])) if steps else []
+        if final != sorted(sample):
+            return {"ok": False, "error": f"{sample} -> {final}", "time_ms": round(total_ms, 3)}
+    return {"ok": True, "error": None, "time_ms": round(total_ms, 3)}
+
+
+def _check_parallel_sorting(engine, name: str) -> Dict[str, Any]:
+    fn = getattr(engine, name, None)
+    if fn is None:
+        return {"ok": False, "error": "not bound", "time_ms": 0.0}
+    total_ms = 0.0
+    for sample in SAMPLE_ARRAYS + [PARALLEL_SAMPLE]:
+        result, error, ms = _timed(lambda: fn(list(sample), threads=2, cutoff=16))
+        total_ms += ms
+        if error:
+            return {"ok": False, "error": error, "time_ms": round(total_ms, 3)}
+        final = result[0].tolist()
+        if final != sorted(sample):
+            return {"ok": False, "error": f"{sample[:10]}... -> {final[:10]}...", "time_ms": round(total_ms, 3)}
+    return {"ok": True, "error": None, "time_ms": round(total_ms, 3)}
+
+
+def _check_graph(engine, name: str) -> Dict[str, Any]:
+    def run():
+        graph = engine.Graph()
+        for node_id in SAMPLE_NODES:
+            graph.add_node(engine.GraphNode(node_id, str(node_id), 0.0, 0.0))
+        for u, v, w in SAMPLE_EDGES:
+            graph.add_edge(engine.GraphEdge(u, v, w, False))
+        graph.build_adjacency_list()
+        if name == 'dijkstra':
+            return graph.dijkstra(SAMPLE_START, -1)
+        return getattr(graph, name)(SAMPLE_START)
+
+    steps, error, ms = _timed(run)
+    if error:
+        return {"ok": False, "error": error, "time_ms": round(ms, 3)}
+
+    ref_dist = _reference_dijkstra()
+    if name in ('dijkstra', 'bellman_ford', 'floyd_warshall'):
+        final = dict(steps[-1].distances) if steps else {}
+        ok = all(abs(final.get(n, float('inf')) - d) < 1e-9 for n, d in ref_dist.items())
+        error = None if ok else f"distances {final} != {ref_dist}"
+    else:
+        seen = set()
+        for step in steps:
+            seen.update(step.visitedNodes)
+            seen.update(step.currentNodes)
+        ok = seen == set(_reference_reachable())
+        error = None if ok else f"reached {sorted(seen)}"
+    return {"ok": ok, "error": error, "time_ms": round(ms, 3)}
+
+
+def _sample_adjacency() -> Dict[int, List[tuple]]:
+    adj: Dict[int, List[tuple]] = {n: [] for n in SAMPLE_NODES}
+    for u, v, w in SAMPLE_EDGES:
+        adj[u].append((v, w))
+        adj[v].append((u, w))
+    return adj
+
+
+def _reference_reachable() -> List[int]:
+    adj = _sample_adjacency()
+    seen = {SAMPLE_START}
+    queue = deque([SAMPLE_START])
+    while queue:
+        u = queue.popleft()
+        for v, _ in adj[u]:
+            if v not in seen:
+                seen.add(v)
+                queue.append(v)
+    return list(seen)
+
+
+def _reference_dijkstra() -> Dict[int, float]:
+    adj = _sample_adjacency()
+    dist = {SAMPLE_START: 0.0}
+    pq = [(0.0, SAMPLE_START)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist.get(u, float('inf')):
+            continue
+        for v, w in adj[u]:
+            if d + w < dist.get(v, float('inf')):
+                dist[v] = d + w
+                heapq.heappush(pq, (d + w, v))
+    return dist
+
+
+def render_metrics() -> str:
+    """Prometheus text exposition of the engine report and fallback counters."""
+    report = get_report()
+    lines = [
+        "# HELP algorithm_engine_available Whether the C++ engine imported successfully.",
+        "# TYPE algorithm_engine_available gauge",
+        f"algorithm_engine_available {int(report['available'])}",
+        "# HELP algorithm_engine_healthy Whether every engine self-test check passed.",
+        "# TYPE algorithm_engine_healthy gauge",
+        f"algorithm_engine_healthy {int(report['healthy'])}",
+        "# HELP algorithm_engine_selftest_ok Per-function parity with the Python reference.",
+        "# TYPE algorithm_engine_selftest_ok gauge",
+    ]
+    for name, check in report["checks"].items():
+        lines.append(f'algorithm_engine_selftest_ok{{algorithm="{name}"}} {int(check["ok"])}')
+    lines += [
+        "# HELP algorithm_engine_selftest_seconds Time spent running the self-test samples.",
+        "# TYPE algorithm_engine_selftest_seconds gauge",
+    ]
+    for name, check in report["checks"].items():
+        lines.append(f'algorithm_engine_selftest_seconds{{algorithm="{name}"}} {check["time_ms"] / 1000:.6f}')
+    lines += [
+        "# HELP algorithm_engine_fallbacks_total Requests served by the Python fallback.",
+        "# TYPE algorithm_engine_fallbacks_total counter",
+    ]
+    for name, count in sorted(report["fallbacks"].items()):
+        lines.append(f'algorithm_engine_fallbacks_total{{algorithm="{name}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def strict_mode_error(report: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Reason startup must be refused in strict mode, or None if it may proceed."""
+    report = report or get_report()
+    if not report["available"]:
+        return f"algorithm_engine not available: {report['load_error'] or 'module not found'}"
+    failed = [name for name, check in report["checks"].items() if not check["ok"]]
+    if failed:
+        return f"algorithm_engine self-test failed for: {', '.join(failed)}"
+    return None
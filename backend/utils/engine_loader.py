@@ -1,5 +1,8 @@
+import hashlib
+import json
 import sys
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -13,34 +16,107 @@ def _candidate_dirs(root: Path) -> list:
         cpp,                          # cpp (in case built in-place)
     ]
 
-def _has_engine(dir_path: Path) -> bool:
+_ENGINE_PATTERNS = ["algorithm_engine*.pyd", "algorithm_engine*.so", "algorithm_engine*.dylib"]
+
+# Discovery result cached across processes: one stat of the engine file instead of
+# globbing every candidate directory on each start. ENGINE_MANIFEST=0 disables it.
+_MANIFEST_SETTING = os.getenv("ENGINE_MANIFEST", "")
+
+def _manifest_path(root: Path) -> Optional[Path]:
+    if _MANIFEST_SETTING == "0":
+        return None
+    if _MANIFEST_SETTING:
+        return Path(_MANIFEST_SETTING)
+    # One manifest per checkout, so two trees on the same host never share an entry
+    tag = hashlib.sha1(str(root).encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"algorithm_engine-{tag}.json"
+
+def _read_manifest(root: Path) -> Optional[Path]:
+    """The engine file recorded in the manifest, if it still exists unchanged."""
+    path = _manifest_path(root)
+    if path is None:
+        return None
+    try:
+        entry = json.loads(path.read_text())
+        engine_file = Path(entry["file"])
+        st = engine_file.stat()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if entry.get("root") != str(root) or entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+        return None
+    return engine_file
+
+def _write_manifest(root: Path, engine_file: Path) -> None:
+    path = _manifest_path(root)
+    if path is None:
+        return
+    try:
+        st = engine_file.stat()
+        entry = {"root": str(root), "file": str(engine_file), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, path)
+    except OSError:
+        # A read-only temp dir only costs the glob on the next start
+        pass
+
+def _find_engine_file(dir_path: Path) -> Optional[Path]:
     if not dir_path.exists():
-        return False
+        return None
     # Windows .pyd, Linux .so, Mac .so/.dylib
-    patterns = ["algorithm_engine*.pyd", "algorithm_engine*.so", "algorithm_engine*.dylib"]
-    for pattern in patterns:
-        if any(dir_path.glob(pattern)):
-            return True
-    return False
+    for pattern in _ENGINE_PATTERNS:
+        for match in dir_path.glob(pattern):
+            return match
+    return None
 
 def ensure_path() -> Optional[Path]:
     """Find engine location and append to sys.path once. Returns the directory if found."""
-    # project root = backend/.. 
+    # project root = backend/.. ; in images that copy backend/ to the app root, cpp/ sits beside it
     here = Path(__file__).resolve()
-    root = here.parents[1]
-    for d in _candidate_dirs(root):
-        if _has_engine(d):
-            p = str(d)
-            if p not in sys.path:
-                sys.path.insert(0, p)
-            return d
-    return None
+    root = here.parents[2]
+    engine_file = _read_manifest(root)
+    if engine_file is None:
+        for d in _candidate_dirs(root) + _candidate_dirs(here.parents[1]):
+            engine_file = _find_engine_file(d)
+            if engine_file is not None:
+                _write_manifest(root, engine_file)
+                break
+    if engine_file is None:
+        return None
+    d = engine_file.parent
+    p = str(d)
+    if p not in sys.path:
+        sys.path.insert(0, p)
+    return d
+
+# Import is attempted once per process; every service shares the outcome.
+_engine = None
+_engine_loaded = False
+_engine_dir: Optional[Path] = None
+_load_error: Optional[str] = None
 
 def get_engine():
     """Attempt to import algorithm_engine after wiring sys.path. Returns module or None."""
-    ensure_path()
+    global _engine, _engine_loaded, _engine_dir, _load_error
+    if _engine_loaded:
+        return _engine
+    _engine_dir = ensure_path()
     try:
         import algorithm_engine  # type: ignore
-        return algorithm_engine
-    except Exception:
-        return None
+        _engine = algorithm_engine
+        _load_error = None
+    except Exception as e:
+        _engine = None
+        _load_error = f"{type(e).__name__}: {e}"
+    _engine_loaded = True
+    return _engine
+
+def get_engine_dir() -> Optional[Path]:
+    """Directory the engine was discovered in (None if not found)."""
+    get_engine()
+    return _engine_dir
+
+def get_load_error() -> Optional[str]:
+    """Why the last import attempt failed, or None if the engine loaded."""
+    get_engine()
+    return _load_error
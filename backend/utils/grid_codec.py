@@ -0,0 +1,83 @@
+# Compact encodings for grid maps, so a 1000x1000 maze is a few KB instead of a million JSON objects
+import base64
+import re
+from typing import Optional
+
+import numpy as np
+
+MAX_GRID_CELLS = 4_000_000
+
+_RLE_TOKEN = re.compile(r"(\d*)([.#])")
+
+
+def decode_rle(text: str, size: int) -> np.ndarray:
+    """
+    Walls from run-length text: "<count><symbol>" runs with '.' = open and '#' = wall,
+    e.g. "12.3#40." (a missing count means 1; whitespace and newlines are ignored).
+    Returns a bool array, True = wall; cells past the last run are open.
+    """
+    compact = re.sub(r"\s+", "", text)
+    walls = np.zeros(size, dtype=bool)
+    pos = 0
+    consumed = 0
+    for match in _RLE_TOKEN.finditer(compact):
+        if match.start() != consumed:
+            raise ValueError(f"Invalid RLE near position {consumed}: {compact[consumed:consumed + 10]!r}")
+        consumed = match.end()
+        count = int(match.group(1) or 1)
+        if pos + count > size:
+            raise ValueError(f"RLE describes more than {size} cells")
+        if match.group(2) == "#":
+            walls[pos:pos + count] = True
+        pos += count
+    if consumed != len(compact):
+        raise ValueError(f"Invalid RLE near position {consumed}: {compact[consumed:consumed + 10]!r}")
+    return walls
+
+
+def encode_rle(walls: np.ndarray) -> str:
+    flat = np.asarray(walls, dtype=bool).ravel()
+    if flat.size == 0:
+        return ""
+    change = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+    starts = np.concatenate([[0], change])
+    lengths = np.diff(np.append(starts, flat.size))
+    return "".join(f"{n}{'#' if flat[s] else '.'}" for s, n in zip(starts, lengths))
+
+
+def decode_bitmap(data: str, size: int) -> np.ndarray:
+    """Walls from base64 of a packed bit array (row-major, most significant bit first, 1 = wall)."""
+    raw = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+    if raw.size * 8 < size:
+        raise ValueError(f"Bitmap has {raw.size * 8} bits, expected at least {size}")
+    return np.unpackbits(raw, count=size).astype(bool)
+
+
+def decode_costs(data: bytes, size: int) -> np.ndarray:
+    """Per-cell costs as one byte per cell (0 = wall, 1-255 = cost of entering the cell)."""
+    if len(data) != size:
+        raise ValueError(f"Cost map has {len(data)} bytes, expected width*height = {size}")
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def build_costs(width: int, height: int, walls: Optional[str] = None, encoding: str = "rle",
+                weights: Optional[str] = None) -> np.ndarray:
+    """Combine a wall map and an optional base64 cost map into one uint8 cost array (0 = wall)."""
+    if width < 1 or height < 1 or width * height > MAX_GRID_CELLS:
+        raise ValueError(f"Grid must have between 1 and {MAX_GRID_CELLS} cells")
+    size = width * height
+    costs = np.ones(size, dtype=np.uint8) if weights is None else decode_costs(base64.b64decode(weights), size).copy()
+    if walls:
+        if encoding == "rle":
+            wall_mask = decode_rle(walls, size)
+        elif encoding == "bitmap":
+            wall_mask = decode_bitmap(walls, size)
+        else:
+            raise ValueError(f"Unknown wall encoding '{encoding}' (expected 'rle' or 'bitmap')")
+        costs[wall_mask] = 0
+    return costs
+
+
+def pack_indices(indices) -> str:
+    """Base64 of little-endian int32 flat indices, for responses with millions of cells."""
+    return base64.b64encode(np.asarray(indices, dtype="<i4").tobytes()).decode("ascii")
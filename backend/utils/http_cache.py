@@ -0,0 +1,45 @@
+# Conditional GET helpers: validators on pre-rendered bodies so clients and CDNs can revalidate with 304s
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as required for If-None-Match (W/"x" matches "x")."""
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == wanted:
+            return True
+    return False
+
+
+def not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def conditional_response(request: Request, body: bytes, etag: str, last_modified: Optional[str] = None,
+                         max_age: int = 0, media_type: str = "application/json",
+                         headers: Optional[Dict[str, str]] = None) -> Response:
+    """Return `body` with ETag/Last-Modified/Cache-Control, or an empty 304 if the client's copy is current."""
+    validators = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}" if max_age else "no-cache"}
+    if last_modified:
+        validators["Last-Modified"] = last_modified
+    validators.update(headers or {})
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    # If-None-Match takes precedence; If-Modified-Since is only consulted without it (RFC 9110 13.2.2)
+    if if_none_match is not None:
+        fresh = etag_matches(if_none_match, etag)
+    else:
+        fresh = bool(if_modified_since and last_modified and not_modified_since(if_modified_since, last_modified))
+    if fresh:
+        return Response(status_code=304, headers=validators)
+    return Response(content=body, media_type=media_type, headers=validators)
@@ -0,0 +1,246 @@
+# Key/value store shared by all workers: result cache and registered graphs.
+# Backends expose the subset of the redis-py client API the app uses (get/set(ex=, nx=)/incr/expire/delete/keys/ping),
+# so a real Redis, or any Redis-compatible stand-in, can be swapped in via SHARED_STORE_URL.
+import fnmatch
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+DEFAULT_SQLITE_PATH = os.path.join(tempfile.gettempdir(), "algorithm-visualizer-store.sqlite3")
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", 3600))
+# Larger traces are recomputed instead of cached, so one request cannot evict everything else
+RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", 2 * 1024 * 1024))
+
+Value = Union[bytes, str]
+
+
+def _to_bytes(value: Value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode("utf-8")
+
+
+class MemoryStore:
+    """Process-local store; only shared between workers when they share one process (dev, tests)."""
+
+    backend = "memory"
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._live(key)
+            return item[0] if item is not None else None
+
+    def set(self, key: str, value: Value, ex: Optional[int] = None, nx: bool = False) -> bool:
+        with self._lock:
+            if nx and self._live(key) is not None:
+                return False
+            self._data[key] = (_to_bytes(value), time.time() + ex if ex else None)
+        return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            item = self._live(key)
+            value = int(item[0]) + 1 if item is not None else 1
+            self._data[key] = (str(value).encode(), item[1] if item is not None else None)
+        return value
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            item = self._live(key)
+            if item is None:
+                return False
+            self._data[key] = (item[0], time.time() + seconds)
+        return True
+
+    def _live(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        # Caller holds the lock
+        item = self._data.get(key)
+        if item is not None and item[1] is not None and item[1] <= time.time():
+            del self._data[key]
+            return None
+        return item
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(k, None) is not None for k in keys)
+
+    def keys(self, pattern: str = "*") -> List[bytes]:
+        now = time.time()
+        with self._lock:
+            return [k.encode() for k, (_, exp) in self._data.items()
+                    if (exp is None or exp > now) and fnmatch.fnmatchcase(k, pattern)]
+
+    def ping(self) -> bool:
+        return True
+
+
+class SQLiteStore:
+    """File-backed store shared by every worker on the host; WAL mode lets readers run concurrently."""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        # Connections must not cross a fork or a thread, so key them by pid within thread-local storage
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._conn().execute(
+            "SELECT value FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)", (key, time.time())
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: Value, ex: Optional[int] = None, nx: bool = False) -> bool:
+        conn = self._conn()
+        if not nx:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                (key, _to_bytes(value), time.time() + ex if ex else None),
+            )
+            return True
+        now = time.time()
+        with self._transaction(conn):
+            conn.execute("DELETE FROM kv WHERE key = ? AND expires IS NOT NULL AND expires <= ?", (key, now))
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                (key, _to_bytes(value), now + ex if ex else None),
+            )
+        return cur.rowcount > 0
+
+    def incr(self, key: str) -> int:
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers can never read the same value
+        conn = self._conn()
+        now = time.time()
+        with self._transaction(conn):
+            row = conn.execute(
+                "SELECT value, expires FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)", (key, now)
+            ).fetchone()
+            value = int(bytes(row[0])) + 1 if row else 1
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                (key, str(value).encode(), row[1] if row else None),
+            )
+        return value
+
+    def expire(self, key: str, seconds: int) -> bool:
+        cur = self._conn().execute(
+            "UPDATE kv SET expires = ? WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (time.time() + seconds, key, time.time()),
+        )
+        return cur.rowcount > 0
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        cur = self._conn().execute(f"DELETE FROM kv WHERE key IN ({','.join('?' * len(keys))})", keys)
+        return cur.rowcount
+
+    def keys(self, pattern: str = "*") -> List[bytes]:
+        rows = self._conn().execute(
+            "SELECT key FROM kv WHERE key GLOB ? AND (expires IS NULL OR expires > ?)", (pattern, time.time())
+        ).fetchall()
+        return [r[0].encode() for r in rows]
+
+    def ping(self) -> bool:
+        self._conn().execute("DELETE FROM kv WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        return True
+
+
+def create_store(url: Optional[str] = None):
+    """
+    SHARED_STORE_URL selects the backend:
+      sqlite:///path/to/file.sqlite3 (default, in the temp dir), memory://, redis://host:6379/0
+    """
+    url = url if url is not None else os.getenv("SHARED_STORE_URL", "")
+    if not url or url.startswith("sqlite:"):
+        path = url[len("sqlite:///"):] if url.startswith("sqlite:///") else ""
+        return SQLiteStore(path or DEFAULT_SQLITE_PATH)
+    if url.startswith("memory:"):
+        return MemoryStore()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        try:
+            import redis  # type: ignore
+        except ImportError:
+            raise RuntimeError("SHARED_STORE_URL points at Redis but the optional 'redis' package is not installed")
+        client = redis.Redis.from_url(url)
+        client.backend = "redis"
+        return client
+    raise ValueError(f"Unsupported SHARED_STORE_URL scheme: {url}")
+
+
+_store = None
+
+
+def get_store():
+    global _store
+    if _store is None:
+        _store = create_store()
+    return _store
+
+
+def describe_store() -> Dict[str, Any]:
+    store = get_store()
+    try:
+        ok = bool(store.ping())
+        error = None
+    except Exception as e:
+        ok, error = False, str(e)
+    return {"backend": getattr(store, "backend", type(store).__name__), "ok": ok, "error": error}
+
+
+# -------- Result cache --------
+def cache_key(namespace: str, payload: Any) -> str:
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    return f"result:{namespace}:{digest}"
+
+
+async def cached_result(namespace: str, payload: Any, compute: Callable[[], Awaitable[str]]) -> Union[str, bytes]:
+    """
+    Return the cached JSON body for `payload`, computing and storing it on a miss. `compute` returns
+    the result already encoded, so encoding happens wherever the caller builds it (off the event loop).
+    """
+    store = get_store()
+    key = cache_key(namespace, payload)
+    try:
+        hit = store.get(key)
+    except Exception as e:
+        print(f"⚠️  Shared store unavailable, computing without cache: {e}")
+        return await compute()
+    if hit is not None:
+        return hit
+    encoded = await compute()
+    if len(encoded) <= RESULT_CACHE_MAX_BYTES:
+        try:
+            store.set(key, encoded, ex=RESULT_CACHE_TTL)
+        except Exception as e:
+            print(f"⚠️  Could not write result cache: {e}")
+    return encoded
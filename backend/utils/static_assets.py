@@ -0,0 +1,169 @@
+# Production frontend serving from an in-memory manifest built once at startup: every file's
+# headers, ETag and compressed variants are prepared up front, so a request is a dict lookup.
+import gzip
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+try:
+    from backend.utils.http_cache import conditional_response, etag_matches  # type: ignore
+except Exception:
+    from utils.http_cache import conditional_response, etag_matches  # type: ignore
+
+FRONTEND_CANDIDATES = [
+    Path("../frontend/build"),  # Development
+    Path("./frontend/build"),   # Docker/Production
+    Path("build"),              # If moved to root
+]
+
+# Files at most this large are held in memory; larger ones are streamed from disk
+ASSET_INLINE_MAX_BYTES = int(os.getenv("ASSET_INLINE_MAX_BYTES", 2 * 1024 * 1024))
+# Compressing tiny files costs more in headers than it saves
+COMPRESS_MIN_BYTES = 1024
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/manifest+json",
+                      "image/svg+xml", "application/xml")
+# CRA puts content-hashed bundles under static/, so they can be cached forever
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+ENCODING_PREFERENCE = ("br", "gzip")
+
+mimetypes.add_type("application/javascript", ".js")
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+
+
+def find_frontend_build() -> Optional[Path]:
+    for path in FRONTEND_CANDIDATES:
+        if (path / "index.html").is_file():
+            return path
+    return None
+
+
+class Asset:
+    __slots__ = ("path", "media_type", "etag", "cache_control", "body", "stat", "variants")
+
+    def __init__(self, path: Path, media_type: str, etag: str, cache_control: str,
+                 body: Optional[bytes], stat: os.stat_result):
+        self.path = path
+        self.media_type = media_type
+        self.etag = etag
+        self.cache_control = cache_control
+        self.body = body
+        self.stat = stat
+        # encoding -> (body, etag)
+        self.variants: Dict[str, tuple] = {}
+
+
+class AssetManifest:
+    def __init__(self, root: Optional[Path]):
+        self.root = root
+        self.assets: Dict[str, Asset] = {}
+        self.index: Optional[Asset] = None
+        if root is not None:
+            self._build(root)
+
+    @property
+    def available(self) -> bool:
+        return self.index is not None
+
+    def _build(self, root: Path) -> None:
+        brotli = _brotli()
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                if path.suffix in ENCODING_SUFFIXES.values() and path.with_suffix("").is_file():
+                    continue  # precompressed sibling, attached to its original below
+                rel = path.relative_to(root).as_posix()
+                self.assets[rel] = self._load(path, rel, brotli)
+        self.index = self.assets.get("index.html")
+        compressed = sum(1 for a in self.assets.values() if a.variants)
+        print(f"✅ Frontend manifest: {len(self.assets)} files from {root} ({compressed} with compressed variants)")
+
+    def _load(self, path: Path, rel: str, brotli) -> Asset:
+        stat = path.stat()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:20]
+        cache_control = IMMUTABLE_CACHE if rel.startswith("static/") else REVALIDATE_CACHE
+        asset = Asset(path, media_type, f'"{digest}"', cache_control,
+                      data if len(data) <= ASSET_INLINE_MAX_BYTES else None, stat)
+        compressible = media_type.startswith(COMPRESSIBLE_TYPES) and len(data) >= COMPRESS_MIN_BYTES
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sibling = path.with_name(path.name + suffix)
+            if sibling.is_file():
+                body = sibling.read_bytes()
+            elif compressible and encoding == "gzip":
+                body = gzip.compress(data, compresslevel=9, mtime=0)
+            elif compressible and brotli is not None:
+                body = brotli.compress(data)
+            else:
+                continue
+            if len(body) < len(data):
+                asset.variants[encoding] = (body, f'"{digest}-{encoding}"')
+        return asset
+
+    def lookup(self, rel: str) -> Optional[Asset]:
+        return self.assets.get(rel)
+
+
+def _brotli():
+    try:
+        import brotli  # type: ignore
+        return brotli
+    except ImportError:
+        return None
+
+
+def accepted_encodings(header: str) -> List[str]:
+    accepted = []
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token and q > 0:
+            accepted.append(token.strip().lower())
+    return accepted
+
+
+def serve_asset(request: Request, asset: Asset) -> Response:
+    """Pick the best precompressed variant for the client and answer conditionally."""
+    accepted = accepted_encodings(request.headers.get("accept-encoding", ""))
+    headers = {"Cache-Control": asset.cache_control, "Vary": "Accept-Encoding"}
+    for encoding in ENCODING_PREFERENCE:
+        if encoding in asset.variants and encoding in accepted:
+            body, etag = asset.variants[encoding]
+            headers["Content-Encoding"] = encoding
+            return conditional_response(request, body, etag, media_type=asset.media_type, headers=headers)
+    if asset.body is not None:
+        return conditional_response(request, asset.body, asset.etag, media_type=asset.media_type, headers=headers)
+    if etag_matches(request.headers.get("if-none-match", ""), asset.etag):
+        return Response(status_code=304, headers={**headers, "ETag": asset.etag})
+    # Too large to keep in memory: stream it, reusing the startup stat instead of touching the disk again
+    return FileResponse(asset.path, media_type=asset.media_type, stat_result=asset.stat,
+                        headers={**headers, "ETag": asset.etag})
+
+
+_manifest: Optional[AssetManifest] = None
+
+
+def get_asset_manifest() -> AssetManifest:
+    global _manifest
+    if _manifest is None:
+        root = find_frontend_build()
+        if root is None:
+            print("❌ Frontend build not found. Paths checked:")
+            for path in FRONTEND_CANDIDATES:
+                print(f"   - {path.absolute()}")
+        _manifest = AssetManifest(root)
+    return _manifest
@@ -0,0 +1,345 @@
+# Binary trace files: a recorded run stored as a delta-encoded op-code stream that can be read
+# through mmap, so any step or byte range is served from disk without loading the file.
+#
+# Layout (little-endian):
+#   header  64 bytes   magic, version, keyframe interval, step count, section offsets
+#   stream             one record per step: a flag byte (keyframe or delta), then ops, then OP_END
+#   index              (steps + 1) uint64 offsets into the stream; record i is [index[i], index[i+1])
+#   meta               UTF-8 JSON: kind, algorithm, input, field names, ...
+#
+# Ops name a field by its position in meta["fields"]:
+#   OP_SET    field, varint length, JSON value
+#   OP_DEL    field                                  (key absent from this step)
+#   OP_PATCH  field, varint count, (index, zigzag value) varints     1-D int lists, same length
+#   OP_PATCH2 field, varint count, (row, col, zigzag value) varints  2-D int tables, same shape
+# Every keyframe_interval-th record is a keyframe that sets every field, so step i is rebuilt from
+# the nearest keyframe at or before it.
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"AVTRACE\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQQQQQQ")
+INDEX_ENTRY = struct.Struct("<Q")
+
+DEFAULT_KEYFRAME_INTERVAL = int(os.getenv("TRACE_KEYFRAME_INTERVAL", 64))
+TRACE_MAX_STEPS = int(os.getenv("TRACE_MAX_STEPS", 5_000_000))
+TRACE_MAX_BYTES = int(os.getenv("TRACE_MAX_BYTES", 512 * 1024 * 1024))
+
+RECORD_DELTA, RECORD_KEYFRAME = 0, 1
+OP_END, OP_SET, OP_DEL, OP_PATCH, OP_PATCH2 = 0, 1, 2, 3, 4
+
+_NOT_SET = object()
+
+
+class TraceFormatError(ValueError):
+    pass
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _is_int_list(value: Any) -> bool:
+    return type(value) is list and all(type(v) is int for v in value)
+
+
+def _is_int_table(value: Any) -> bool:
+    return type(value) is list and all(_is_int_list(row) for row in value)
+
+
+class TraceWriter:
+    """Stream steps into a trace file; memory use is one previous step plus 8 bytes per step."""
+
+    def __init__(self, path: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                 max_steps: int = TRACE_MAX_STEPS, max_bytes: int = TRACE_MAX_BYTES):
+        self.path = path
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self.fields: List[str] = []
+        self._field_ids: Dict[str, int] = {}
+        # Previous value per field: copies of patchable int lists/tables, encoded JSON otherwise
+        self._prev: Dict[str, Any] = {}
+        self._index = array("Q")
+        self._file = open(path, "wb")
+        self._file.write(bytes(HEADER.size))
+        self._stream_length = 0
+
+    @property
+    def steps(self) -> int:
+        return len(self._index)
+
+    def _field(self, name: str) -> int:
+        field = self._field_ids.get(name)
+        if field is None:
+            field = self._field_ids[name] = len(self.fields)
+            self.fields.append(name)
+        return field
+
+    def append(self, step: Dict[str, Any]) -> None:
+        if len(self._index) >= self.max_steps:
+            raise ValueError(f"Trace exceeds {self.max_steps} steps")
+        keyframe = len(self._index) % self.keyframe_interval == 0
+        out = bytearray([RECORD_KEYFRAME if keyframe else RECORD_DELTA])
+        for name, value in step.items():
+            self._encode_field(out, self._field(str(name)), str(name), value, keyframe)
+        for name in [name for name in self._prev if name not in step]:
+            del self._prev[name]
+            if not keyframe:
+                out.append(OP_DEL)
+                _write_varint(out, self._field_ids[name])
+        out.append(OP_END)
+        if self._stream_length + len(out) > self.max_bytes:
+            raise ValueError(f"Trace exceeds {self.max_bytes} bytes")
+        self._index.append(self._stream_length)
+        self._file.write(out)
+        self._stream_length += len(out)
+
+    def _encode_field(self, out: bytearray, field: int, name: str, value: Any, keyframe: bool) -> None:
+        prev = self._prev.get(name, _NOT_SET)
+        if _is_int_list(value):
+            if not keyframe and type(prev) is list and len(prev) == len(value) and _is_int_list(prev):
+                changed = [(i, v) for i, (p, v) in enumerate(zip(prev, value)) if p != v]
+                if len(changed) * 4 <= len(value):
+                    if changed:
+                        out.append(OP_PATCH)
+                        _write_varint(out, field)
+                        _write_varint(out, len(changed))
+                        for i, v in changed:
+                            _write_varint(out, i)
+                            _write_varint(out, _zigzag(v))
+                    self._prev[name] = list(value)
+                    return
+            self._set(out, field, json.dumps(value, separators=(",", ":")).encode())
+            self._prev[name] = list(value)
+            return
+        if value and _is_int_table(value):
+            if (not keyframe and type(prev) is list and len(prev) == len(value) and _is_int_table(prev)
+                    and all(len(p) == len(r) for p, r in zip(prev, value))):
+                changed = [(i, j, v) for i, (p_row, row) in enumerate(zip(prev, value))
+                           for j, (p, v) in enumerate(zip(p_row, row)) if p != v]
+                cells = sum(len(row) for row in value)
+                if len(changed) * 6 <= cells:
+                    if changed:
+                        out.append(OP_PATCH2)
+                        _write_varint(out, field)
+                        _write_varint(out, len(changed))
+                        for i, j, v in changed:
+                            _write_varint(out, i)
+                            _write_varint(out, j)
+                            _write_varint(out, _zigzag(v))
+                    self._prev[name] = [list(row) for row in value]
+                    return
+            self._set(out, field, json.dumps(value, separators=(",", ":")).encode())
+            self._prev[name] = [list(row) for row in value]
+            return
+        encoded = json.dumps(value, separators=(",", ":")).encode()
+        if keyframe or encoded != prev:
+            self._set(out, field, encoded)
+        self._prev[name] = encoded
+
+    @staticmethod
+    def _set(out: bytearray, field: int, encoded: bytes) -> None:
+        out.append(OP_SET)
+        _write_varint(out, field)
+        _write_varint(out, len(encoded))
+        out += encoded
+
+    def close(self, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write the index, meta and header; returns a summary of the file."""
+        steps = self.steps
+        self._index.append(self._stream_length)
+        stream_offset = HEADER.size
+        index_offset = stream_offset + self._stream_length
+        if sys.byteorder == "big":
+            self._index.byteswap()
+        index_bytes = self._index.tobytes()
+        meta_blob = json.dumps({**(meta or {}), "fields": self.fields}, separators=(",", ":")).encode()
+        meta_offset = index_offset + len(index_bytes)
+        self._file.write(index_bytes)
+        self._file.write(meta_blob)
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, self.keyframe_interval, steps,
+                                     meta_offset, len(meta_blob), stream_offset, self._stream_length, index_offset))
+        self._file.close()
+        return {"steps": steps, "bytes": meta_offset + len(meta_blob), "keyframe_interval": self.keyframe_interval}
+
+    def abort(self) -> None:
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+
+
+def write_trace(path: str, steps: Iterable[Dict[str, Any]], meta: Optional[Dict[str, Any]] = None,
+                keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> Dict[str, Any]:
+    """Record a (possibly lazy) step iterator to `path` without materialising it."""
+    with TraceWriter(path, keyframe_interval) as writer:
+        for step in steps:
+            writer.append(step)
+        return writer.close(meta)
+
+
+class TraceReader:
+    """Random access to a trace file through mmap; nothing is read until a step is asked for."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER.size:
+                raise TraceFormatError("File is too small to be a trace")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        try:
+            self._parse_header(size)
+        except Exception:
+            self.close()
+            raise
+
+    def _parse_header(self, size: int) -> None:
+        (magic, version, _, self.keyframe_interval, self.steps, meta_offset, meta_length,
+         self._stream_offset, stream_length, self._index_offset) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise TraceFormatError("Not a trace file (bad magic)")
+        if version != VERSION:
+            raise TraceFormatError(f"Unsupported trace version {version}")
+        index_end = self._index_offset + (self.steps + 1) * INDEX_ENTRY.size
+        if (self.keyframe_interval < 1 or self._stream_offset + stream_length != self._index_offset
+                or index_end != meta_offset or meta_offset + meta_length != size):
+            raise TraceFormatError("Corrupt trace: section offsets do not match the file size")
+        if self._offset(self.steps) != stream_length:
+            raise TraceFormatError("Corrupt trace: index does not cover the stream")
+        try:
+            self.meta = json.loads(bytes(self._mm[meta_offset:meta_offset + meta_length]))
+        except ValueError:
+            raise TraceFormatError("Corrupt trace: meta is not JSON")
+        self.fields: List[str] = self.meta.get("fields", [])
+        self.size = size
+
+    def _offset(self, i: int) -> int:
+        return INDEX_ENTRY.unpack_from(self._mm, self._index_offset + i * INDEX_ENTRY.size)[0]
+
+    def record_range(self, start: int, stop: int) -> Tuple[int, int]:
+        """File byte range [begin, end) holding the records of steps start..stop-1."""
+        return self._stream_offset + self._offset(start), self._stream_offset + self._offset(stop)
+
+    def read_bytes(self, begin: int, end: int) -> bytes:
+        return self._mm[begin:end]
+
+    def _apply(self, state: Dict[str, Any], i: int) -> None:
+        mm = self._mm
+        pos, end = self.record_range(i, i + 1)
+        if mm[pos] == RECORD_KEYFRAME:
+            state.clear()
+        pos += 1
+        while pos < end:
+            op = mm[pos]
+            pos += 1
+            if op == OP_END:
+                return
+            field, pos = _read_varint(mm, pos)
+            name = self.fields[field]
+            if op == OP_SET:
+                length, pos = _read_varint(mm, pos)
+                state[name] = json.loads(mm[pos:pos + length])
+                pos += length
+            elif op == OP_DEL:
+                state.pop(name, None)
+            elif op == OP_PATCH:
+                count, pos = _read_varint(mm, pos)
+                values = state[name] = list(state[name])
+                for _ in range(count):
+                    index, pos = _read_varint(mm, pos)
+                    value, pos = _read_varint(mm, pos)
+                    values[index] = _unzigzag(value)
+            elif op == OP_PATCH2:
+                count, pos = _read_varint(mm, pos)
+                table = state[name] = [list(row) for row in state[name]]
+                for _ in range(count):
+                    row, pos = _read_varint(mm, pos)
+                    col, pos = _read_varint(mm, pos)
+                    value, pos = _read_varint(mm, pos)
+                    table[row][col] = _unzigzag(value)
+            else:
+                raise TraceFormatError(f"Corrupt trace: unknown op {op} in step {i}")
+        raise TraceFormatError(f"Corrupt trace: step {i} has no end marker")
+
+    def iter_steps(self, start: int = 0, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Decode steps start..start+count-1, replaying from the keyframe at or before `start`."""
+        if start < 0 or start > self.steps:
+            raise IndexError(f"Step {start} is out of range (0-{self.steps})")
+        stop = self.steps if count is None else min(self.steps, start + max(0, count))
+        state: Dict[str, Any] = {}
+        for i in range(start - start % self.keyframe_interval, stop):
+            self._apply(state, i)
+            if i >= start:
+                yield dict(state)
+
+    def step(self, i: int) -> Dict[str, Any]:
+        if not 0 <= i < self.steps:
+            raise IndexError(f"Step {i} is out of range (0-{self.steps - 1})")
+        return next(self.iter_steps(i, 1))
+
+    def validate(self) -> None:
+        """Decode every record once; raises TraceFormatError on a malformed stream."""
+        try:
+            for _ in self.iter_steps():
+                pass
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            if isinstance(e, TraceFormatError):
+                raise
+            raise TraceFormatError(f"Corrupt trace: {e}")
+
+    def describe(self) -> Dict[str, Any]:
+        return {"steps": self.steps, "bytes": self.size, "keyframe_interval": self.keyframe_interval,
+                **{k: v for k, v in self.meta.items() if k != "fields"}, "fields": self.fields}
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -28,25 +28,37 @@ struct GraphStep {
     std::vector<std::pair<int, int>> currentEdges;
     std::unordered_map<int, double> distances;
     std::unordered_map<int, int> parents;
+    // All-pairs distances, set on the final Floyd-Warshall step of small graphs only
+    std::vector<std::vector<double>> matrix;
     std::string operation;
 
-    GraphStep(const std::string& operation);
+    GraphStep(const std::string& operation = "");
 };
 
-struct SortingStep {
-    std::vector<int> array;
-    std::vector<int> highlighted;
-    std::vector<int> comparing;
-    std::string operation;
-    int operations_count;
-    std::string time_complexity;
-    std::string space_complexity;
-
-    SortingStep(const std::vector<int>& array,
-                const std::vector<int>& highlighted,
-                const std::vector<int>& comparing,
-                const std::string& operation,
-                int operations_count,
-                const std::string& time_complexity,
-                const std::string& space_complexity);
+class Graph {
+public:
+    void addNode(const GraphNode& node);
+    void addEdge(const GraphEdge& edge);
+    void buildAdjacencyList();
+
+    std::vector<GraphStep> bfs(int start);
+    std::vector<GraphStep> dfs(int start);
+    std::vector<GraphStep> dijkstra(int start, int end = -1);
+    std::vector<GraphStep> aStar(int start, int end);
+    std::vector<GraphStep> kruskal();
+    std::vector<GraphStep> prim();
+
+    // Negative weights, all-pairs distances and directed analysis
+    std::vector<GraphStep> bellmanFord(int start);
+    std::vector<GraphStep> floydWarshall(int start, int end = -1);
+    std::vector<GraphStep> topologicalSort();
+    std::vector<GraphStep> stronglyConnectedComponents();
+
+private:
+    void requireNode(int id, const std::string& label) const;
+
+    std::vector<GraphNode> nodes;
+    std::vector<GraphEdge> edges;
+    std::vector<std::vector<int>> adjList;
+    std::vector<std::vector<std::pair<int, double>>> weightedAdjList;
 };
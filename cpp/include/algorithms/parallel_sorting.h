@@ -0,0 +1,31 @@
+#pragma once
+#include <string>
+#include <vector>
+
+// One task of a parallel sort. Every worker thread records into its own buffer while the
+// sort runs; the buffers are merged by start time once it finishes.
+struct SortEvent {
+    double start_us;        // microseconds since the sort started
+    double end_us;
+    int thread;             // worker index, 0 = the calling thread
+    std::string kind;       // "leaf", "merge" or "partition"
+    int left;               // half-open range [left, right)
+    int right;
+    long long operations;   // comparisons made by this task
+
+    SortEvent(double start_us = 0.0, double end_us = 0.0, int thread = 0, const std::string& kind = "",
+              int left = 0, int right = 0, long long operations = 0);
+};
+
+struct ParallelSortResult {
+    int threads;            // worker threads the sort was allowed to use
+    int threads_used;       // workers that ran at least one task
+    int cutoff;             // ranges at or below this size are sorted sequentially
+    double elapsed_ms;
+    long long operations;
+    std::vector<SortEvent> events;  // merged trace, ordered by start time
+};
+
+// Sort `arr` in place. threads <= 0 uses every hardware thread.
+ParallelSortResult parallelMergeSort(std::vector<long long>& arr, int threads = 0, int cutoff = 4096);
+ParallelSortResult parallelQuickSort(std::vector<long long>& arr, int threads = 0, int cutoff = 4096);
@@ -5,13 +5,18 @@
 #include <climits>
 #include <cmath>
 #include <functional>
+#include <limits>
+#include <stdexcept>
+
+// Same limit as FLOYD_MATRIX_MAX_NODES in the Python graph service
+static const int FLOYD_MATRIX_MAX_NODES = 64;
 
 // Constructor implementations
-GraphNode::GraphNode(int id, const std::string& label, double x, double y)
-    : id(id), label(label), x(x), y(y) {}
+GraphNode::GraphNode(int id, const std::string& label, double x, double y, const std::string& color)
+    : id(id), label(label), x(x), y(y), color(color) {}
 
-GraphEdge::GraphEdge(int from, int to, double weight, bool directed)
-    : from(from), to(to), weight(weight), directed(directed) {}
+GraphEdge::GraphEdge(int from, int to, double weight, bool directed, const std::string& color)
+    : from(from), to(to), weight(weight), directed(directed), color(color) {}
 
 GraphStep::GraphStep(const std::string& operation)
     : operation(operation) {}
@@ -48,6 +53,7 @@ std::vector<GraphStep> Graph::bfs(int start) {
     std::vector<GraphStep> steps;
     std::vector<bool> visited(nodes.size(), false);
     std::queue<int> queue;
+    std::vector<int> visitOrder;
     
     GraphStep initialStep("Starting BFS from node " + std::to_string(start));
     steps.push_back(initialStep);
@@ -63,12 +69,10 @@ std::vector<GraphStep> Graph::bfs(int start) {
         int current = queue.front();
         queue.pop();
         
+        // Nodes visited so far, most recent first (copying every earlier step's list grew exponentially)
+        visitOrder.push_back(current);
         GraphStep visitStep("Visiting node " + std::to_string(current));
-        visitStep.visitedNodes.push_back(current);
-        for (const auto& step : steps) {
-            visitStep.visitedNodes.insert(visitStep.visitedNodes.end(), 
-                                        step.visitedNodes.begin(), step.visitedNodes.end());
-        }
+        visitStep.visitedNodes.assign(visitOrder.rbegin(), visitOrder.rend());
         steps.push_back(visitStep);
         
         for (int neighbor : adjList[current]) {
@@ -94,6 +98,7 @@ std::vector<GraphStep> Graph::dfs(int start) {
     std::vector<GraphStep> steps;
     std::vector<bool> visited(nodes.size(), false);
     std::stack<int> stack;
+    std::vector<int> visitOrder;
     
     GraphStep initialStep("Starting DFS from node " + std::to_string(start));
     steps.push_back(initialStep);
@@ -107,12 +112,10 @@ std::vector<GraphStep> Graph::dfs(int start) {
         if (!visited[current]) {
             visited[current] = true;
             
+            // Nodes visited so far, most recent first, as in bfs
+            visitOrder.push_back(current);
             GraphStep visitStep("Visiting node " + std::to_string(current));
-            visitStep.visitedNodes.push_back(current);
-            for (const auto& step : steps) {
-                visitStep.visitedNodes.insert(visitStep.visitedNodes.end(), 
-                                            step.visitedNodes.begin(), step.visitedNodes.end());
-            }
+            visitStep.visitedNodes.assign(visitOrder.rbegin(), visitOrder.rend());
             steps.push_back(visitStep);
             
             for (int neighbor : adjList[current]) {
@@ -376,3 +379,370 @@ std::vector<GraphStep> Graph::prim() {
     steps.push_back(finalStep);
     return steps;
 }
+
+void Graph::requireNode(int id, const std::string& label) const {
+    // Node ids index the adjacency lists directly, so an unchecked id writes past the vectors
+    if (id < 0 || id >= static_cast<int>(weightedAdjList.size())) {
+        throw std::out_of_range(label + " node " + std::to_string(id) + " is out of range [0, " +
+                                std::to_string(weightedAdjList.size()) + ")");
+    }
+}
+
+static void fillDistances(GraphStep& step, const std::vector<double>& dist) {
+    for (int i = 0; i < static_cast<int>(dist.size()); i++) {
+        if (dist[i] != std::numeric_limits<double>::infinity()) {
+            step.distances[i] = dist[i];
+        }
+    }
+}
+
+static void fillParents(GraphStep& step, const std::vector<int>& parent) {
+    for (int i = 0; i < static_cast<int>(parent.size()); i++) {
+        if (parent[i] != -1) {
+            step.parents[i] = parent[i];
+        }
+    }
+}
+
+std::vector<GraphStep> Graph::bellmanFord(int start) {
+    std::vector<GraphStep> steps;
+    const int n = static_cast<int>(weightedAdjList.size());
+    const double inf = std::numeric_limits<double>::infinity();
+    std::vector<double> dist(n, inf);
+    std::vector<int> parent(n, -1);
+    requireNode(start, "start");
+    dist[start] = 0;
+
+    GraphStep initialStep("Starting Bellman-Ford from node " + std::to_string(start));
+    initialStep.currentNodes.push_back(start);
+    fillDistances(initialStep, dist);
+    steps.push_back(initialStep);
+
+    // At most V-1 rounds; stop as soon as a full round relaxes nothing
+    bool converged = false;
+    for (int round = 1; round < std::max(n, 2); round++) {
+        int relaxed = 0;
+        for (int u = 0; u < n; u++) {
+            if (dist[u] == inf) continue;
+            for (const auto& edge : weightedAdjList[u]) {
+                int v = edge.first;
+                if (dist[u] + edge.second < dist[v]) {
+                    dist[v] = dist[u] + edge.second;
+                    parent[v] = u;
+                    relaxed++;
+
+                    GraphStep relaxStep("Round " + std::to_string(round) + ": relaxed edge " +
+                                        std::to_string(u) + " -> " + std::to_string(v));
+                    relaxStep.currentNodes.push_back(v);
+                    relaxStep.currentEdges.emplace_back(u, v);
+                    fillDistances(relaxStep, dist);
+                    fillParents(relaxStep, parent);
+                    steps.push_back(relaxStep);
+                }
+            }
+        }
+        if (relaxed == 0) {
+            converged = true;
+            GraphStep earlyStep("Round " + std::to_string(round) + ": no distance changed, stopping early");
+            fillDistances(earlyStep, dist);
+            fillParents(earlyStep, parent);
+            steps.push_back(earlyStep);
+            break;
+        }
+    }
+
+    if (!converged) {
+        for (int u = 0; u < n; u++) {
+            if (dist[u] == inf) continue;
+            for (const auto& edge : weightedAdjList[u]) {
+                int v = edge.first;
+                if (dist[u] + edge.second < dist[v]) {
+                    parent[v] = u;
+                    // Walking V parent links from a still-relaxable node lands on the cycle
+                    int node = v;
+                    for (int i = 0; i < n; i++) node = parent[node];
+                    GraphStep cycleStep("Negative cycle detected");
+                    int current = node;
+                    do {
+                        cycleStep.currentNodes.push_back(current);
+                        cycleStep.currentEdges.emplace_back(parent[current], current);
+                        current = parent[current];
+                    } while (current != node);
+                    fillDistances(cycleStep, dist);
+                    fillParents(cycleStep, parent);
+                    steps.push_back(cycleStep);
+                    return steps;
+                }
+            }
+        }
+    }
+
+    GraphStep finalStep("Bellman-Ford Complete");
+    for (int v = 0; v < n; v++) {
+        if (dist[v] != inf) finalStep.visitedNodes.push_back(v);
+        if (parent[v] != -1) finalStep.visitedEdges.emplace_back(parent[v], v);
+    }
+    fillDistances(finalStep, dist);
+    fillParents(finalStep, parent);
+    steps.push_back(finalStep);
+    return steps;
+}
+
+std::vector<GraphStep> Graph::floydWarshall(int start, int end) {
+    std::vector<GraphStep> steps;
+    const int n = static_cast<int>(weightedAdjList.size());
+    requireNode(start, "start");
+    if (end != -1) requireNode(end, "end");
+    const double inf = std::numeric_limits<double>::infinity();
+    // Row-major n*n matrices; the k loop is outermost so rows k and i stay hot in cache
+    std::vector<double> dist(static_cast<size_t>(n) * n, inf);
+    std::vector<int> pred(static_cast<size_t>(n) * n, -1);
+    for (int u = 0; u < n; u++) {
+        dist[static_cast<size_t>(u) * n + u] = 0;
+        for (const auto& edge : weightedAdjList[u]) {
+            size_t idx = static_cast<size_t>(u) * n + edge.first;
+            if (edge.second < dist[idx]) {
+                dist[idx] = edge.second;
+                pred[idx] = u;
+            }
+        }
+    }
+
+    auto snapshot = [&](GraphStep& step) {
+        for (int j = 0; j < n; j++) {
+            size_t idx = static_cast<size_t>(start) * n + j;
+            if (dist[idx] != inf) step.distances[j] = dist[idx];
+            if (pred[idx] != -1 && j != start) step.parents[j] = pred[idx];
+        }
+    };
+
+    GraphStep initialStep("Initialized " + std::to_string(n) + "x" + std::to_string(n) +
+                          " distance matrix (showing distances from node " + std::to_string(start) + ")");
+    initialStep.currentNodes.push_back(start);
+    snapshot(initialStep);
+    steps.push_back(initialStep);
+
+    for (int k = 0; k < n; k++) {
+        int improved = 0;
+        const double* rowK = &dist[static_cast<size_t>(k) * n];
+        const int* predK = &pred[static_cast<size_t>(k) * n];
+        for (int i = 0; i < n; i++) {
+            double dik = dist[static_cast<size_t>(i) * n + k];
+            if (dik == inf) continue;
+            double* rowI = &dist[static_cast<size_t>(i) * n];
+            int* predI = &pred[static_cast<size_t>(i) * n];
+            for (int j = 0; j < n; j++) {
+                double candidate = dik + rowK[j];
+                if (candidate < rowI[j]) {
+                    rowI[j] = candidate;
+                    predI[j] = predK[j];
+                    improved++;
+                }
+            }
+        }
+        GraphStep kStep("Intermediate node " + std::to_string(k) + ": " + std::to_string(improved) + " pair(s) improved");
+        kStep.currentNodes.push_back(k);
+        snapshot(kStep);
+        steps.push_back(kStep);
+    }
+
+    GraphStep finalStep("Floyd-Warshall Complete");
+    for (int i = 0; i < n; i++) {
+        if (dist[static_cast<size_t>(i) * n + i] < 0) {
+            finalStep.currentNodes.push_back(i);
+        }
+    }
+    if (!finalStep.currentNodes.empty()) {
+        finalStep.operation = "Negative cycle detected";
+    } else {
+        for (int j = 0; j < n; j++) {
+            if (dist[static_cast<size_t>(start) * n + j] != inf) finalStep.visitedNodes.push_back(j);
+        }
+        // Shortest path to `end`, walked back through the predecessor row of `start`
+        if (end != -1 && dist[static_cast<size_t>(start) * n + end] != inf) {
+            for (int j = end; j != start; j = pred[static_cast<size_t>(start) * n + j]) {
+                finalStep.visitedEdges.emplace_back(pred[static_cast<size_t>(start) * n + j], j);
+            }
+            std::reverse(finalStep.visitedEdges.begin(), finalStep.visitedEdges.end());
+        }
+        if (n <= FLOYD_MATRIX_MAX_NODES) {
+            finalStep.matrix.assign(n, std::vector<double>(n));
+            for (int i = 0; i < n; i++) {
+                std::copy_n(&dist[static_cast<size_t>(i) * n], n, finalStep.matrix[i].begin());
+            }
+        }
+    }
+    snapshot(finalStep);
+    steps.push_back(finalStep);
+    return steps;
+}
+
+std::vector<GraphStep> Graph::topologicalSort() {
+    // Undirected edges sit in both adjacency lists, which in-degree counting reads as 2-cycles
+    for (const auto& edge : edges) {
+        if (!edge.directed) {
+            throw std::invalid_argument("Topological sort needs directed edges; edge " + std::to_string(edge.from) +
+                                        "-" + std::to_string(edge.to) + " is undirected");
+        }
+    }
+
+    std::vector<GraphStep> steps;
+    const int n = static_cast<int>(adjList.size());
+    std::vector<int> inDegree(n, 0);
+    for (int u = 0; u < n; u++) {
+        for (int v : adjList[u]) inDegree[v]++;
+    }
+
+    // In-degrees ride in `distances` so each node is labelled with its remaining prerequisites
+    auto labelDegrees = [&](GraphStep& step) {
+        for (int i = 0; i < n; i++) step.distances[i] = inDegree[i];
+    };
+
+    std::queue<int> queue;
+    GraphStep initialStep("Computed in-degrees");
+    for (int u = 0; u < n; u++) {
+        if (inDegree[u] == 0) {
+            queue.push(u);
+            initialStep.currentNodes.push_back(u);
+        }
+    }
+    labelDegrees(initialStep);
+    steps.push_back(initialStep);
+
+    std::vector<int> order;
+    while (!queue.empty()) {
+        int u = queue.front();
+        queue.pop();
+        order.push_back(u);
+
+        GraphStep outputStep("Output node " + std::to_string(u) + " (position " + std::to_string(order.size()) + ")");
+        outputStep.visitedNodes = order;
+        outputStep.currentNodes.push_back(u);
+        labelDegrees(outputStep);
+        steps.push_back(outputStep);
+
+        for (int v : adjList[u]) {
+            if (--inDegree[v] == 0) queue.push(v);
+            GraphStep edgeStep("Removed edge " + std::to_string(u) + " -> " + std::to_string(v) +
+                               "; in-degree of " + std::to_string(v) + " is now " + std::to_string(inDegree[v]));
+            edgeStep.visitedNodes = order;
+            edgeStep.currentNodes.push_back(v);
+            edgeStep.currentEdges.emplace_back(u, v);
+            labelDegrees(edgeStep);
+            steps.push_back(edgeStep);
+        }
+    }
+
+    if (static_cast<int>(order.size()) < n) {
+        GraphStep cycleStep("Cycle detected: no topological order exists");
+        cycleStep.visitedNodes = order;
+        for (int u = 0; u < n; u++) {
+            if (inDegree[u] > 0) cycleStep.currentNodes.push_back(u);
+        }
+        labelDegrees(cycleStep);
+        steps.push_back(cycleStep);
+        return steps;
+    }
+
+    GraphStep finalStep("Topological order found");
+    finalStep.visitedNodes = order;
+    for (size_t i = 1; i < order.size(); i++) {
+        finalStep.visitedEdges.emplace_back(order[i - 1], order[i]);
+    }
+    labelDegrees(finalStep);
+    steps.push_back(finalStep);
+    return steps;
+}
+
+std::vector<GraphStep> Graph::stronglyConnectedComponents() {
+    std::vector<GraphStep> steps;
+    const int n = static_cast<int>(adjList.size());
+    std::vector<int> index(n, -1), low(n, 0), component(n, -1);
+    std::vector<bool> onStack(n, false);
+    std::vector<int> stack;
+    // Explicit work stack of (node, next neighbour position) instead of recursion
+    std::vector<std::pair<int, size_t>> work;
+    int counter = 0;
+    int components = 0;
+
+    auto snapshot = [&](GraphStep& step) {
+        for (int i = 0; i < n; i++) {
+            if (index[i] != -1) step.distances[i] = low[i];
+            if (component[i] != -1) {
+                step.visitedNodes.push_back(i);
+                step.parents[i] = component[i];
+            }
+        }
+    };
+
+    steps.emplace_back("Starting Tarjan's strongly connected components");
+
+    for (int root = 0; root < n; root++) {
+        if (index[root] != -1) continue;
+        index[root] = low[root] = counter++;
+        stack.push_back(root);
+        onStack[root] = true;
+        work.emplace_back(root, 0);
+
+        GraphStep discoverStep("Discovered node " + std::to_string(root));
+        discoverStep.currentNodes.push_back(root);
+        snapshot(discoverStep);
+        steps.push_back(discoverStep);
+
+        while (!work.empty()) {
+            int u = work.back().first;
+            size_t& next = work.back().second;
+            if (next < adjList[u].size()) {
+                int v = adjList[u][next++];
+                if (index[v] == -1) {
+                    index[v] = low[v] = counter++;
+                    stack.push_back(v);
+                    onStack[v] = true;
+                    work.emplace_back(v, 0);
+
+                    GraphStep treeStep("Tree edge " + std::to_string(u) + " -> " + std::to_string(v));
+                    treeStep.currentNodes.push_back(v);
+                    treeStep.currentEdges.emplace_back(u, v);
+                    snapshot(treeStep);
+                    steps.push_back(treeStep);
+                } else if (onStack[v] && index[v] < low[u]) {
+                    low[u] = index[v];
+
+                    GraphStep backStep("Back edge " + std::to_string(u) + " -> " + std::to_string(v));
+                    backStep.currentNodes.push_back(u);
+                    backStep.currentEdges.emplace_back(u, v);
+                    snapshot(backStep);
+                    steps.push_back(backStep);
+                }
+                continue;
+            }
+
+            work.pop_back();
+            if (!work.empty()) {
+                int caller = work.back().first;
+                low[caller] = std::min(low[caller], low[u]);
+            }
+            if (low[u] == index[u]) {
+                GraphStep componentStep("Component " + std::to_string(components + 1) +
+                                        " rooted at " + std::to_string(u));
+                int w;
+                do {
+                    w = stack.back();
+                    stack.pop_back();
+                    onStack[w] = false;
+                    component[w] = components;
+                    componentStep.currentNodes.push_back(w);
+                } while (w != u);
+                components++;
+                snapshot(componentStep);
+                steps.push_back(componentStep);
+            }
+        }
+    }
+
+    // Final step: `parents` maps every node to its component number
+    GraphStep finalStep("Found " + std::to_string(components) + " strongly connected component(s)");
+    snapshot(finalStep);
+    steps.push_back(finalStep);
+    return steps;
+}
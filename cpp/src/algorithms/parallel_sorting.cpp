@@ -0,0 +1,257 @@
+#include "algorithms/parallel_sorting.h"
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cmath>
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <thread>
+
+SortEvent::SortEvent(double start_us, double end_us, int thread, const std::string& kind,
+                     int left, int right, long long operations)
+    : start_us(start_us), end_us(end_us), thread(thread), kind(kind),
+      left(left), right(right), operations(operations) {}
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+const int MAX_THREADS = 256;
+const int MIN_CUTOFF = 16;
+
+// Fixed set of workers sharing one task queue. A thread waiting on a forked task runs
+// queued tasks in the meantime, so nested fork/join can never starve the pool.
+class TaskPool {
+public:
+    using Task = std::function<void(int)>;
+
+    explicit TaskPool(int threads) {
+        for (int id = 1; id < threads; id++) {
+            workers_.emplace_back([this, id] { loop(id); });
+        }
+    }
+
+    ~TaskPool() {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stop_ = true;
+        }
+        ready_.notify_all();
+        for (auto& worker : workers_) {
+            worker.join();
+        }
+    }
+
+    void submit(Task task) {
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            queue_.push_back(std::move(task));
+        }
+        ready_.notify_one();
+    }
+
+    // Run the newest queued task on the calling thread; false if there is none
+    bool runOne(int worker) {
+        Task task;
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            if (queue_.empty()) {
+                return false;
+            }
+            task = std::move(queue_.back());
+            queue_.pop_back();
+        }
+        task(worker);
+        return true;
+    }
+
+private:
+    void loop(int id) {
+        for (;;) {
+            Task task;
+            {
+                std::unique_lock<std::mutex> lock(mutex_);
+                ready_.wait(lock, [this] { return stop_ || !queue_.empty(); });
+                if (queue_.empty()) {
+                    return;
+                }
+                // Idle workers take the oldest, i.e. largest, task
+                task = std::move(queue_.front());
+                queue_.pop_front();
+            }
+            task(id);
+        }
+    }
+
+    std::vector<std::thread> workers_;
+    std::deque<Task> queue_;
+    std::mutex mutex_;
+    std::condition_variable ready_;
+    bool stop_ = false;
+};
+
+struct SortContext {
+    std::vector<long long>& arr;
+    std::vector<long long> scratch;
+    int cutoff;
+    int forkDepth;      // forks below this depth run inline instead of becoming tasks
+    int depthLimit;     // quicksort recursion deeper than this falls back to std::sort
+    Clock::time_point began;
+    // One buffer per worker, written only by its owner, so recording needs no locking
+    std::vector<std::vector<SortEvent>> buffers;
+    // Declared last: destroyed (and joined) before the buffers it writes into
+    TaskPool pool;
+
+    SortContext(std::vector<long long>& arr, int threads, int cutoff, bool needsScratch)
+        : arr(arr),
+          scratch(needsScratch ? arr.size() : 0),
+          cutoff(cutoff),
+          // About eight tasks per thread keeps workers busy when subranges finish unevenly
+          forkDepth(threads > 1 ? static_cast<int>(std::ceil(std::log2(threads))) + 3 : 0),
+          depthLimit(2 * static_cast<int>(std::log2(static_cast<double>(arr.size()) + 1)) + 2),
+          began(Clock::now()),
+          buffers(threads),
+          pool(threads) {}
+
+    double now() const {
+        return std::chrono::duration<double, std::micro>(Clock::now() - began).count();
+    }
+
+    void record(int worker, double start, const char* kind, int left, int right, long long operations) {
+        buffers[worker].emplace_back(start, now(), worker, kind, left, right, operations);
+    }
+
+    // Queue `first` as a task, run `second` here, then help with queued work until `first` is done
+    template <class First, class Second>
+    void fork(int worker, int depth, First first, Second second) {
+        if (depth >= forkDepth) {
+            first(worker);
+            second(worker);
+            return;
+        }
+        std::atomic<bool> done{false};
+        pool.submit([&first, &done](int w) {
+            first(w);
+            done.store(true, std::memory_order_release);
+        });
+        second(worker);
+        while (!done.load(std::memory_order_acquire)) {
+            if (!pool.runOne(worker)) {
+                std::this_thread::yield();
+            }
+        }
+    }
+
+    void sortLeaf(int worker, int left, int right) {
+        double start = now();
+        long long operations = 0;
+        std::sort(arr.begin() + left, arr.begin() + right, [&operations](long long a, long long b) {
+            operations++;
+            return a < b;
+        });
+        record(worker, start, "leaf", left, right, operations);
+    }
+};
+
+void mergeSortRange(SortContext& ctx, int worker, int depth, int left, int right) {
+    if (right - left <= ctx.cutoff) {
+        ctx.sortLeaf(worker, left, right);
+        return;
+    }
+    int mid = left + (right - left) / 2;
+    ctx.fork(worker, depth,
+             [&ctx, depth, left, mid](int w) { mergeSortRange(ctx, w, depth + 1, left, mid); },
+             [&ctx, depth, mid, right](int w) { mergeSortRange(ctx, w, depth + 1, mid, right); });
+
+    double start = ctx.now();
+    long long operations = 1;
+    // Already-ordered halves (common on sorted input) need no merge
+    if (ctx.arr[mid - 1] > ctx.arr[mid]) {
+        auto first = ctx.arr.begin();
+        std::merge(first + left, first + mid, first + mid, first + right, ctx.scratch.begin() + left,
+                   [&operations](long long a, long long b) {
+                       operations++;
+                       return a < b;
+                   });
+        std::copy(ctx.scratch.begin() + left, ctx.scratch.begin() + right, first + left);
+    }
+    ctx.record(worker, start, "merge", left, right, operations);
+}
+
+void quickSortRange(SortContext& ctx, int worker, int depth, int left, int right) {
+    if (right - left <= ctx.cutoff || depth >= ctx.depthLimit) {
+        ctx.sortLeaf(worker, left, right);
+        return;
+    }
+    double start = ctx.now();
+    std::vector<long long>& arr = ctx.arr;
+    long long a = arr[left], b = arr[left + (right - left) / 2], c = arr[right - 1];
+    long long pivot = std::max(std::min(a, b), std::min(std::max(a, b), c));
+
+    // Three-way partition: [left, lt) < pivot, [lt, gt) == pivot, [gt, right) > pivot
+    int lt = left, i = left, gt = right;
+    long long operations = 0;
+    while (i < gt) {
+        operations++;
+        if (arr[i] < pivot) {
+            std::swap(arr[lt++], arr[i++]);
+        } else if (arr[i] > pivot) {
+            std::swap(arr[i], arr[--gt]);
+        } else {
+            i++;
+        }
+    }
+    ctx.record(worker, start, "partition", left, right, operations);
+
+    ctx.fork(worker, depth,
+             [&ctx, depth, left, lt](int w) { quickSortRange(ctx, w, depth + 1, left, lt); },
+             [&ctx, depth, gt, right](int w) { quickSortRange(ctx, w, depth + 1, gt, right); });
+}
+
+int resolveThreads(int threads) {
+    if (threads <= 0) {
+        threads = static_cast<int>(std::thread::hardware_concurrency());
+    }
+    return std::max(1, std::min(threads, MAX_THREADS));
+}
+
+ParallelSortResult runParallelSort(std::vector<long long>& arr, int threads, int cutoff, bool needsScratch,
+                                   void (*sortRange)(SortContext&, int, int, int, int)) {
+    ParallelSortResult result;
+    result.threads = resolveThreads(threads);
+    result.cutoff = std::max(cutoff, MIN_CUTOFF);
+    result.operations = 0;
+
+    std::vector<std::vector<SortEvent>> buffers;
+    {
+        SortContext ctx(arr, result.threads, result.cutoff, needsScratch);
+        if (!arr.empty()) {
+            sortRange(ctx, 0, 0, 0, static_cast<int>(arr.size()));
+        }
+        result.elapsed_ms = ctx.now() / 1000.0;
+        buffers = std::move(ctx.buffers);
+    }
+
+    result.threads_used = 0;
+    for (auto& buffer : buffers) {
+        result.threads_used += buffer.empty() ? 0 : 1;
+        for (auto& event : buffer) {
+            result.operations += event.operations;
+            result.events.push_back(std::move(event));
+        }
+    }
+    std::stable_sort(result.events.begin(), result.events.end(),
+                     [](const SortEvent& x, const SortEvent& y) { return x.start_us < y.start_us; });
+    return result;
+}
+
+}  // namespace
+
+ParallelSortResult parallelMergeSort(std::vector<long long>& arr, int threads, int cutoff) {
+    return runParallelSort(arr, threads, cutoff, true, mergeSortRange);
+}
+
+ParallelSortResult parallelQuickSort(std::vector<long long>& arr, int threads, int cutoff) {
+    return runParallelSort(arr, threads, cutoff, false, quickSortRange);
+}
@@ -1,17 +1,34 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/operators.h>
+#include <pybind11/numpy.h>
 #include "algorithms/graph.h"
 #include "algorithms/sorting.h"
+#include "algorithms/parallel_sorting.h"
 
 namespace py = pybind11;
 
+using Int64Array = py::array_t<long long, py::array::c_style | py::array::forcecast>;
+
+// Copy the input, sort it with the GIL released, and hand back (sorted array, run stats)
+static py::tuple runParallel(ParallelSortResult (*sort)(std::vector<long long>&, int, int),
+                             Int64Array input, int threads, int cutoff) {
+    std::vector<long long> data(input.data(), input.data() + input.size());
+    ParallelSortResult result;
+    {
+        py::gil_scoped_release release;
+        result = sort(data, threads, cutoff);
+    }
+    Int64Array output(static_cast<py::ssize_t>(data.size()));
+    std::copy(data.begin(), data.end(), output.mutable_data());
+    return py::make_tuple(output, result);
+}
+
 PYBIND11_MODULE(algorithm_engine, m) {
     m.doc() = "Algorithm Visualizer C++ Engine";
     
     // GraphNode binding
     py::class_<GraphNode>(m, "GraphNode")
-        .def(py::init<>())
         .def(py::init<int>())
         .def(py::init<int, const std::string&>())
         .def(py::init<int, const std::string&, double>())
@@ -23,7 +40,6 @@ PYBIND11_MODULE(algorithm_engine, m) {
     
     // GraphEdge binding
     py::class_<GraphEdge>(m, "GraphEdge")
-        .def(py::init<>())
         .def(py::init<int, int>())
         .def(py::init<int, int, double>())
         .def(py::init<int, int, double, bool>())
@@ -42,6 +58,7 @@ PYBIND11_MODULE(algorithm_engine, m) {
         .def_readwrite("currentEdges", &GraphStep::currentEdges)
         .def_readwrite("distances", &GraphStep::distances)
         .def_readwrite("parents", &GraphStep::parents)
+        .def_readwrite("matrix", &GraphStep::matrix)
         .def_readwrite("operation", &GraphStep::operation);
     
     // SortingStep binding
@@ -66,6 +83,24 @@ PYBIND11_MODULE(algorithm_engine, m) {
         .def_readwrite("time_complexity", &SortingStep::time_complexity)
         .def_readwrite("space_complexity", &SortingStep::space_complexity);
     
+    // Parallel sorting bindings
+    py::class_<SortEvent>(m, "SortEvent")
+        .def_readonly("start_us", &SortEvent::start_us)
+        .def_readonly("end_us", &SortEvent::end_us)
+        .def_readonly("thread", &SortEvent::thread)
+        .def_readonly("kind", &SortEvent::kind)
+        .def_readonly("left", &SortEvent::left)
+        .def_readonly("right", &SortEvent::right)
+        .def_readonly("operations", &SortEvent::operations);
+
+    py::class_<ParallelSortResult>(m, "ParallelSortResult")
+        .def_readonly("threads", &ParallelSortResult::threads)
+        .def_readonly("threads_used", &ParallelSortResult::threads_used)
+        .def_readonly("cutoff", &ParallelSortResult::cutoff)
+        .def_readonly("elapsed_ms", &ParallelSortResult::elapsed_ms)
+        .def_readonly("operations", &ParallelSortResult::operations)
+        .def_readonly("events", &ParallelSortResult::events);
+
     // Graph binding
     py::class_<Graph>(m, "Graph")
         .def(py::init<>())
@@ -77,7 +112,11 @@ PYBIND11_MODULE(algorithm_engine, m) {
         .def("dijkstra", &Graph::dijkstra, py::arg("start"), py::arg("end") = -1)
         .def("astar", &Graph::aStar)
         .def("kruskal", &Graph::kruskal)
-        .def("prim", &Graph::prim);
+        .def("prim", &Graph::prim)
+        .def("bellman_ford", &Graph::bellmanFord, py::arg("start"))
+        .def("floyd_warshall", &Graph::floydWarshall, py::arg("start") = 0, py::arg("end") = -1)
+        .def("topological_sort", &Graph::topologicalSort)
+        .def("scc", &Graph::stronglyConnectedComponents);
     
     // Sorting algorithm functions
     m.def("bubble_sort", &bubbleSort, "Bubble Sort Algorithm");
@@ -85,6 +124,14 @@ PYBIND11_MODULE(algorithm_engine, m) {
     m.def("quick_sort", &quickSort, "Quick Sort Algorithm");
     m.def("heap_sort", &heapSort, "Heap Sort Algorithm");
     m.def("counting_sort", &countingSort, "Counting Sort Algorithm");
+
+    // Task-parallel sorts over int64 arrays; return (sorted array, ParallelSortResult)
+    m.def("parallel_merge_sort", [](Int64Array input, int threads, int cutoff) {
+        return runParallel(parallelMergeSort, input, threads, cutoff);
+    }, "Parallel Merge Sort", py::arg("array"), py::arg("threads") = 0, py::arg("cutoff") = 4096);
+    m.def("parallel_quick_sort", [](Int64Array input, int threads, int cutoff) {
+        return runParallel(parallelQuickSort, input, threads, cutoff);
+    }, "Parallel Quick Sort", py::arg("array"), py::arg("threads") = 0, py::arg("cutoff") = 4096);
     
     // Version info
     m.attr("__version__") = "1.0.0";